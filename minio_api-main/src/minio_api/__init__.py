@@ -6,7 +6,8 @@ __version__ = "2.0.0"
 from .client import (
     MinIOStockDataClient, 
     get_stock_data_from_minio,
-    get_data_from_minio
+    get_data_from_minio,
+    clear_client_cache
 )
 from .uploader import MinIOFileUploader
 from .downloader import (
@@ -16,9 +17,12 @@ from .downloader import (
     get_object_stream_from_minio,
     get_object_info_from_minio
 )
+from .async_downloader import MinIOFileDownloaderAsync
+from .async_uploader import MinIOFileUploaderAsync
 from .utils import (
     test_minio_connection,
     get_cnstock_data,
+    get_cnstock_data_many,
     get_cnstock_adj_factor_data, 
     get_cnstock_basic_data,
     get_cnindex_data,
@@ -46,12 +50,15 @@ __all__ = [
     'MinIOStockDataClient',
     'MinIOFileUploader',
     'MinIOFileDownloader',
+    'MinIOFileDownloaderAsync',
+    'MinIOFileUploaderAsync',
     'MinIOTickDataClient',
     # 数据获取函数
     'get_stock_data_from_minio',  # 兼容性函数
     'get_data_from_minio',        # 新的通用函数
     'get_tick_data_from_minio',
     'get_cnstock_data',
+    'get_cnstock_data_many',
     'get_cnstock_adj_factor_data',
     'get_cnstock_basic_data', 
     'get_cnindex_data',
@@ -68,6 +75,7 @@ __all__ = [
     'list_supported_data_types',
     'get_data_type_info',
     'get_available_data_summary',
+    'clear_client_cache',
     
     # Schema管理
     'schema_manager',
@@ -0,0 +1,177 @@
+"""
+异步MinIO文件下载器 - 基于aioboto3，适合在同一个事件循环中并发下载多个对象
+"""
+import io
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from .config import get_config, MinIOConfig
+
+try:
+    import aioboto3
+    from botocore.exceptions import ClientError
+except ImportError:  # 可选依赖: pip install minio_api[async]
+    aioboto3 = None
+    ClientError = Exception
+
+logger = logging.getLogger(__name__)
+
+
+def _endpoint_url(endpoint: str, secure: bool) -> str:
+    """MinIO端点转换为boto3需要的完整URL（兼容 host:port 与 http(s)://host:port）"""
+    if "://" in endpoint:
+        return endpoint
+    return f"http{'s' if secure else ''}://{endpoint}"
+
+
+class MinIOFileDownloaderAsync:
+    """
+    异步MinIO文件下载器
+
+    接口与 MinIOFileDownloader 保持一致，方法名加 a 前缀。
+    可作为异步上下文管理器使用以复用同一个S3连接：
+
+        async with MinIOFileDownloaderAsync() as dl:
+            data = await dl.adownload_data(bucket, path)
+    """
+
+    def __init__(self, config: Optional[MinIOConfig] = None, **kwargs):
+        """
+        初始化异步MinIO下载器
+
+        Args:
+            config: MinIO配置对象，None则从环境变量读取
+            **kwargs: 可选的配置覆盖参数
+        """
+        if aioboto3 is None:
+            raise ImportError("MinIOFileDownloaderAsync 需要 aioboto3，请安装: pip install minio_api[async]")
+
+        # 获取配置
+        self.config = config or get_config()
+
+        # 应用kwargs覆盖
+        endpoint = kwargs.get('endpoint', self.config.endpoint)
+        secure = kwargs.get('secure', self.config.secure)
+        self._client_kwargs = {
+            'endpoint_url': _endpoint_url(endpoint, secure),
+            'aws_access_key_id': kwargs.get('access_key', self.config.access_key),
+            'aws_secret_access_key': kwargs.get('secret_key', self.config.secret_key),
+            'region_name': kwargs.get('region', self.config.region) or 'us-east-1',
+        }
+        self._session = aioboto3.Session()
+        self._client_cm = None
+        self._s3 = None
+
+        logger.info(f"初始化异步MinIO下载器: {endpoint} (secure={secure})")
+
+    async def __aenter__(self) -> "MinIOFileDownloaderAsync":
+        self._client_cm = self._session.client('s3', **self._client_kwargs)
+        self._s3 = await self._client_cm.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(exc_type, exc, tb)
+        self._client_cm = None
+        self._s3 = None
+
+    @asynccontextmanager
+    async def _client(self):
+        """已进入上下文时复用连接，否则为单次调用临时创建客户端"""
+        if self._s3 is not None:
+            yield self._s3
+        else:
+            async with self._session.client('s3', **self._client_kwargs) as s3:
+                yield s3
+
+    async def adownload_data(self,
+                             bucket_name: str,
+                             object_path: str) -> Optional[bytes]:
+        """
+        从MinIO异步下载文件为二进制数据
+
+        Args:
+            bucket_name: 源桶名称
+            object_path: MinIO中的对象路径
+
+        Returns:
+            bytes: 文件二进制数据，失败返回None
+        """
+        try:
+            async with self._client() as s3:
+                response = await s3.get_object(Bucket=bucket_name, Key=object_path)
+                async with response['Body'] as body:
+                    data = await body.read()
+
+            data_size = len(data) / (1024 * 1024)  # MB
+            logger.info(f"下载成功: {bucket_name}/{object_path}, 大小: {data_size:.2f}MB")
+            return data
+
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code', '') if hasattr(e, 'response') else ''
+            if code == 'NoSuchKey':
+                logger.error(f"对象不存在: {bucket_name}/{object_path}")
+            elif code == 'NoSuchBucket':
+                logger.error(f"桶不存在: {bucket_name}")
+            else:
+                logger.error(f"下载数据失败: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"下载数据时发生错误: {e}")
+            return None
+
+    async def aget_object_stream(self,
+                                 bucket_name: str,
+                                 object_path: str) -> Optional[io.BytesIO]:
+        """
+        异步获取MinIO对象作为内存中的file-like对象
+
+        Args:
+            bucket_name: 源桶名称
+            object_path: MinIO中的对象路径
+
+        Returns:
+            io.BytesIO: file-like对象，失败返回None
+        """
+        data = await self.adownload_data(bucket_name, object_path)
+        if data is None:
+            return None
+        logger.info(f"获取对象流成功: {bucket_name}/{object_path}")
+        return io.BytesIO(data)
+
+    async def alist_objects(self,
+                            bucket_name: str,
+                            prefix: str = "",
+                            recursive: bool = True) -> list:
+        """
+        异步列出桶中的对象
+
+        Args:
+            bucket_name: 桶名称
+            prefix: 对象前缀过滤
+            recursive: 是否递归列出子目录
+
+        Returns:
+            list: 对象列表
+        """
+        params = {'Bucket': bucket_name, 'Prefix': prefix}
+        if not recursive:
+            params['Delimiter'] = '/'
+        try:
+            objects = []
+            async with self._client() as s3:
+                paginator = s3.get_paginator('list_objects_v2')
+                async for page in paginator.paginate(**params):
+                    for obj in page.get('Contents', []):
+                        objects.append({
+                            'object_name': obj['Key'],
+                            'size': obj['Size'],
+                            'size_mb': obj['Size'] / (1024 * 1024),
+                            'last_modified': obj['LastModified'],
+                            'etag': obj['ETag'].strip('"')
+                        })
+            return objects
+        except ClientError as e:
+            logger.error(f"列出对象失败: {e}")
+            return []
@@ -0,0 +1,192 @@
+"""
+异步MinIO文件上传器 - 基于aioboto3，在同一个事件循环中并发上传大量小对象
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .config import get_config, MinIOConfig
+from .async_downloader import _endpoint_url
+
+try:
+    import aioboto3
+    from botocore.exceptions import ClientError
+except ImportError:  # 可选依赖: pip install minio_api[async]
+    aioboto3 = None
+    ClientError = Exception
+
+logger = logging.getLogger(__name__)
+
+
+class MinIOFileUploaderAsync:
+    """
+    异步MinIO文件上传器
+
+    接口与 MinIOFileUploader 保持一致，方法名加 a 前缀；并发请求数由 max_concurrency 限制。
+    可作为异步上下文管理器使用以复用同一个S3连接：
+
+        async with MinIOFileUploaderAsync() as up:
+            results = await up.aupload_many([(bucket, key, path), ...])
+    """
+
+    def __init__(self, config: Optional[MinIOConfig] = None, max_concurrency: int = 32, **kwargs):
+        """
+        初始化异步MinIO上传器
+
+        Args:
+            config: MinIO配置对象，None则从环境变量读取
+            max_concurrency: 同时进行中的上传请求数上限
+            **kwargs: 可选的配置覆盖参数
+        """
+        if aioboto3 is None:
+            raise ImportError("MinIOFileUploaderAsync 需要 aioboto3，请安装: pip install minio_api[async]")
+
+        # 获取配置
+        self.config = config or get_config()
+
+        # 应用kwargs覆盖
+        endpoint = kwargs.get('endpoint', self.config.endpoint)
+        secure = kwargs.get('secure', self.config.secure)
+        self._client_kwargs = {
+            'endpoint_url': _endpoint_url(endpoint, secure),
+            'aws_access_key_id': kwargs.get('access_key', self.config.access_key),
+            'aws_secret_access_key': kwargs.get('secret_key', self.config.secret_key),
+            'region_name': kwargs.get('region', self.config.region) or 'us-east-1',
+        }
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self._session = aioboto3.Session()
+        self._client_cm = None
+        self._s3 = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        logger.info("初始化异步MinIO上传器: %s (secure=%s)", endpoint, secure)
+
+    async def __aenter__(self) -> "MinIOFileUploaderAsync":
+        self._client_cm = self._session.client('s3', **self._client_kwargs)
+        self._s3 = await self._client_cm.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(exc_type, exc, tb)
+        self._client_cm = None
+        self._s3 = None
+
+    @asynccontextmanager
+    async def _client(self):
+        """已进入上下文时复用连接，否则为单次调用临时创建客户端"""
+        if self._s3 is not None:
+            yield self._s3
+        else:
+            async with self._session.client('s3', **self._client_kwargs) as s3:
+                yield s3
+
+    def _limit(self) -> asyncio.Semaphore:
+        # Semaphore 需在事件循环中创建
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aupload_data(self,
+                           bucket_name: str,
+                           object_path: str,
+                           data: Union[bytes, bytearray, memoryview],
+                           content_type: str = "application/octet-stream") -> bool:
+        """
+        异步上传二进制数据到MinIO
+
+        Args:
+            bucket_name: 目标桶名称
+            object_path: MinIO中的对象路径
+            data: 要上传的二进制数据
+            content_type: 数据内容类型
+
+        Returns:
+            bool: 上传是否成功
+        """
+        try:
+            async with self._limit():
+                async with self._client() as s3:
+                    await s3.put_object(
+                        Bucket=bucket_name,
+                        Key=object_path,
+                        Body=bytes(data) if isinstance(data, memoryview) else data,
+                        ContentType=content_type,
+                    )
+            logger.info("上传成功: %s/%s, 大小: %.2fMB", bucket_name, object_path, len(data) / (1024 * 1024))
+            return True
+        except ClientError as e:
+            logger.error("上传数据失败: %s", e)
+            return False
+        except Exception as e:
+            logger.error("上传数据时发生未知错误: %s", e)
+            return False
+
+    async def aupload_file(self,
+                           bucket_name: str,
+                           object_path: str,
+                           file_path: str,
+                           content_type: str = "application/octet-stream") -> bool:
+        """
+        异步上传本地文件到MinIO（大文件由 aioboto3 的托管传输自动分片）
+
+        Args:
+            bucket_name: 目标桶名称
+            object_path: MinIO中的对象路径
+            file_path: 本地文件路径
+            content_type: 文件内容类型
+
+        Returns:
+            bool: 上传是否成功
+        """
+        try:
+            file_size = os.stat(file_path).st_size / (1024 * 1024)  # MB
+        except FileNotFoundError:
+            logger.error("本地文件不存在: %s", file_path)
+            return False
+        try:
+            async with self._limit():
+                async with self._client() as s3:
+                    await s3.upload_file(
+                        file_path,
+                        bucket_name,
+                        object_path,
+                        ExtraArgs={'ContentType': content_type},
+                    )
+            logger.info("上传成功: %s/%s, 大小: %.2fMB", bucket_name, object_path, file_size)
+            return True
+        except ClientError as e:
+            logger.error("上传文件失败: %s", e)
+            return False
+        except Exception as e:
+            logger.error("上传文件时发生未知错误: %s", e)
+            return False
+
+    async def aupload_many(self,
+                           items: Iterable[Tuple[str, str, str]],
+                           content_type: str = "application/octet-stream") -> List[bool]:
+        """
+        并发上传多个本地文件
+
+        Args:
+            items: (bucket_name, object_path, file_path) 序列
+            content_type: 文件内容类型
+
+        Returns:
+            List[bool]: 与 items 顺序一致的上传结果
+        """
+        async with self._client() as s3:
+            # 整批共享同一个连接
+            entered = self._s3 is None
+            if entered:
+                self._s3 = s3
+            try:
+                return await asyncio.gather(*(
+                    self.aupload_file(bucket, key, path, content_type)
+                    for bucket, key, path in items
+                ))
+            finally:
+                if entered:
+                    self._s3 = None
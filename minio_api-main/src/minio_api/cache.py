@@ -0,0 +1,116 @@
+"""
+本地磁盘对象缓存 - 按 (bucket, object, etag) 缓存下载过的对象，重复读取时免去下载
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class DiskObjectCache:
+    """
+    内容寻址的磁盘缓存
+
+    键为 sha1(bucket|object|etag[|variant])：对象内容变化后 etag 随之变化，旧条目不会再被命中，
+    由容量淘汰自然清理；variant 区分同一对象的不同读取结果（如按标的过滤后的子表）。
+    总大小超过 max_bytes 时按最近访问时间淘汰。目录只在初始化时扫描一次，
+    之后条目与总大小随写入、命中增量维护。
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # path -> size，按访问时间从旧到新排列
+        self._entries: "OrderedDict[Path, int]" = OrderedDict()
+        self._total = 0
+        self._scan()
+
+    def _scan(self):
+        """载入目录中已有的条目（按 mtime 排序）"""
+        entries = []
+        for p in self.cache_dir.glob("*/*"):
+            if p.suffix == ".tmp":
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+        for _, size, p in entries:
+            self._entries[p] = size
+            self._total += size
+
+    def path_for(self, bucket_name: str, object_name: str, etag: str, variant: str = "") -> Path:
+        raw = f"{bucket_name}|{object_name}|{etag}"
+        if variant:
+            raw += f"|{variant}"
+        key = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        suffix = Path(object_name).suffix
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def get(self, bucket_name: str, object_name: str, etag: str, variant: str = "") -> Optional[Path]:
+        """命中返回本地文件路径（并刷新访问时间），否则返回None"""
+        path = self.path_for(bucket_name, object_name, etag, variant)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._total -= self._entries.pop(path, 0)
+            return None
+        with self._lock:
+            if path in self._entries:
+                self._entries.move_to_end(path)
+        logger.debug(f"磁盘缓存命中: {bucket_name}/{object_name}")
+        return path
+
+    def put(self, bucket_name: str, object_name: str, etag: str, data, variant: str = "") -> Path:
+        """写入缓存：先写临时文件再原子替换，并发读取方不会看到写了一半的文件"""
+        path = self.path_for(bucket_name, object_name, etag, variant)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = memoryview(data).nbytes
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self._total += size - self._entries.pop(path, 0)
+            self._entries[path] = size
+            self._evict_locked()
+        return path
+
+    def _evict_locked(self):
+        """超出容量时按访问时间从旧到新删除（调用方持有锁）"""
+        while self._total > self.max_bytes and self._entries:
+            p, size = self._entries.popitem(last=False)
+            self._total -= size
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """清空缓存目录"""
+        with self._lock:
+            for p in self.cache_dir.glob("*/*"):
+                try:
+                    p.unlink()
+                except FileNotFoundError:
+                    pass
+            self._entries.clear()
+            self._total = 0
@@ -3,19 +3,41 @@ MinIO股票数据客户端 - 多Schema支持版本
 """
 import os
 import pandas as pd
-import io
+import threading
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import logging
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from minio import Minio
 from minio.error import S3Error
 
 from .config import get_config, MinIOConfig
 from .schemas import schema_manager, get_supported_data_types, is_data_type_supported
 from .adj_utils import apply_adjustment_factor
+from .minute_client import _get_s3fs
+from .cache import DiskObjectCache
 
 logger = logging.getLogger(__name__)
 
+# 按标的部分读取时的列块读缓冲（与 pre_buffer 的范围合并配合，每次范围请求至少读取该大小）
+READ_AHEAD_SIZE = 8 * 1024 * 1024
+
+# get_data 支持的返回类型
+SUPPORTED_FRAMEWORKS = ("pandas", "arrow", "polars")
+
+
+def _convert_table(table: pa.Table, framework: str):
+    """将Arrow表转换为指定框架的数据结构（仅 arrow/polars，pandas 路径不经过此处）"""
+    if framework == "polars":
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("framework='polars' 需要 polars，请安装: pip install minio_api[polars]")
+        return pl.from_arrow(table)
+    return table
+
 class MinIOStockDataClient:
     """
     MinIO股票数据客户端 - 多数据类型支持
@@ -55,6 +77,18 @@ class MinIOStockDataClient:
             secret_key=secret_key,
             secure=secure
         )
+        # 按标的部分读取 parquet 时使用的 PyArrow S3 文件系统（进程内按连接参数共享）
+        self._s3fs_args = (f"http{'s' if secure else ''}://{endpoint}", access_key, secret_key)
+        
+        # 本地磁盘对象缓存：按 (bucket, object, etag) 缓存已下载的数据文件
+        self.disk_cache = None
+        if kwargs.get('disk_cache', self.config.cache_enabled):
+            try:
+                self.disk_cache = DiskObjectCache(self.config.cache_dir, self.config.cache_max_bytes)
+            except OSError as e:
+                logger.warning(f"磁盘缓存目录不可用，禁用磁盘缓存: {e}")
+        # 列目录时顺带记录的 etag，读缓存时不必再 stat_object
+        self._object_etags = {}
         
         # 设置bucket名称 - 支持多种方式
         if 'bucket_name' in kwargs:
@@ -84,7 +118,8 @@ class MinIOStockDataClient:
                  start_date: str = "20200101",
                  end_date: str = "20250101", 
                  symbols: Union[str, List[str]] = "all",
-                 fq_type: str = "qfq") -> pd.DataFrame:
+                 fq_type: str = "qfq",
+                 framework: str = "pandas"):
         """
         从MinIO获取指定类型的数据
         
@@ -94,17 +129,30 @@ class MinIOStockDataClient:
             end_date: 结束日期 YYYYMMDD
             symbols: 股票代码，"all"表示所有标的
             fq_type: 复权类型，仅对股票数据有效，默认 'qfq'。 'qfq'(前复权)/'hfq'(后复权)/'bfq'(不复权)。
+            framework: 返回类型，'pandas'(默认，pd.DataFrame)/'arrow'(pa.Table)/'polars'(pl.DataFrame)。
+                       非pandas时读取、合并、过滤全程在Arrow中完成，不构造中间DataFrame
             
         Returns:
-            pd.DataFrame: 数据
+            pd.DataFrame / pa.Table / pl.DataFrame: 数据
         """
         start_time = datetime.now()
         
         # 验证数据类型
         if not is_data_type_supported(data_type):
             raise ValueError(f"不支持的数据类型: {data_type}，支持的类型: {get_supported_data_types()}")
+        if framework not in SUPPORTED_FRAMEWORKS:
+            raise ValueError(f"不支持的返回类型: {framework}，支持的类型: {list(SUPPORTED_FRAMEWORKS)}")
         
         try:
+            if framework != "pandas":
+                if data_type == "CNSTOCK" and fq_type in ['qfq', 'hfq']:
+                    # 复权计算依赖pandas实现，结果再转为Arrow
+                    df = self._get_adjusted_stock_data(start_date, end_date, symbols, fq_type)
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                else:
+                    table = self._fetch_raw_table(data_type, start_date, end_date, symbols)
+                return _convert_table(table, framework)
+            
             # 处理复权逻辑 - 模仿 CNStockDailyProvider
             if data_type == "CNSTOCK" and fq_type in ['qfq', 'hfq']:
                 return self._get_adjusted_stock_data(start_date, end_date, symbols, fq_type)
@@ -182,8 +230,9 @@ class MinIOStockDataClient:
         
         # 2. 下载并合并数据
         df_list = []
+        symbol_column = schema_manager.get_symbol_column(data_type)
         for file_path in data_files:
-            df_chunk = self._download_and_read_file(file_path)
+            df_chunk = self._download_and_read_file(file_path, symbol_column, symbols)
             if df_chunk is not None and not df_chunk.empty:
                 df_list.append(df_chunk)
         
@@ -230,6 +279,7 @@ class MinIOStockDataClient:
             for obj in objects:
                 if obj.object_name.endswith('.parquet'):
                     available_files.append(obj.object_name)
+                    self._object_etags[obj.object_name] = obj.etag
             
             # 按月查找文件
             current_date = start_dt.replace(day=1)  # 月初
@@ -256,21 +306,156 @@ class MinIOStockDataClient:
             logger.error(f"查找{data_type}数据文件失败: {e}")
             return []
     
-    def _download_and_read_file(self, object_name: str) -> pd.DataFrame:
-        """下载并读取parquet文件"""
+    def _download_and_read_file(self, object_name: str,
+                                symbol_column: Optional[str] = None,
+                                symbols: Union[str, List[str]] = "all") -> pd.DataFrame:
+        """下载并读取parquet文件为DataFrame"""
+        table = self._download_and_read_table(object_name, symbol_column, symbols)
+        if table is None:
+            return pd.DataFrame()
+        return table.to_pandas()
+    
+    def _download_and_read_table(self, object_name: str,
+                                 symbol_column: Optional[str] = None,
+                                 symbols: Union[str, List[str]] = "all") -> Optional[pa.Table]:
+        """
+        下载并读取parquet文件为Arrow表（失败返回None）
+        
+        指定了标的时按范围读取：行组统计信息过滤掉不含这些标的的行组，
+        需要的列块经 pre_buffer 合并为少量大范围 GET，并使用 8MB 读缓冲；
+        读取全部标的时整个对象一次 GET 下载。
+        启用磁盘缓存且列目录时已得到 etag 时优先读本地缓存，未命中则按上述方式读取后写入缓存
+        """
+        ranged = bool(symbol_column) and symbols != "all" and isinstance(symbols, (str, list))
+        etag = self._object_etags.get(object_name)
+        if self.disk_cache is not None and etag is not None:
+            try:
+                return self._read_file_cached(object_name, etag, symbol_column if ranged else None, symbols)
+            except Exception as e:
+                logger.debug(f"磁盘缓存读取失败，改为直接下载 {object_name}: {e}")
+        if ranged:
+            try:
+                return self._read_file_range(object_name, symbol_column, symbols)
+            except Exception as e:
+                logger.debug(f"按范围读取失败，改为整文件下载 {object_name}: {e}")
         try:
             response = self.client.get_object(self.bucket_name, object_name)
             data = response.read()
             response.close()
             
-            df = pd.read_parquet(io.BytesIO(data))
-            logger.debug(f"下载文件: {object_name}, 数据量: {len(df):,}行")
+            table = pq.read_table(pa.BufferReader(data))
+            logger.debug(f"下载文件: {object_name}, 数据量: {table.num_rows:,}行")
             
-            return df
+            return table
             
         except Exception as e:
             logger.error(f"下载文件失败 {object_name}: {e}")
-            return pd.DataFrame()
+            return None
+    
+    def _read_file_cached(self, object_name: str, etag: str,
+                          symbol_column: Optional[str] = None,
+                          symbols: Union[str, List[str]] = "all") -> pa.Table:
+        """
+        经磁盘缓存读取parquet文件
+        
+        指定了标的列时缓存按范围读取得到的子表（键含标的集合），不下载整个对象；
+        否则缓存整个对象
+        """
+        if symbol_column is not None:
+            wanted = sorted({symbols} if isinstance(symbols, str) else set(symbols))
+            variant = f"{symbol_column}:{','.join(map(str, wanted))}"
+            path = self.disk_cache.get(self.bucket_name, object_name, etag, variant)
+            if path is not None:
+                table = pq.read_table(path)
+                logger.debug(f"读取缓存文件: {object_name}, 数据量: {table.num_rows:,}行")
+                return table
+            table = self._read_file_range(object_name, symbol_column, symbols)
+            sink = pa.BufferOutputStream()
+            pq.write_table(table, sink)
+            self.disk_cache.put(self.bucket_name, object_name, etag, sink.getvalue(), variant)
+            return table
+        
+        path = self.disk_cache.get(self.bucket_name, object_name, etag)
+        if path is None:
+            response = self.client.get_object(self.bucket_name, object_name)
+            try:
+                data = response.read()
+                # 以实际下载内容的 etag 为键，列目录后对象若被覆盖也不会缓存错位
+                etag = (response.headers.get('ETag') or etag).strip('"')
+            finally:
+                response.close()
+                response.release_conn()
+            path = self.disk_cache.put(self.bucket_name, object_name, etag, data)
+            logger.debug(f"下载并缓存文件: {object_name}")
+        
+        table = pq.read_table(path)
+        logger.debug(f"读取缓存文件: {object_name}, 数据量: {table.num_rows:,}行")
+        return table
+    
+    def _read_file_range(self, object_name: str, symbol_column: str,
+                         symbols: Union[str, List[str]]) -> pa.Table:
+        """按标的过滤、以范围请求读取parquet文件"""
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        table = pq.read_table(
+            f"{self.bucket_name}/{object_name}",
+            filesystem=_get_s3fs(*self._s3fs_args, 10, 30),
+            filters=[(symbol_column, "in", list(symbols))],
+            pre_buffer=True,
+            buffer_size=READ_AHEAD_SIZE,
+        )
+        logger.debug(f"范围读取文件: {object_name}, 数据量: {table.num_rows:,}行")
+        return table
+    
+    def _fetch_raw_table(self, data_type: str, start_date: str, end_date: str,
+                         symbols: Union[str, List[str]]) -> pa.Table:
+        """获取原始数据（Arrow 版本，全程不经过 pandas）"""
+        data_files = self._find_data_files(data_type, start_date, end_date, symbols)
+        if not data_files:
+            logger.warning(f"未找到匹配的{data_type}数据文件")
+            return pa.table({})
+        
+        symbol_column = schema_manager.get_symbol_column(data_type)
+        tables = []
+        for file_path in data_files:
+            table = self._download_and_read_table(file_path, symbol_column, symbols)
+            if table is not None and table.num_rows:
+                tables.append(table)
+        if not tables:
+            return pa.table({})
+        
+        table = pa.concat_tables(tables, promote_options="default") if len(tables) > 1 else tables[0]
+        return self._filter_table(table, data_type, start_date, end_date, symbols)
+    
+    def _filter_table(self, table: pa.Table, data_type: str, start_date: str, end_date: str, symbols) -> pa.Table:
+        """过滤数据（Arrow 版本，与 _filter_data 语义一致：日期列转为时间戳、按标的与日期排序）"""
+        date_column = schema_manager.get_date_column(data_type)
+        symbol_column = schema_manager.get_symbol_column(data_type)
+        names = table.schema.names
+        
+        if date_column in names:
+            idx = names.index(date_column)
+            col = table.column(idx)
+            if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+                try:
+                    col = pc.strptime(col, format='%Y%m%d', unit='ns')
+                except pa.ArrowInvalid:
+                    col = pa.chunked_array([pa.array(pd.to_datetime(col.to_pandas()), type=pa.timestamp('ns'))])
+            elif not pa.types.is_timestamp(col.type):
+                col = pc.cast(col, pa.timestamp('ns'))
+            table = table.set_column(idx, date_column, col)
+            start_dt = pa.scalar(pd.to_datetime(start_date, format='%Y%m%d'), type=col.type)
+            end_dt = pa.scalar(pd.to_datetime(end_date, format='%Y%m%d'), type=col.type)
+            table = table.filter(pc.and_kleene(pc.greater_equal(col, start_dt), pc.less_equal(col, end_dt)))
+        
+        if symbols != "all" and isinstance(symbols, (str, list)) and symbol_column in names:
+            if isinstance(symbols, str):
+                symbols = [symbols]
+            table = table.filter(pc.is_in(table[symbol_column], value_set=pa.array(symbols)))
+        
+        if table.num_rows and symbol_column in names and date_column in names:
+            table = table.sort_by([(symbol_column, 'ascending'), (date_column, 'ascending')])
+        return table
     
     def _filter_data(self, df: pd.DataFrame, data_type: str, start_date: str, end_date: str, symbols) -> pd.DataFrame:
         """过滤数据"""
@@ -395,7 +580,8 @@ class MinIOStockDataClient:
                            start_date: str = "20200101",
                            end_date: str = "20250101", 
                            symbols: Union[str, List[str]] = "all",
-                           fq_type: str = "qfq") -> pd.DataFrame:
+                           fq_type: str = "qfq",
+                           framework: str = "pandas"):
         """
         从MinIO快速获取股票数据 (兼容性方法)
         
@@ -404,16 +590,18 @@ class MinIOStockDataClient:
             end_date: 结束日期 YYYYMMDD
             symbols: 股票代码，"all"表示所有股票
             fq_type: 复权类型 qfq/hfq/bfq
+            framework: 返回类型 pandas/arrow/polars
             
         Returns:
-            pd.DataFrame: 股票数据
+            pd.DataFrame: 股票数据（framework非pandas时为对应类型）
         """
         return self.get_data(
             data_type="CNSTOCK",
             start_date=start_date,
             end_date=end_date,
             symbols=symbols,
-            fq_type=fq_type
+            fq_type=fq_type,
+            framework=framework
         )
     
     def test_connection(self) -> bool:
@@ -444,12 +632,34 @@ class MinIOStockDataClient:
             logger.error(f"获取桶信息失败: {e}")
             return {}
 
+# 便捷函数共享的客户端缓存（按连接参数 + 数据桶），避免每次调用都新建连接池并检查桶
+_client_cache: Dict[Tuple, MinIOStockDataClient] = {}
+_client_cache_lock = threading.Lock()
+
+def _get_client(config: Optional[MinIOConfig] = None) -> MinIOStockDataClient:
+    cfg = config or get_config()
+    key = cfg.connection_key() + (cfg.get_bucket('data'),)
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            client = MinIOStockDataClient(config=cfg)
+            _client_cache[key] = client
+    return client
+
+def clear_client_cache():
+    """清除便捷函数缓存的客户端与上传器（凭证轮换后调用）"""
+    from .uploader import clear_uploader_cache
+    with _client_cache_lock:
+        _client_cache.clear()
+    clear_uploader_cache()
+
 # 便捷函数
 def get_stock_data_from_minio(start_date: str = "20200101", 
                              end_date: str = "20250101",
                              symbols: Union[str, List[str]] = "all",
                              fq_type: str = "qfq",
-                             config: Optional[MinIOConfig] = None) -> pd.DataFrame:
+                             config: Optional[MinIOConfig] = None,
+                             framework: str = "pandas"):
     """
     从MinIO获取股票数据的便捷函数 (兼容性函数)
     
@@ -459,16 +669,18 @@ def get_stock_data_from_minio(start_date: str = "20200101",
         symbols: 股票代码
         fq_type: 复权类型
         config: MinIO配置，None则从环境变量读取
+        framework: 返回类型 pandas/arrow/polars
         
     Returns:
-        pd.DataFrame: 股票数据
+        pd.DataFrame: 股票数据（framework非pandas时为对应类型）
     """
-    client = MinIOStockDataClient(config=config)
+    client = _get_client(config)
     return client.get_stock_data_fast(
         start_date=start_date,
         end_date=end_date,
         symbols=symbols,
-        fq_type=fq_type
+        fq_type=fq_type,
+        framework=framework
     )
 
 def get_data_from_minio(data_type: str,
@@ -476,7 +688,8 @@ def get_data_from_minio(data_type: str,
                        end_date: str = "20250101", 
                        symbols: Union[str, List[str]] = "all",
                        fq_type: str = "bfq",
-                       config: Optional[MinIOConfig] = None) -> pd.DataFrame:
+                       config: Optional[MinIOConfig] = None,
+                       framework: str = "pandas"):
     """
     从MinIO获取指定类型数据的便捷函数
     
@@ -487,15 +700,17 @@ def get_data_from_minio(data_type: str,
         symbols: 标的代码
         fq_type: 复权类型（仅对股票数据有效）
         config: MinIO配置，None则从环境变量读取
+        framework: 返回类型 pandas/arrow/polars
         
     Returns:
-        pd.DataFrame: 数据
+        pd.DataFrame: 数据（framework非pandas时为对应类型）
     """
-    client = MinIOStockDataClient(config=config)
+    client = _get_client(config)
     return client.get_data(
         data_type=data_type,
         start_date=start_date,
         end_date=end_date,
         symbols=symbols,
-        fq_type=fq_type
+        fq_type=fq_type,
+        framework=framework
     )
\ No newline at end of file
@@ -2,13 +2,35 @@
 配置管理模块 - 多bucket支持版本
 """
 import os
-from typing import Optional, Dict
+from dataclasses import dataclass, fields, replace
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 import logging
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class ConnectionParams:
+    """MinIO连接参数（不可变、可哈希），可直接展开传给 Minio(...)"""
+    endpoint: str
+    access_key: str
+    secret_key: str
+    secure: bool
+    
+    def with_overrides(self, overrides: dict) -> "ConnectionParams":
+        """用 kwargs 中同名的键覆盖连接参数，其余键忽略"""
+        changes = {f.name: overrides[f.name] for f in fields(self) if f.name in overrides}
+        return replace(self, **changes) if changes else self
+    
+    def minio_kwargs(self) -> dict:
+        return {
+            'endpoint': self.endpoint,
+            'access_key': self.access_key,
+            'secret_key': self.secret_key,
+            'secure': self.secure,
+        }
+
 class MinIOConfig:
     """MinIO配置类 - 支持多bucket配置"""
     
@@ -23,6 +45,8 @@ class MinIOConfig:
         self._load_env_file(env_file)
         if not skip_validation:
             self._validate_config()
+        # 连接参数在首次使用时从环境变量读取一次，之后复用（reload_config 会新建实例）
+        self._connection_params: Optional[ConnectionParams] = None
     
     def _load_env_file(self, env_file: Optional[str] = None):
         """加载.env文件"""
@@ -158,6 +182,37 @@ class MinIOConfig:
         """连接超时时间（秒）"""
         return int(os.getenv('MINIO_TIMEOUT', '60'))
     
+    @property
+    def cache_enabled(self) -> bool:
+        """是否启用本地磁盘对象缓存（默认关闭）"""
+        return os.getenv('MINIO_CACHE_ENABLED', 'false').lower() in ('true', '1', 'yes')
+    
+    @property
+    def cache_dir(self) -> str:
+        """本地磁盘对象缓存目录"""
+        return os.getenv('MINIO_CACHE_DIR', str(Path.home() / '.cache' / 'minio_api'))
+    
+    @property
+    def cache_max_bytes(self) -> int:
+        """本地磁盘对象缓存容量上限（MINIO_CACHE_MAX_GB，单位GB）"""
+        return int(float(os.getenv('MINIO_CACHE_MAX_GB', '10')) * 1024 ** 3)
+    
+    def connection_params(self) -> ConnectionParams:
+        """连接参数（首次调用时读取环境变量并缓存）"""
+        if self._connection_params is None:
+            self._connection_params = ConnectionParams(
+                endpoint=self.endpoint,
+                access_key=self.access_key,
+                secret_key=self.secret_key,
+                secure=self.secure,
+            )
+        return self._connection_params
+    
+    def connection_key(self) -> Tuple[str, str, str, bool]:
+        """连接参数元组（可哈希），用于按连接缓存客户端"""
+        params = self.connection_params()
+        return (params.endpoint, params.access_key, params.secret_key, params.secure)
+    
     def to_dict(self) -> dict:
         """转换为字典格式"""
         return {
@@ -4,7 +4,7 @@
 import os
 import io
 import logging
-from typing import Optional, Union
+from typing import Optional
 from pathlib import Path
 from minio import Minio
 from minio.error import S3Error
@@ -13,6 +13,7 @@ from .config import get_config, MinIOConfig
 
 logger = logging.getLogger(__name__)
 
+
 class MinIOFileDownloader:
     """通用MinIO文件下载器"""
     
@@ -41,8 +42,20 @@ class MinIOFileDownloader:
             secure=secure
         )
         
+        # 已确认存在的桶，避免每次下载都额外请求一次 bucket_exists
+        self._known_buckets: set = set()
+        
         logger.info(f"初始化MinIO下载器: {endpoint} (secure={secure})")
     
+    def _bucket_exists(self, bucket_name: str) -> bool:
+        """检查桶是否存在，结果按下载器实例缓存"""
+        if bucket_name in self._known_buckets:
+            return True
+        if self.client.bucket_exists(bucket_name):
+            self._known_buckets.add(bucket_name)
+            return True
+        return False
+    
     def download_file(self,
                      bucket_name: str,
                      object_path: str,
@@ -62,25 +75,16 @@ class MinIOFileDownloader:
         """
         try:
             # 检查桶是否存在
-            if not self.client.bucket_exists(bucket_name):
+            if not self._bucket_exists(bucket_name):
                 logger.error(f"桶不存在: {bucket_name}")
                 return False
             
-            # 检查对象是否存在
-            try:
-                self.client.stat_object(bucket_name, object_path)
-            except S3Error as e:
-                if e.code == 'NoSuchKey':
-                    logger.error(f"对象不存在: {bucket_name}/{object_path}")
-                    return False
-                raise
-            
             # 自动创建目录
             if create_dirs:
                 file_dir = Path(file_path).parent
                 file_dir.mkdir(parents=True, exist_ok=True)
             
-            # 下载文件
+            # 下载文件（fget_object 内部已做 stat_object，对象不存在时抛 NoSuchKey）
             self.client.fget_object(
                 bucket_name,
                 object_path,
@@ -92,7 +96,10 @@ class MinIOFileDownloader:
             return True
             
         except S3Error as e:
-            logger.error(f"下载文件失败: {e}")
+            if e.code == 'NoSuchKey':
+                logger.error(f"对象不存在: {bucket_name}/{object_path}")
+            else:
+                logger.error(f"下载文件失败: {e}")
             return False
         except Exception as e:
             logger.error(f"下载文件时发生未知错误: {e}")
@@ -112,15 +119,14 @@ class MinIOFileDownloader:
             bytes: 文件二进制数据，失败返回None
         """
         try:
-            # 检查桶是否存在
-            if not self.client.bucket_exists(bucket_name):
-                logger.error(f"桶不存在: {bucket_name}")
-                return None
-            
-            # 检查对象是否存在并获取文件
+            # 直接获取对象，桶/对象不存在由 S3Error 区分，省去额外的 bucket_exists 往返
             response = self.client.get_object(bucket_name, object_path)
-            data = response.read()
-            response.close()
+            try:
+                data = response.read()
+            finally:
+                response.close()
+                response.release_conn()
+            self._known_buckets.add(bucket_name)
             
             data_size = len(data) / (1024 * 1024)  # MB
             logger.info(f"下载成功: {bucket_name}/{object_path}, 大小: {data_size:.2f}MB")
@@ -129,6 +135,9 @@ class MinIOFileDownloader:
         except S3Error as e:
             if e.code == 'NoSuchKey':
                 logger.error(f"对象不存在: {bucket_name}/{object_path}")
+            elif e.code == 'NoSuchBucket':
+                self._known_buckets.discard(bucket_name)
+                logger.error(f"桶不存在: {bucket_name}")
             else:
                 logger.error(f"下载数据失败: {e}")
             return None
@@ -155,9 +164,8 @@ class MinIOFileDownloader:
             if data is None:
                 return None
             
-            # 包装成file-like对象
+            # 包装成file-like对象(CPython 中以 bytes 构造的 BytesIO 在写入前与其共享内存，不会复制)
             file_obj = io.BytesIO(data)
-            file_obj.seek(0)  # 重置指针到开头
             
             logger.info(f"获取对象流成功: {bucket_name}/{object_path}")
             return file_obj
@@ -1,13 +1,35 @@
 # 文件: open/minio_api/src/minio_api/localdata.py
 from __future__ import annotations
 
+import asyncio
 import io
 import json
-from typing import List, Sequence, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Optional, Tuple, Union
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from .config import get_config, MinIOConfig
 from .downloader import MinIOFileDownloader
+
+try:
+    import orjson  # 可选依赖: pip install minio_api[fast]
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes, encoding: str = "utf-8"):
+    """优先用 orjson 直接解析 UTF-8 字节（免去先解码成 str）；不可用或非法 UTF-8 时回退标准库"""
+    if orjson is not None and encoding.lower().replace("-", "") == "utf8":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode(encoding, errors="ignore"))
  
 def _infer_file_type(path: str, file_type: str = "auto") -> str:
     if file_type != "auto":
@@ -32,16 +54,34 @@ def _read_info_df(
     file_type: str = "auto",
     bucket_type: str = "trader_data",
     config: Optional[MinIOConfig] = None,
+    filter_expr: Optional[pc.Expression] = None,
 ) -> pd.DataFrame:
     cfg = config or get_config()
     bucket = cfg.get_bucket(bucket_type)
     dl = MinIOFileDownloader(cfg)
-    name = object_path if object_path.startswith("info/") else f"info/{object_path}"
+    name = _info_object_name(object_path)
     data = dl.download_data(bucket, name)
+    return _parse_info_bytes(name, data, file_type=file_type, filter_expr=filter_expr)
+
+
+def _info_object_name(object_path: str) -> str:
+    return object_path if object_path.startswith("info/") else f"info/{object_path}"
+
+
+def _parse_info_bytes(
+    name: str,
+    data: Optional[bytes],
+    *,
+    file_type: str = "auto",
+    filter_expr: Optional[pc.Expression] = None,
+) -> pd.DataFrame:
     if data is None:
         return pd.DataFrame()
 
     ft = _infer_file_type(name, file_type=file_type)
+    if filter_expr is not None:
+        return _read_filtered_table(name, data, ft, filter_expr).to_pandas()
+
     bio = io.BytesIO(data)
     if ft == "parquet":
         return pd.read_parquet(bio)
@@ -51,6 +91,120 @@ def _read_info_df(
     return pd.read_csv(bio, compression=comp if comp else None)
 
 
+def _filter_table(table: pa.Table, filter_expr: pc.Expression) -> Tuple[pa.Table, bool]:
+    """应用过滤表达式；字段不存在时原样返回，由调用方的 pandas 逻辑兜底"""
+    try:
+        return table.filter(filter_expr), True
+    except (pa.ArrowInvalid, KeyError):
+        return table, False
+
+
+def _read_filtered_table(name: str, data: bytes, ft: str, filter_expr: pc.Expression) -> pa.Table:
+    """
+    带过滤条件读取：CSV 按 RecordBatch 流式解析，每批只保留命中的行，
+    选择性高时（如按交易所过滤期货）峰值内存和转换开销都远小于整表 read_csv
+    """
+    buf = pa.BufferReader(data)
+    if ft == "parquet":
+        table, _ = _filter_table(pq.read_table(buf), filter_expr)
+        return table
+
+    comp = _infer_csv_compression_from_name(name)
+    src = pa.CompressedInputStream(buf, "gzip") if comp else buf
+    try:
+        reader = pacsv.open_csv(src)
+        kept = []
+        for batch in reader:
+            part = pa.Table.from_batches([batch])
+            if filter_expr is not None:
+                part, ok = _filter_table(part, filter_expr)
+                if not ok:
+                    filter_expr = None
+            if part.num_rows:
+                kept.append(part)
+    except pa.ArrowInvalid:
+        # 流式读取的列类型由首个块推断，后续块出现不兼容的值(如前部全空的列)时转换失败，
+        # 此时回退为整表 pandas 解析后再过滤
+        df = pd.read_csv(io.BytesIO(data), compression=comp)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if filter_expr is not None:
+            table, _ = _filter_table(table, filter_expr)
+        return table
+    if not kept:
+        return reader.schema.empty_table()
+    return pa.concat_tables(kept).combine_chunks()
+
+
+def _split_suffix(name: str, valid_suffixes: Sequence[str]) -> Tuple[str, str]:
+    # 取最长匹配后缀，避免 .csv.gz 被当成 .gz
+    suf = max((x for x in valid_suffixes if name.endswith(x)), key=len, default="")
+    return name[: len(name) - len(suf)], suf
+
+
+def _pick_latest_object(objs: List[dict], valid_suffixes: Sequence[str]) -> Optional[dict]:
+    """
+    选出最新的对象；同一 stem 同时存在 parquet 与 csv 时优先 parquet（体积更小、解析更快）
+    """
+    cand = [o for o in objs if any(o["object_name"].endswith(suf) for suf in valid_suffixes)]
+    if not cand:
+        return None
+    stems = {o["object_name"]: _split_suffix(o["object_name"], valid_suffixes) for o in cand}
+    latest_stem = max(stem for stem, _ in stems.values())
+    same_stem = [o for o in cand if stems[o["object_name"]][0] == latest_stem]
+    return max(same_stem, key=lambda o: (stems[o["object_name"]][1] == ".parquet", o["object_name"]))
+
+
+# 最新快照的 Arrow 表缓存：key=(bucket, object_name, etag)，对象被覆盖时 etag 变化自动失效
+_INFO_TABLE_CACHE_SIZE = 32
+_info_table_cache: "OrderedDict[tuple, pa.Table]" = OrderedDict()
+_info_table_lock = threading.Lock()
+
+# 预计算的上市日期整数列（内部列，对外返回前去掉）
+_LIST_DATE_INT = "_list_date_int"
+
+
+def _info_cache_get(key: tuple, filter_expr: Optional[pc.Expression] = None) -> Optional[pd.DataFrame]:
+    with _info_table_lock:
+        table = _info_table_cache.get(key)
+        if table is None:
+            return None
+        _info_table_cache.move_to_end(key)
+    if filter_expr is not None:
+        table, _ = _filter_table(table, filter_expr)
+    # 每次返回新的 DataFrame，调用方可以放心修改
+    return table.to_pandas()
+
+
+def _info_cache_put(key: tuple, df: pd.DataFrame) -> None:
+    if df is None or df.empty:
+        return
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # 混合类型列无法转成 Arrow，直接跳过缓存
+        return
+    with _info_table_lock:
+        _info_table_cache[key] = table
+        _info_table_cache.move_to_end(key)
+        while len(_info_table_cache) > _INFO_TABLE_CACHE_SIZE:
+            _info_table_cache.popitem(last=False)
+
+
+def _with_list_date_int(df: pd.DataFrame) -> pd.DataFrame:
+    """读取后一次性把 list_date 转成 Int32（YYYYMMDD），随缓存复用，过滤时无需每次重复解析"""
+    if df is not None and "list_date" in df.columns:
+        df[_LIST_DATE_INT] = pd.to_numeric(
+            df["list_date"].astype(str).str.slice(0, 8), errors="coerce"
+        ).astype("Int32")
+    return df
+
+
+def clear_info_cache() -> None:
+    """清除 info/ 快照缓存（测试用）"""
+    with _info_table_lock:
+        _info_table_cache.clear()
+
+
 def _read_info_latest_df(
     prefix: str,
     *,
@@ -58,30 +212,47 @@ def _read_info_latest_df(
     file_type: str = "auto",
     bucket_type: str = "trader_data",
     config: Optional[MinIOConfig] = None,
+    filter_expr: Optional[pc.Expression] = None,
 ) -> pd.DataFrame:
     cfg = config or get_config()
     bucket = cfg.get_bucket(bucket_type)
     dl = MinIOFileDownloader(cfg)
     list_prefix = f"info/{prefix.lstrip('/')}"
     objs = dl.list_objects(bucket, prefix=list_prefix, recursive=True)
-    if not objs:
+    latest = _pick_latest_object(objs, valid_suffixes)
+    if latest is None:
         return pd.DataFrame()
-    cand = [o["object_name"] for o in objs if any(o["object_name"].endswith(suf) for suf in valid_suffixes)]
-    if not cand:
-        return pd.DataFrame()
-    latest = sorted(cand)[-1]
-    return _read_info_df(latest, file_type=file_type, bucket_type=bucket_type, config=cfg)
+    key = (bucket, latest["object_name"], latest.get("etag"))
+    df = _info_cache_get(key, filter_expr)
+    if df is not None:
+        return df
+    name = _info_object_name(latest["object_name"])
+    df = _with_list_date_int(_parse_info_bytes(name, dl.download_data(bucket, name), file_type=file_type, filter_expr=filter_expr))
+    if filter_expr is None:
+        # 只缓存完整快照，过滤结果因条件而异
+        _info_cache_put(key, df)
+    return df
 
 def get_code_list(
     exclude_exch_list: List[str] | None = None,
     list_date_before: str = "99999999",
     exclude_market_list: List[str] | None = None,
 ) -> List[str]:
-    df = _read_info_latest_df("stock_basic_listed.", file_type="csv")
+    df = _read_info_latest_df("stock_basic_listed.")
+    return _filter_code_list(df, exclude_exch_list, list_date_before, exclude_market_list)
+
+def _filter_code_list(
+    df: pd.DataFrame,
+    exclude_exch_list: List[str] | None,
+    list_date_before: str,
+    exclude_market_list: List[str] | None,
+) -> List[str]:
     if df is None or df.empty:
         return []
     df = df[df["ts_code"].notna()]
-    if "list_date" in df.columns:
+    if _LIST_DATE_INT in df.columns:
+        df = df[df[_LIST_DATE_INT] <= int(list_date_before)]
+    elif "list_date" in df.columns:
         df = df[df["list_date"].astype(str).str[:8].astype(int) <= int(list_date_before)]
     if exclude_market_list:
         market_map = {"main": "主板", "kcb": "科创板", "cyb": "创业板", "zxb": "中小板"}
@@ -98,7 +269,10 @@ def get_basicacc_code_list(list_date_before: str = "99999999") -> List[str]:
     return get_code_list(list_date_before=list_date_before, exclude_market_list=["kcb", "cyb", "zxb"])
 
 def get_index_list(include_exch_list: Union[List[str], str] = ("SZ", "SH")) -> List[str]:
-    df = _read_info_latest_df("index_basic.", file_type="csv")
+    df = _read_info_latest_df("index_basic.")
+    return _filter_index_list(df, include_exch_list)
+
+def _filter_index_list(df: pd.DataFrame, include_exch_list: Union[List[str], str]) -> List[str]:
     if df is None or df.empty:
         return []
     df = df[df["ts_code"].notna()]
@@ -111,19 +285,26 @@ def get_index_list(include_exch_list: Union[List[str], str] = ("SZ", "SH")) -> L
     return sorted(df["ts_code"].astype(str).tolist())
 
 def get_fund_code_list(market: str = "SZSH") -> List[str]:
-    df = _read_info_latest_df("fund_listed_basic.", file_type="csv")
+    df = _read_info_latest_df("fund_listed_basic.")
     if df is None or df.empty:
-        df = _read_info_latest_df("fund_basic.", file_type="csv")
+        df = _read_info_latest_df("fund_basic.")
         if df is None or df.empty:
             return []
-        if "status" in df.columns:
-            df = df[df["status"] == "L"]
+        df = _filter_fund_basic_listed(df)
+    return _filter_fund_code_list(df)
+
+def _filter_fund_basic_listed(df: pd.DataFrame) -> pd.DataFrame:
+    if "status" in df.columns:
+        df = df[df["status"] == "L"]
+    return df
+
+def _filter_fund_code_list(df: pd.DataFrame) -> List[str]:
     df = df[df["ts_code"].astype(str).str.endswith(("SH", "SZ"))]
     return sorted(df["ts_code"].astype(str).tolist())
 
 def get_fut_main_code_list(include_exchange_list: List[str] | None = None) -> List[str]:
     include_exchange_list = include_exchange_list or ["CFFEX", "SHFE", "DCE", "CZCE", "INE", "GFEX"]
-    df = _read_info_latest_df("fut_basic.", file_type="csv")
+    df = _read_info_latest_df("fut_basic.", filter_expr=pc.field("exchange").isin(include_exchange_list))
     if df is None or df.empty:
         return []
     if "exchange" in df.columns:
@@ -134,8 +315,12 @@ def get_fut_main_code_list(include_exchange_list: List[str] | None = None) -> Li
         exch_series = df["ts_code"].astype(str).str.split(".").str[1]
 
     if "fut_code" in df.columns:
-        pairs = {(str(fc), str(ex)) for fc, ex in zip(df["fut_code"], exch_series)}
-        return [f"{sym}_1.{exch}" for sym, exch in sorted(pairs)]
+        pairs_df = (
+            pd.DataFrame({"fc": df["fut_code"].astype(str), "ex": exch_series.astype(str)})
+            .drop_duplicates()
+            .sort_values(["fc", "ex"])
+        )
+        return (pairs_df["fc"] + "_1." + pairs_df["ex"]).tolist()
     return []
 
 
@@ -191,7 +376,6 @@ def get_us_code_list(list_date_before: str = "99999999") -> List[str]:
     # 常见命名尝试：优先 listed，其次 basic
     df = _read_info_latest_df_multi(
         ["us_stock_basic_listed.", "usstock_basic_listed.", "us_stock_basic.", "usstock_basic."],
-        file_type="csv",
     )
     if df is None or df.empty:
         return []
@@ -201,7 +385,9 @@ def get_us_code_list(list_date_before: str = "99999999") -> List[str]:
     df = df[df["ts_code"].notna()]
     if "delist_date" in df.columns:
         df = df[df["delist_date"].notna()]
-    if "list_date" in df.columns:
+    if _LIST_DATE_INT in df.columns:
+        df = df[df[_LIST_DATE_INT] <= pd.to_numeric(list_date_before, errors="coerce")]
+    elif "list_date" in df.columns:
         # 容错: 非数字填充
         s = df["list_date"].astype(str).str[:8]
         s = pd.to_numeric(s, errors="coerce")
@@ -235,7 +421,7 @@ def get_star_list() -> List[str]:
         if df is not None and not df.empty and "symbol" in df.columns:
             return sorted(df["symbol"].astype(str).tolist())
 
-    df = _read_info_latest_df("stock_list.", file_type="csv")
+    df = _read_info_latest_df("stock_list.")
     if df is not None and not df.empty and "symbol" in df.columns:
         return sorted(df["symbol"].astype(str).tolist())
 
@@ -263,12 +449,17 @@ def get_basic_df(datestr: Optional[str] = None) -> pd.DataFrame:
                     return df_try
 
     # 2) 最新版本（优先 listed）
-    df = _read_info_latest_df("stock_basic_listed.", file_type="csv")
+    df = _read_info_latest_df("stock_basic_listed.")
     if (df is None or df.empty):
-        df = _read_info_latest_df("stock_basic.", file_type="csv")
+        df = _read_info_latest_df("stock_basic.")
+    return _finalize_basic_df(df)
+
+
+def _finalize_basic_df(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
 
+    df = df.drop(columns=[_LIST_DATE_INT], errors="ignore")
     if "list_date" in df.columns:
         df["list_date"] = df["list_date"].astype(str)
     if "ts_code" in df.columns:
@@ -291,8 +482,7 @@ def _read_json_object(
     if data is None:
         return None
     try:
-        text = data.decode(encoding, errors="ignore")
-        return json.loads(text)
+        return _json_loads(data, encoding)
     except Exception:
         return None
 
@@ -333,4 +523,120 @@ def get_code_dict(datestr: Optional[str] = None) -> dict:
     for _, row in df.iterrows():
         ts = str(row.get("ts_code"))
         result[ts] = {k: (None if pd.isna(v) else v) for k, v in row.to_dict().items()}
-    return result
\ No newline at end of file
+    return result
+
+
+# ---------------------------------------------------------------------------
+# 异步版本：基于 MinIOFileDownloaderAsync，可在同一事件循环中并发读取多个列表
+# ---------------------------------------------------------------------------
+
+async def _aread_info_latest_df(
+    prefix: str,
+    *,
+    valid_suffixes: Sequence[str] = (".csv", ".csv.gz", ".csv.gzip", ".parquet"),
+    file_type: str = "auto",
+    bucket_type: str = "trader_data",
+    config: Optional[MinIOConfig] = None,
+    filter_expr: Optional[pc.Expression] = None,
+    downloader=None,
+) -> pd.DataFrame:
+    from .async_downloader import MinIOFileDownloaderAsync
+
+    cfg = config or get_config()
+    bucket = cfg.get_bucket(bucket_type)
+    dl = downloader or MinIOFileDownloaderAsync(cfg)
+    list_prefix = f"info/{prefix.lstrip('/')}"
+    objs = await dl.alist_objects(bucket, prefix=list_prefix, recursive=True)
+    latest = _pick_latest_object(objs, valid_suffixes)
+    if latest is None:
+        return pd.DataFrame()
+    key = (bucket, latest["object_name"], latest.get("etag"))
+    df = _info_cache_get(key, filter_expr)
+    if df is not None:
+        return df
+    name = _info_object_name(latest["object_name"])
+    df = _with_list_date_int(_parse_info_bytes(name, await dl.adownload_data(bucket, name), file_type=file_type, filter_expr=filter_expr))
+    if filter_expr is None:
+        # 只缓存完整快照，过滤结果因条件而异
+        _info_cache_put(key, df)
+    return df
+
+
+async def get_code_list_async(
+    exclude_exch_list: List[str] | None = None,
+    list_date_before: str = "99999999",
+    exclude_market_list: List[str] | None = None,
+    *,
+    config: Optional[MinIOConfig] = None,
+    downloader=None,
+) -> List[str]:
+    df = await _aread_info_latest_df("stock_basic_listed.", config=config, downloader=downloader)
+    return _filter_code_list(df, exclude_exch_list, list_date_before, exclude_market_list)
+
+
+async def get_index_list_async(
+    include_exch_list: Union[List[str], str] = ("SZ", "SH"),
+    *,
+    config: Optional[MinIOConfig] = None,
+    downloader=None,
+) -> List[str]:
+    df = await _aread_info_latest_df("index_basic.", config=config, downloader=downloader)
+    return _filter_index_list(df, include_exch_list)
+
+
+async def get_fund_code_list_async(
+    market: str = "SZSH",
+    *,
+    config: Optional[MinIOConfig] = None,
+    downloader=None,
+) -> List[str]:
+    df = await _aread_info_latest_df("fund_listed_basic.", config=config, downloader=downloader)
+    if df is None or df.empty:
+        df = await _aread_info_latest_df("fund_basic.", config=config, downloader=downloader)
+        if df is None or df.empty:
+            return []
+        df = _filter_fund_basic_listed(df)
+    return _filter_fund_code_list(df)
+
+
+async def get_basic_df_async(
+    *,
+    config: Optional[MinIOConfig] = None,
+    downloader=None,
+) -> pd.DataFrame:
+    """get_basic_df 的异步版本（仅读取最新快照）"""
+    df = await _aread_info_latest_df("stock_basic_listed.", config=config, downloader=downloader)
+    if df is None or df.empty:
+        df = await _aread_info_latest_df("stock_basic.", config=config, downloader=downloader)
+    return _finalize_basic_df(df)
+
+
+async def get_all_lists(config: Optional[MinIOConfig] = None) -> Dict[str, Union[List[str], pd.DataFrame]]:
+    """
+    在一个事件循环中并发读取股票/指数/基金列表与基础信息表，
+    总耗时约等于最慢的一次读取，而不是各次读取之和。
+
+    Returns:
+        dict: {"code_list", "index_list", "fund_code_list", "basic_df"}
+    """
+    from .async_downloader import MinIOFileDownloaderAsync
+
+    cfg = config or get_config()
+    async with MinIOFileDownloaderAsync(cfg) as dl:
+        code_list, index_list, fund_code_list, basic_df = await asyncio.gather(
+            get_code_list_async(config=cfg, downloader=dl),
+            get_index_list_async(config=cfg, downloader=dl),
+            get_fund_code_list_async(config=cfg, downloader=dl),
+            get_basic_df_async(config=cfg, downloader=dl),
+        )
+    return {
+        "code_list": code_list,
+        "index_list": index_list,
+        "fund_code_list": fund_code_list,
+        "basic_df": basic_df,
+    }
+
+
+def get_all_lists_sync(config: Optional[MinIOConfig] = None) -> Dict[str, Union[List[str], pd.DataFrame]]:
+    """get_all_lists 的同步封装"""
+    return asyncio.run(get_all_lists(config=config))
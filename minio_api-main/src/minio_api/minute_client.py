@@ -1,10 +1,14 @@
 # 文件：/home/ubuntu/TradeNew/infra/open/minio_api/src/minio_api/minute_client.py
 import os
 import logging
-from typing import Optional, Union, List, Callable, Any
+import time
+from collections import namedtuple
+from functools import lru_cache, reduce
+from typing import Optional, Union, List, Callable, Any, Sequence, Iterator
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.fs as pafs
 
@@ -28,6 +32,92 @@ def _default_minute_schema() -> pa.Schema:
     ])
 
 
+@lru_cache(maxsize=16)
+def _get_s3fs(
+    endpoint_override: str,
+    access_key: str,
+    secret_key: str,
+    connect_timeout: float,
+    request_timeout: float,
+) -> pafs.S3FileSystem:
+    """进程内按端点/凭证复用 S3FileSystem，多个客户端实例共享同一个 HTTP 连接池"""
+    return pafs.S3FileSystem(
+        access_key=access_key,
+        secret_key=secret_key,
+        endpoint_override=endpoint_override,
+        connect_timeout=connect_timeout,
+        request_timeout=request_timeout,
+    )
+
+
+def _month_filter(start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> ds.Expression:
+    """
+    由起止时间枚举 (year, month)，按年生成 year == y & month.isin([...])，
+    得到精确且更小的分区裁剪表达式（分区列已是 int32，无需 cast）
+    """
+    months_by_year = {}
+    y, m = start_ts.year, start_ts.month
+    while (y, m) <= (end_ts.year, end_ts.month):
+        months_by_year.setdefault(y, []).append(m)
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+
+    year_field = ds.field("year")
+    month_field = ds.field("month")
+    expr = None
+    for year, months in months_by_year.items():
+        cond = year_field == year
+        if len(months) < 12:
+            cond = cond & month_field.isin(months)
+        expr = cond if expr is None else (expr | cond)
+    # 起始时间晚于结束时间：不匹配任何分区
+    return expr if expr is not None else ds.scalar(False)
+
+
+def _between(field: ds.Expression, lower: pa.Scalar, upper: pa.Scalar) -> ds.Expression:
+    """lower <= field <= upper，两个比较合成一个 and_kleene 节点"""
+    return pc.and_kleene(field >= lower, field <= upper)
+
+
+def _row_type(columns: Sequence[str]):
+    """
+    构造行类型：namedtuple 子类，既支持 row.close 属性访问，也兼容 row["close"] / row.get("close")，
+    不需要像 iterrows 那样为每一行构造 pd.Series
+    """
+    base = namedtuple("Row", columns, rename=True)
+    index = {c: i for i, c in enumerate(columns)}
+
+    class Row(base):
+        __slots__ = ()
+        _index = index
+
+        def __getitem__(self, key):
+            if isinstance(key, str):
+                return tuple.__getitem__(self, self._index[key])
+            return tuple.__getitem__(self, key)
+
+        def get(self, key, default=None):
+            i = self._index.get(key)
+            return default if i is None else tuple.__getitem__(self, i)
+
+        def keys(self):
+            return self._index.keys()
+
+    return Row
+
+
+def _column_values(col: Union[pa.Array, pa.ChunkedArray]) -> Sequence[Any]:
+    """
+    取一列的逐行值：无空值的浮点列走 to_numpy（整块转换，np.float64 即 float 子类），
+    时间戳列经 pandas 转换为 pd.Timestamp（与原先 iterrows 的取值类型一致），
+    其余列（字符串、整数、含空值）用 to_pylist
+    """
+    if col.null_count == 0 and pa.types.is_floating(col.type):
+        return col.to_numpy()
+    if pa.types.is_timestamp(col.type):
+        return col.to_pandas().tolist()
+    return col.to_pylist()
+
+
 class MinIOMinuteDataClient:
     """
     从 MinIO 上读取按 Hive(year=/month=) 分区的分钟级 Parquet（PyArrow Dataset 版）。
@@ -47,7 +137,9 @@ class MinIOMinuteDataClient:
         bucket_type: str = "data",
         base_prefix: Optional[str] = None,
         schema: Optional[pa.Schema] = None,
-        builder: Optional[Callable[[pd.Series], Any]] = None,
+        builder: Optional[Callable[[Any], Any]] = None,
+        zero_copy: bool = True,
+        builder_positional: bool = False,
         **kwargs,
     ):
         self.config = config or get_config()
@@ -58,20 +150,39 @@ class MinIOMinuteDataClient:
 
         # 文件内 schema（不含分区列）
         self.file_schema = schema or _default_minute_schema()
+        # 过滤标量与 trade_time 列类型保持一致（ms/us/ns 均可），谓词可直接下推到 row group 统计信息
+        self._ts_type = self.file_schema.field("trade_time").type
         # 可选的构造器，用于 output_type='list' 时构建对象（如 MinuteKLineData）
+        # builder 接收一行数据（namedtuple 风格的 Row，支持 row.col 与 row["col"]）；
+        # builder_positional=True 时改为按列顺序以位置参数调用 builder(*values)
         self.builder = builder
+        self.builder_positional = builder_positional
+        # output_type='df' 时使用 Arrow 后端的 DataFrame（pd.ArrowDtype 列，零拷贝转换）
+        self.zero_copy = zero_copy
 
         # 构造 PyArrow 的 S3 FileSystem（MinIO 兼容）
         endpoint = self.config.endpoint  # 形如 "localhost:9000" 或 "minio:9000"
         secure = self.config.secure
         endpoint_override = f"http{'s' if secure else ''}://{endpoint}"
 
-        self.s3fs = pafs.S3FileSystem(
-            access_key=self.config.access_key,
-            secret_key=self.config.secret_key,
-            endpoint_override=endpoint_override,
+        self.s3fs = _get_s3fs(
+            endpoint_override,
+            self.config.access_key,
+            self.config.secret_key,
+            kwargs.get("connect_timeout", 10),
+            kwargs.get("request_timeout", 30),
         )
 
+        # 缓存分区 Dataset，避免每次查询都重新 LIST year=/month= 目录；
+        # 超过 dataset_ttl 秒（None 表示不过期）或调用 invalidate_cache() 后重建，以发现新写入的分区
+        self.dataset_ttl: Optional[float] = kwargs.get("dataset_ttl", 300)
+        self._ds_cache: Optional[ds.Dataset] = None
+        self._ds_built_at = 0.0
+        # 扫描参数：多线程解码 row group，较大批次摊薄逐批开销；fragment_readahead 控制并发预读的文件数
+        self.batch_size = int(kwargs.get("batch_size", 2 ** 17))
+        self.use_threads = bool(kwargs.get("use_threads", True))
+        self.fragment_readahead = int(kwargs.get("fragment_readahead", 8))
+
         logger.info(
             f"MinIOMinuteDataClient ready. bucket={self.bucket_name}, "
             f"base_prefix='{self.base_prefix}', endpoint={endpoint_override}"
@@ -94,46 +205,155 @@ class MinIOMinuteDataClient:
         # 数据列 + 分区列
         return pa.schema(list(self.file_schema) + list(self._partitioning().schema))
 
+    @staticmethod
+    def _parquet_format() -> ds.ParquetFileFormat:
+        # pre_buffer：合并相邻的列块读取范围并异步预取，每个 row group 只需少量大 GET，
+        # 代价是峰值内存多占约一个 row group
+        return ds.ParquetFileFormat(
+            default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+                pre_buffer=True,
+                use_buffered_stream=False,
+            )
+        )
+
     def _build_dataset(self) -> ds.Dataset:
         # 指向分区根目录（包含 year=/month= 子目录）
         return ds.dataset(
             self._root_uri(),
             filesystem=self.s3fs,
-            format="parquet",
+            format=self._parquet_format(),
             schema=self._full_schema(),
             partitioning=self._partitioning(),
         )
 
+    @property
+    def _dataset(self) -> ds.Dataset:
+        now = time.monotonic()
+        expired = self.dataset_ttl is not None and now - self._ds_built_at > self.dataset_ttl
+        if self._ds_cache is None or expired:
+            self._ds_cache = self._build_dataset()
+            self._ds_built_at = now
+        return self._ds_cache
+
+    def invalidate_cache(self):
+        """清除缓存的 Dataset，下次查询时重新发现分区文件"""
+        self._ds_cache = None
+
+    def _scanner(self, dataset: ds.Dataset, filter_cond, columns: Optional[List[str]] = None,
+                 batch_size: Optional[int] = None) -> ds.Scanner:
+        return dataset.scanner(
+            columns=columns,
+            filter=filter_cond,
+            batch_size=batch_size or self.batch_size,
+            use_threads=self.use_threads,
+            fragment_readahead=self.fragment_readahead,
+        )
+
     @staticmethod
     def _validate_output_type(output_type: str):
-        if output_type not in ("df", "list"):
-            raise ValueError("Unsupported output_type, choose 'df' or 'list'.")
+        if output_type not in ("df", "list", "iter"):
+            raise ValueError("Unsupported output_type, choose 'df', 'list' or 'iter'.")
+
+    def _validate_columns(self, columns: Optional[List[str]]) -> Optional[List[str]]:
+        if columns is None:
+            return None
+        valid = set(self._full_schema().names)
+        unknown = [c for c in columns if c not in valid]
+        if unknown:
+            raise ValueError(f"Unknown columns: {unknown}, available: {sorted(valid)}")
+        return list(columns)
 
     def _apply_filter_and_collect(
         self,
         dataset: ds.Dataset,
         filter_cond,
         output_type: str,
+        columns: Optional[List[str]] = None,
     ):
-        table = dataset.to_table(filter=filter_cond)
-        df = table.to_pandas()
-        if df.empty:
-            return df if output_type == "df" else []
-
-        # 排序
-        if "trade_time" in df.columns:
-            df.sort_values("trade_time", inplace=True)
+        if output_type in ("list", "iter") and self.builder is None:
+            raise ValueError(f"output_type='{output_type}' 需要在初始化时提供 builder 可调用对象。")
+        if output_type == "iter":
+            return self._iter_batches(dataset, filter_cond, columns)
+
+        # 列裁剪：只读取需要的列（Parquet 未选中的列不会下载和解码）；
+        # 排序依赖 trade_time，未选中时临时带上，排序后再去掉
+        read_columns = columns
+        drop_sort_col = columns is not None and "trade_time" not in columns
+        if drop_sort_col:
+            read_columns = columns + ["trade_time"]
+        table = self._scanner(dataset, filter_cond, read_columns).to_table()
+        # 排序在 Arrow 层完成，转换后的结果直接保持有序
+        if table.num_rows and "trade_time" in table.schema.names:
+            table = table.sort_by([("trade_time", "ascending")])
+        if drop_sort_col:
+            table = table.drop(["trade_time"])
 
         if output_type == "df":
+            df = self._table_to_df(table)
+            del table
             return df
 
-        # output_type == 'list'
-        if self.builder is None:
-            raise ValueError("output_type='list' 需要在初始化时提供 builder 可调用对象。")
-        items = []
-        for _, row in df.iterrows():
-            items.append(self.builder(row))
-        return items
+        # output_type == 'list'：不经过 pandas，直接按列读取 Arrow 数据
+        if table.num_rows == 0:
+            return []
+        return list(self._build_items(table))
+
+    def _iter_batches(
+        self,
+        dataset: ds.Dataset,
+        filter_cond,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 65536,
+    ) -> Iterator[Any]:
+        """
+        按 RecordBatch 流式产出 builder 对象，峰值内存约为一个批次。
+        不做全局排序：顺序为分区文件顺序（year/month）及文件内写入顺序。
+        """
+        for batch in self._scanner(dataset, filter_cond, columns, batch_size=batch_size).to_batches():
+            if batch.num_rows:
+                yield from self._build_items(batch)
+
+    def _build_items(self, data: Union[pa.Table, pa.RecordBatch]) -> Iterator[Any]:
+        """
+        按列取值后 zip 成行交给 builder。builder_positional=True 时
+        （如按列顺序定义字段的 MinuteKLineData），直接 builder(*values)，省去 Row 的构造
+        """
+        names = data.schema.names
+        cols = [_column_values(col) for col in data.columns]
+        builder = self.builder
+        if self.builder_positional:
+            for t in zip(*cols):
+                yield builder(*t)
+        else:
+            make = _row_type(names)._make
+            for t in zip(*cols):
+                yield builder(make(t))
+
+    def _table_to_df(self, table: pa.Table) -> pd.DataFrame:
+        if not self.zero_copy:
+            return table.to_pandas()
+        # split_blocks 避免 BlockManager 合并拷贝，self_destruct 边转换边释放 Arrow 缓冲区；
+        # 转换后 table 不可再使用
+        return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+    def _build_filter(self, symbol, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> ds.Expression:
+        """
+        分区裁剪（year/month）+ 时间区间 + 代码条件，按列表一次性合成单个 and_kleene 表达式
+        """
+        conds = [
+            _month_filter(start_ts, end_ts),
+            _between(
+                ds.field("trade_time"),
+                pa.scalar(start_ts, type=self._ts_type),
+                pa.scalar(end_ts, type=self._ts_type),
+            ),
+        ]
+        if isinstance(symbol, list):
+            if symbol:
+                conds.append(ds.field("ts_code").isin(symbol))
+        elif symbol not in ("all", None):
+            conds.append(ds.field("ts_code") == symbol)
+        return reduce(pc.and_kleene, conds)
 
     def fetch_minute_data(
         self,
@@ -141,6 +361,7 @@ class MinIOMinuteDataClient:
         start_datetime: str,
         end_datetime: str,
         output_type: str = "df",
+        columns: Optional[List[str]] = None,
     ):
         """
         精确到时间戳区间的分钟数据读取。
@@ -149,9 +370,11 @@ class MinIOMinuteDataClient:
             symbol: 单个 ts_code、ts_code 列表、'all'/None
             start_datetime: 形如 "YYYY-MM-DD HH:MM:SS"
             end_datetime: 形如 "YYYY-MM-DD HH:MM:SS"
-            output_type: 'df' | 'list'
+            output_type: 'df' | 'list' | 'iter'（生成器，按批次流式产出 builder 对象）
+            columns: 只读取的列（如 ["ts_code", "trade_time", "close"]），None 表示全部列
         """
         self._validate_output_type(output_type)
+        columns = self._validate_columns(columns)
 
         try:
             start_ts = pd.to_datetime(start_datetime, errors="raise")
@@ -159,37 +382,20 @@ class MinIOMinuteDataClient:
         except Exception as e:
             raise ValueError(f"Invalid datetime format: {e}") from e
 
-        # 分区裁剪条件：year/month（尽可能缩小扫描范围）
-        year_field = ds.field("year")
-        month_field = ds.field("month")
-        start_year, start_month = start_ts.year, start_ts.month
-        end_year, end_month = end_ts.year, end_ts.month
-
-        partition_filter = (
-            ((year_field.cast("int32") > start_year) |
-             ((year_field.cast("int32") == start_year) & (month_field.cast("int32") >= start_month)))
-            &
-            ((year_field.cast("int32") < end_year) |
-             ((year_field.cast("int32") == end_year) & (month_field.cast("int32") <= end_month)))
-        )
+        filter_cond = self._build_filter(symbol, start_ts, end_ts)
 
-        # 数据条件
-        time_filter = (
-            (ds.field("trade_time") >= pa.scalar(start_ts, type=pa.timestamp("ms"))) &
-            (ds.field("trade_time") <= pa.scalar(end_ts, type=pa.timestamp("ms")))
-        )
-        if symbol in ("all", None) or (isinstance(symbol, list) and len(symbol) == 0):
-            symbol_filter = None
-        elif isinstance(symbol, list):
-            symbol_filter = ds.field("ts_code").isin(symbol)
-        else:
-            symbol_filter = (ds.field("ts_code") == symbol)
-
-        data_filter = time_filter if symbol_filter is None else (time_filter & symbol_filter)
-        filter_cond = partition_filter & data_filter
+        dataset = self._dataset
+        return self._apply_filter_and_collect(dataset, filter_cond, output_type, columns=columns)
 
-        dataset = self._build_dataset()
-        return self._apply_filter_and_collect(dataset, filter_cond, output_type)
+    def iter_minute_data(
+        self,
+        symbol: Union[str, List[str], None],
+        start_datetime: str,
+        end_datetime: str,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[Any]:
+        """等价于 fetch_minute_data(..., output_type='iter')，按批次流式产出 builder 对象"""
+        return self.fetch_minute_data(symbol, start_datetime, end_datetime, output_type="iter", columns=columns)
 
     def fetch_daily_data(
         self,
@@ -197,12 +403,15 @@ class MinIOMinuteDataClient:
         start_date: str,
         end_date: str,
         output_type: str = "df",
+        columns: Optional[List[str]] = None,
     ):
         """
         以日期区间读取（按天，上下界自动扩展到全天）。
         start_date/end_date: 形如 "YYYYMMDD"
+        columns: 只读取的列，None 表示全部列
         """
         self._validate_output_type(output_type)
+        columns = self._validate_columns(columns)
 
         try:
             start_ts = pd.to_datetime(start_date, format="%Y%m%d", errors="raise")
@@ -212,35 +421,10 @@ class MinIOMinuteDataClient:
         except Exception as e:
             raise ValueError(f"Invalid date format: {e}") from e
 
-        year_field = ds.field("year")
-        month_field = ds.field("month")
-        start_year, start_month = start_ts.year, start_ts.month
-        end_year, end_month = end_ts.year, end_ts.month
-
-        partition_filter = (
-            ((year_field.cast("int32") > start_year) |
-             ((year_field.cast("int32") == start_year) & (month_field.cast("int32") >= start_month)))
-            &
-            ((year_field.cast("int32") < end_year) |
-             ((year_field.cast("int32") == end_year) & (month_field.cast("int32") <= end_month)))
-        )
-
-        time_filter = (
-            (ds.field("trade_time") >= pa.scalar(start_ts, type=pa.timestamp("ms"))) &
-            (ds.field("trade_time") <= pa.scalar(end_ts, type=pa.timestamp("ms")))
-        )
-        if symbol in ("all", None) or (isinstance(symbol, list) and len(symbol) == 0):
-            symbol_filter = None
-        elif isinstance(symbol, list):
-            symbol_filter = ds.field("ts_code").isin(symbol)
-        else:
-            symbol_filter = (ds.field("ts_code") == symbol)
-
-        data_filter = time_filter if symbol_filter is None else (time_filter & symbol_filter)
-        filter_cond = partition_filter & data_filter
+        filter_cond = self._build_filter(symbol, start_ts, end_ts)
 
-        dataset = self._build_dataset()
-        return self._apply_filter_and_collect(dataset, filter_cond, output_type)
+        dataset = self._dataset
+        return self._apply_filter_and_collect(dataset, filter_cond, output_type, columns=columns)
 
 
 def get_minute_data_from_minio(
@@ -253,23 +437,31 @@ def get_minute_data_from_minio(
     config: Optional[MinIOConfig] = None,
     bucket_type: str = "data",
     base_prefix: Optional[str] = 'minutely',
-    builder: Optional[Callable[[pd.Series], Any]] = None,
-) -> Union[pd.DataFrame, List[Any]]:
+    builder: Optional[Callable[[Any], Any]] = None,
+    zero_copy: bool = True,
+    columns: Optional[List[str]] = None,
+    builder_positional: bool = False,
+) -> Union[pd.DataFrame, List[Any], Iterator[Any]]:
     """
     便捷函数：
       - symbol=None/"all": 读取所有股票数据.
       - by='datetime': start/end 传 "YYYY-MM-DD HH:MM:SS"
       - by='date':     start/end 传 "YYYYMMDD"
+      - columns: 只读取的列，None 表示全部列
+      - output_type='iter': 返回生成器，按批次流式产出 builder 对象（不做全局排序）
+      - builder_positional: True 时以各列值作为位置参数调用 builder，否则传入一行 Row
     """
     client = MinIOMinuteDataClient(
         config=config,
         bucket_type=bucket_type,
         base_prefix=base_prefix,
         builder=builder,
+        zero_copy=zero_copy,
+        builder_positional=builder_positional,
     )
     if by == "datetime":
-        return client.fetch_minute_data(symbol, start, end, output_type=output_type)
+        return client.fetch_minute_data(symbol, start, end, output_type=output_type, columns=columns)
     elif by == "date":
-        return client.fetch_daily_data(symbol, start, end, output_type=output_type)
+        return client.fetch_daily_data(symbol, start, end, output_type=output_type, columns=columns)
     else:
         raise ValueError("by 参数仅支持 'datetime' 或 'date'")
\ No newline at end of file
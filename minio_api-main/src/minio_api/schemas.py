@@ -3,9 +3,14 @@ Schema管理模块 - 整合不同数据源的schema定义
 基于data_dev的schema设计，提供统一的数据类型支持
 """
 import logging
-from typing import Dict, Any, Optional, List
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from pathlib import Path
 
+import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 # 数据类型到路径的映射
@@ -142,6 +147,87 @@ DATA_TYPE_CONFIG = {
     }
 }
 
+# Python 3.10+ 使用 slots，属性访问为固定偏移，不经过实例 __dict__
+_DATACLASS_KWARGS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@dataclass(**_DATACLASS_KWARGS)
+class ColSpec:
+    """单列定义"""
+    dtype: str
+    fillna: Any = None
+
+
+@dataclass(**_DATACLASS_KWARGS)
+class DataTypeSpec:
+    """数据类型定义（导入时构建一次，只读）"""
+    date_column: str
+    symbol_column: str
+    description: str
+    schema: Mapping[str, ColSpec]
+    arrow_schema: pa.Schema
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为旧版 DATA_TYPE_CONFIG 的字典格式"""
+        schema = {}
+        for name, col in self.schema.items():
+            schema[name] = {'dtype': col.dtype} if col.fillna is None else {'dtype': col.dtype, 'fillna': col.fillna}
+        return {
+            'date_column': self.date_column,
+            'symbol_column': self.symbol_column,
+            'description': self.description,
+            'schema': schema,
+        }
+
+
+_ARROW_TYPES = {
+    'str': pa.string(),
+    'float64': pa.float64(),
+    'float32': pa.float32(),
+    'int64': pa.int64(),
+    'int32': pa.int32(),
+    'datetime64[ns]': pa.timestamp('ns'),
+}
+
+
+def _to_arrow_schema(cols: Mapping[str, ColSpec]) -> pa.Schema:
+    return pa.schema([pa.field(name, _ARROW_TYPES[col.dtype]) for name, col in cols.items()])
+
+
+def _build_spec(data_type: str, config: Dict[str, Any]) -> DataTypeSpec:
+    cols = MappingProxyType({
+        name: ColSpec(dtype=col['dtype'], fillna=col.get('fillna'))
+        for name, col in config.get('schema', {}).items()
+    })
+    return DataTypeSpec(
+        date_column=config.get('date_column', 'trade_date'),
+        symbol_column=config.get('symbol_column', 'ts_code'),
+        description=config.get('description', f'{data_type}数据'),
+        schema=cols,
+        arrow_schema=_to_arrow_schema(cols),
+    )
+
+
+# 所有支持的数据类型的只读注册表；未在 DATA_TYPE_CONFIG 中定义的类型使用默认配置
+DATA_TYPE_SPECS: Mapping[str, DataTypeSpec] = MappingProxyType({
+    data_type: _build_spec(data_type, DATA_TYPE_CONFIG.get(data_type, {}))
+    for data_type in DATA_TYPE_PATHS
+})
+
+
+def _config_view(spec: DataTypeSpec) -> Mapping[str, Any]:
+    """旧版字典格式的只读视图（各层均为 MappingProxyType）"""
+    config = spec.to_dict()
+    config['schema'] = MappingProxyType({name: MappingProxyType(col) for name, col in config['schema'].items()})
+    return MappingProxyType(config)
+
+
+# get_config/get_schema 返回的字典视图：每种数据类型导入时构建一次，查询时不再分配
+DATA_TYPE_CONFIG_VIEWS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    data_type: _config_view(spec) for data_type, spec in DATA_TYPE_SPECS.items()
+})
+
+
 class SchemaManager:
     """Schema管理器 - 提供统一的数据类型支持"""
     
@@ -167,38 +253,39 @@ class SchemaManager:
             raise ValueError(f"不支持的数据类型: {data_type}")
         return DATA_TYPE_PATHS[data_type]
     
-    def get_config(self, data_type: str) -> Dict[str, Any]:
-        """获取数据类型的配置信息"""
-        if not self.is_supported(data_type):
+    def get_spec(self, data_type: str) -> DataTypeSpec:
+        """获取数据类型的预构建定义"""
+        spec = DATA_TYPE_SPECS.get(data_type)
+        if spec is None:
             raise ValueError(f"不支持的数据类型: {data_type}")
-        
-        # 返回基础配置，如果没有定义则使用默认配置
-        return DATA_TYPE_CONFIG.get(data_type, {
-            'date_column': 'trade_date',
-            'symbol_column': 'ts_code',
-            'description': f'{data_type}数据',
-            'schema': {}
-        })
+        return spec
+    
+    def get_config(self, data_type: str) -> Mapping[str, Any]:
+        """获取数据类型的配置信息（字典格式的只读视图，兼容旧接口；需要修改时请先复制）"""
+        config = DATA_TYPE_CONFIG_VIEWS.get(data_type)
+        if config is None:
+            raise ValueError(f"不支持的数据类型: {data_type}")
+        return config
     
     def get_date_column(self, data_type: str) -> str:
         """获取日期列名"""
-        config = self.get_config(data_type)
-        return config.get('date_column', 'trade_date')
+        return self.get_spec(data_type).date_column
     
     def get_symbol_column(self, data_type: str) -> str:
         """获取标的代码列名"""
-        config = self.get_config(data_type)
-        return config.get('symbol_column', 'ts_code')
+        return self.get_spec(data_type).symbol_column
+    
+    def get_schema(self, data_type: str) -> Mapping[str, Any]:
+        """获取数据类型的schema定义（只读视图）"""
+        return self.get_config(data_type)['schema']
     
-    def get_schema(self, data_type: str) -> Dict[str, Any]:
-        """获取数据类型的schema定义"""
-        config = self.get_config(data_type)
-        return config.get('schema', {})
+    def get_arrow_schema(self, data_type: str) -> pa.Schema:
+        """获取预构建的 Arrow schema"""
+        return self.get_spec(data_type).arrow_schema
     
     def get_description(self, data_type: str) -> str:
         """获取数据类型的描述"""
-        config = self.get_config(data_type)
-        return config.get('description', f'{data_type}数据')
+        return self.get_spec(data_type).description
     
     def list_all_types(self) -> Dict[str, str]:
         """列出所有数据类型及其描述"""
@@ -223,6 +310,6 @@ def get_data_type_path(data_type: str) -> str:
     """获取数据类型的MinIO路径"""
     return schema_manager.get_path_prefix(data_type)
 
-def get_data_type_config(data_type: str) -> Dict[str, Any]:
+def get_data_type_config(data_type: str) -> Mapping[str, Any]:
     """获取数据类型的完整配置"""
     return schema_manager.get_config(data_type)
\ No newline at end of file
@@ -1,9 +1,15 @@
 # src/minio_api/tick_client.py
 import os
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Optional, List, Set, Tuple
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import duckdb
 from minio import Minio
 from minio.error import S3Error
@@ -12,6 +18,29 @@ from .config import get_config, MinIOConfig
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=16)
+def _get_duckdb(s3_settings: Tuple[str, ...]) -> "duckdb.DuckDBPyConnection":
+    """按 S3 设置复用 DuckDB 数据库实例：httpfs 只安装/加载一次，HTTP 元数据缓存在客户端实例间共享"""
+    conn = duckdb.connect()
+    conn.execute("INSTALL httpfs;")
+    conn.execute("LOAD httpfs;")
+    for stmt in s3_settings:
+        conn.execute(stmt)
+    return conn
+
+
+@lru_cache(maxsize=16)
+def _get_minio(endpoint: str, access_key: str, secret_key: str, secure: bool) -> Minio:
+    """按端点/凭证复用 Minio 客户端（及其 urllib3 连接池）"""
+    return Minio(endpoint=endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
+
+# 需要保证为数值类型的 Tick 列
+_NUMERIC_COLS = frozenset(
+    ["last", "volume", "open_interest", "turnover"]
+    + [f"{k}{i}" for i in range(1, 6) for k in ("bid", "ask", "bid_vol", "ask_vol")]
+)
+
 class MinIOTickDataClient:
     """
     读取期货 Tick/OrderBook 数据（Parquet），仅返回 DataFrame（DuckDB 版）。
@@ -30,25 +59,33 @@ class MinIOTickDataClient:
         self.config = config or get_config()
         self.bucket_name = kwargs.get("bucket_name", self.config.get_bucket(bucket_type))
 
-        # DuckDB + httpfs
-        self.conn = duckdb.connect()
-        self.conn.execute("INSTALL httpfs;")
-        self.conn.execute("LOAD httpfs;")
-
         endpoint = kwargs.get("endpoint", self.config.endpoint)
         access_key = kwargs.get("access_key", self.config.access_key)
         secret_key = kwargs.get("secret_key", self.config.secret_key)
         secure = kwargs.get("secure", self.config.secure)
 
         endpoint_hostport = endpoint.split("://")[-1]
-        self.conn.execute(f"SET s3_endpoint='{endpoint_hostport}';")
-        self.conn.execute(f"SET s3_access_key_id='{access_key}';")
-        self.conn.execute(f"SET s3_secret_access_key='{secret_key}';")
-        self.conn.execute(f"SET s3_use_ssl={'true' if secure else 'false'};")
-        self.conn.execute("SET s3_url_style='path';")
+        # 保留设置语句，供并发查询时的独立 cursor 复用
+        self._s3_settings = (
+            f"SET s3_endpoint='{endpoint_hostport}';",
+            f"SET s3_access_key_id='{access_key}';",
+            f"SET s3_secret_access_key='{secret_key}';",
+            f"SET s3_use_ssl={'true' if secure else 'false'};",
+            "SET s3_url_style='path';",
+        )
+        # DuckDB + httpfs：相同 S3 设置的客户端共享同一数据库实例（httpfs 只加载一次），
+        # 每个客户端使用自己的 cursor，互不共享事务状态
+        self.conn = self._cursor(_get_duckdb(self._s3_settings))
+        # 按天回退查询的并发度
+        self.max_workers = int(kwargs.get("max_workers", 16))
+        # 同一交易所的 parquet schema 稳定，缓存 (time_col, cols) 以省去每次查询前的 footer 读取
+        self._schema_cache: Dict[str, Tuple[Optional[str], List[str]]] = {}
+        self._schema_lock = threading.Lock()
+        # 按查询形状 (has_symbol, has_contract, time_col) 缓存 SQL 文本，取值全部参数绑定
+        self._sql_cache: Dict[Tuple[bool, bool, str], str] = {}
 
         # MinIO 客户端（用于存在性检查、列目录）
-        self.mcli = Minio(endpoint=endpoint_hostport, access_key=access_key, secret_key=secret_key, secure=secure)
+        self.mcli = _get_minio(endpoint_hostport, access_key, secret_key, secure)
 
         env_prefix = os.getenv("MINIO_TICK_PREFIX", "")
         self.base_prefix = (base_prefix if base_prefix is not None else env_prefix).strip("/")
@@ -103,9 +140,57 @@ class MinIOTickDataClient:
                 names.append(o.object_name)
         return names
 
-    def _detect_schema(self, uri: str) -> Tuple[Optional[str], List[str]]:
+    def _list_range_parquets(self, exchange: str, start_yyyymmdd: str, end_yyyymmdd: str) -> Set[str]:
+        """
+        一次 LIST 扫描取回区间内所有按天目录下的 parquet 对象路径，
+        替代逐日 stat_object（每天一次 HEAD 往返）
+        """
+        exch_prefix = f"{self._prefix_root()}tickly/fut_main/{exchange}/"
+        start_path = self._date_path(start_yyyymmdd)
+        end_path = self._date_path(end_yyyymmdd)
+        names: Set[str] = set()
+        # 对象按 key 字典序返回：从起始日目录开始，越过结束日即可停止
+        objs = self.mcli.list_objects(
+            self.bucket_name, prefix=exch_prefix, recursive=True, start_after=exch_prefix + start_path
+        )
+        for o in objs:
+            name = o.object_name
+            rel = name[len(exch_prefix):]
+            day_path, _, file_name = rel.rpartition("/")
+            if day_path > end_path:
+                break
+            if day_path < start_path or len(day_path) != 10 or not file_name.endswith(".parquet"):
+                continue
+            names.add(name)
+        return names
+
+    def _cursor(self, conn=None) -> "duckdb.DuckDBPyConnection":
+        """为工作线程创建独立 cursor（共享同一数据库，事务状态相互独立）"""
+        cur = (conn or self.conn).cursor()
+        for stmt in self._s3_settings:
+            cur.execute(stmt)
+        return cur
+
+    def clear_schema_cache(self):
+        """清除按交易所缓存的 schema（数据格式变更时调用）"""
+        with self._schema_lock:
+            self._schema_cache.clear()
+
+    def _detect_schema(self, exchange: str, uri: str, conn=None) -> Tuple[Optional[str], List[str]]:
+        with self._schema_lock:
+            cached = self._schema_cache.get(exchange)
+        if cached is not None:
+            return cached
+        time_col, cols = self._read_schema(uri, conn=conn)
+        if time_col:
+            with self._schema_lock:
+                self._schema_cache[exchange] = (time_col, cols)
+        return time_col, cols
+
+    def _read_schema(self, uri: str, conn=None) -> Tuple[Optional[str], List[str]]:
+        conn = conn or self.conn
         try:
-            cols = self.conn.execute(f"SELECT * FROM read_parquet('{uri}') LIMIT 0").df().columns.tolist()
+            cols = conn.execute(f"SELECT * FROM read_parquet('{uri}') LIMIT 0").df().columns.tolist()
             time_col = None
             for cand in ("modify_dt", "datetime"):
                 if cand in cols:
@@ -118,58 +203,102 @@ class MinIOTickDataClient:
 
     def _query_files(
         self,
+        exchange: str,
         uris: List[str],
         start_time: str,
         end_time: str,
         symbol: Optional[str] = None,
-        contract_type: Optional[str] = None
-    ) -> pd.DataFrame:
+        contract_type: Optional[str] = None,
+        conn=None,
+    ) -> Optional[pa.Table]:
+        """查询一组 parquet 文件，返回 Arrow 表（无数据或失败返回 None）"""
         if not uris:
-            return pd.DataFrame()
+            return None
+        conn = conn or self.conn
 
-        time_col, cols = self._detect_schema(uris[0])
+        time_col, cols = self._detect_schema(exchange, uris[0], conn=conn)
         if not time_col:
-            return pd.DataFrame()
-
-        conds = [f"strftime({time_col}, '%H:%M:%S.%f') >= '{start_time}'",
-                f"strftime({time_col}, '%H:%M:%S.%f') <= '{end_time}'"]
-        if symbol and ("symbol" in cols):
-            conds.append(f"CAST(symbol AS VARCHAR) = '{symbol}'")
-        if contract_type and ("contract_type" in cols):
-            conds.append(f"CAST(contract_type AS VARCHAR) = '{contract_type}'")
-        where_sql = " AND ".join(conds)
-
-        uris_sql = "', '".join(uris)
-        sql = f"""
-        SELECT * FROM read_parquet(['{uris_sql}'])
-        WHERE {where_sql}
-        ORDER BY {time_col} ASC
-        """
+            return None
+
+        has_symbol = bool(symbol) and ("symbol" in cols)
+        has_contract = bool(contract_type) and ("contract_type" in cols)
+        sql = self._query_sql(has_symbol, has_contract, time_col)
+        params = [uris, start_time, end_time]
+        if has_symbol:
+            params.append(symbol)
+        if has_contract:
+            params.append(str(contract_type))
         try:
-            df = self.conn.execute(sql).df()
-            if df is None or df.empty:
-                return pd.DataFrame()
-
-            # 数值列标准化（可选）
-            numeric_cols = ["last", "volume", "open_interest", "turnover"]
-            for i in range(1, 6):
-                numeric_cols += [f"bid{i}", f"ask{i}", f"bid_vol{i}", f"ask_vol{i}"]
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-            return df
+            table = conn.execute(sql, params).fetch_arrow_table()
+            if table is None or table.num_rows == 0:
+                return None
+            return self._coerce_numeric(table)
         except Exception as e:
             logger.error(f"DuckDB查询失败: {e}")
+            return None
+
+    def _query_sql(self, has_symbol: bool, has_contract: bool, time_col: str) -> str:
+        """按查询形状生成并缓存 SQL；文件列表、时间、代码均通过参数绑定传入"""
+        key = (has_symbol, has_contract, time_col)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            # 时间过滤直接比较 TIME（按微秒整数向量化比较），不再逐行 strftime 成字符串
+            conds = [f"CAST({time_col} AS TIME) BETWEEN CAST(? AS TIME) AND CAST(? AS TIME)"]
+            if has_symbol:
+                conds.append("CAST(symbol AS VARCHAR) = ?")
+            if has_contract:
+                conds.append("CAST(contract_type AS VARCHAR) = ?")
+            sql = (
+                f"SELECT * FROM read_parquet(?::VARCHAR[]) "
+                f"WHERE {' AND '.join(conds)} "
+                f"ORDER BY {time_col} ASC"
+            )
+            self._sql_cache[key] = sql
+        return sql
+
+    @staticmethod
+    def _coerce_numeric(table: pa.Table) -> pa.Table:
+        """数值列标准化（可选）：非数值类型的列转为 float64，无法解析的值置空"""
+        # 类型化 Parquet 下 DuckDB 返回的数值列已是正确类型，一次遍历 schema 找出需要转换的列
+        to_coerce = [
+            i for i, field in enumerate(table.schema)
+            if field.name in _NUMERIC_COLS
+            and not (pa.types.is_integer(field.type) or pa.types.is_floating(field.type))
+        ]
+        for idx in to_coerce:
+            col = table.schema.field(idx).name
+            arr = table.column(idx)
+            try:
+                arr = pc.cast(arr, pa.float64())
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                arr = pa.array(pd.to_numeric(arr.to_pandas(), errors="coerce"), type=pa.float64())
+            table = table.set_column(idx, col, arr)
+        return table
+
+    @staticmethod
+    def _to_df(table: Optional[pa.Table]) -> pd.DataFrame:
+        if table is None or table.num_rows == 0:
             return pd.DataFrame()
+        # split_blocks/self_destruct：避免块合并拷贝并边转换边释放 Arrow 内存
+        return table.to_pandas(split_blocks=True, self_destruct=True)
 
-    def _query_day_wildcard(self, ticker: str, the_date: str, start_time: str, end_time: str) -> pd.DataFrame:
+    def _query_day_wildcard(
+        self,
+        ticker: str,
+        the_date: str,
+        start_time: str,
+        end_time: str,
+        names: Optional[List[str]] = None,
+        conn=None,
+    ) -> Optional[pa.Table]:
         symbol, contract_type, exchange = self._parse_ticker(ticker)
-        # 先列目录，避免空目录下的通配符导致错误
-        names = self._list_day_parquets(exchange, the_date)
+        # 先列目录，避免空目录下的通配符导致错误（调用方已列过目录时直接复用）
+        if names is None:
+            names = self._list_day_parquets(exchange, the_date)
         if not names:
-            return pd.DataFrame()
+            return None
         uris = [self._s3_uri(n) for n in names]
-        return self._query_files(uris, start_time, end_time, symbol=symbol, contract_type=contract_type)
+        return self._query_files(exchange, uris, start_time, end_time, symbol=symbol, contract_type=contract_type, conn=conn)
 
     def fetch(self, ticker: str, the_date: str, start_time: str, end_time: str, data_type: str = "tick") -> pd.DataFrame:
         """
@@ -178,9 +307,10 @@ class MinIOTickDataClient:
         object_path = self._object_path(ticker, the_date)
         if self._object_exists(object_path):
             uri = self._s3_uri(object_path)
-            return self._query_files([uri], start_time, end_time)
+            _, _, exchange = self._parse_ticker(ticker)
+            return self._to_df(self._query_files(exchange, [uri], start_time, end_time))
         # 回退
-        return self._query_day_wildcard(ticker, the_date, start_time, end_time)
+        return self._to_df(self._query_day_wildcard(ticker, the_date, start_time, end_time))
 
     def fetch_range(self, ticker: str, start_date: str, end_date: str, start_time: str, end_time: str, data_type: str = "tick") -> pd.DataFrame:
         """
@@ -197,42 +327,75 @@ class MinIOTickDataClient:
         symbol, contract_type, exchange = self._parse_ticker(ticker)
 
         existing_uris: List[str] = []
-        fallback_dfs: List[pd.DataFrame] = []
+        fallback_tables: List[pa.Table] = []
+
+        # 一次列出区间内全部对象，按天目录分组，后续存在性判断与回退都在本地完成
+        known = self._list_range_parquets(exchange, start_date, end_date)
+        by_day = defaultdict(list)
+        for name in known:
+            by_day[name.rsplit("/", 1)[0] + "/"].append(name)
 
+        missing_days: List[Tuple[str, List[str]]] = []
         d = sd
         while d <= ed:
             yyyymmdd = d.strftime("%Y%m%d")
             object_path = self._object_path(ticker, yyyymmdd)
-            if self._object_exists(object_path):
+            if object_path in known:
                 existing_uris.append(self._s3_uri(object_path))
             else:
-                # 用“按天目录通配符”回退
-                df_day = self._query_day_wildcard(ticker, yyyymmdd, start_time, end_time)
-                if df_day is not None and not df_day.empty:
-                    fallback_dfs.append(df_day)
+                day_names = sorted(by_day.get(self._day_prefix(exchange, yyyymmdd), []))
+                if day_names:
+                    missing_days.append((yyyymmdd, day_names))
             d += timedelta(days=1)
 
-        dfs: List[pd.DataFrame] = []
+        # 用“按天目录通配符”回退：各天相互独立，并发查询以重叠 S3 延迟
+        if missing_days:
+            def _query_day(day: str, day_names: List[str]) -> Optional[pa.Table]:
+                cur = self._cursor()
+                try:
+                    return self._query_day_wildcard(ticker, day, start_time, end_time, names=day_names, conn=cur)
+                finally:
+                    cur.close()
+
+            workers = max(1, min(self.max_workers, len(missing_days)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_query_day, day, names) for day, names in missing_days]
+                for f in futures:
+                    tbl_day = f.result()
+                    if tbl_day is not None and tbl_day.num_rows:
+                        fallback_tables.append(tbl_day)
+
+        tables: List[pa.Table] = []
         if existing_uris:
-            df_main = self._query_files(existing_uris, start_time, end_time)
-            if df_main is not None and not df_main.empty:
-                dfs.append(df_main)
-        if fallback_dfs:
-            dfs.extend(fallback_dfs)
+            tbl_main = self._query_files(exchange, existing_uris, start_time, end_time)
+            if tbl_main is not None and tbl_main.num_rows:
+                tables.append(tbl_main)
+        if fallback_tables:
+            tables.extend(fallback_tables)
 
-        if not dfs:
+        if not tables:
             return pd.DataFrame()
 
-        merged = pd.concat(dfs, ignore_index=True)
+        # Arrow 拼接只追加 chunk，不复制数据；排序也在 Arrow 层完成
+        merged = _concat_tables(tables)
+        names = merged.schema.names
         # 排序：优先使用时间列
-        time_col = "modify_dt" if "modify_dt" in merged.columns else ("datetime" if "datetime" in merged.columns else None)
+        time_col = "modify_dt" if "modify_dt" in names else ("datetime" if "datetime" in names else None)
         if time_col:
-            sort_cols = []
-            if "date" in merged.columns:
-                sort_cols.append("date")
-            sort_cols.append(time_col)
-            merged = merged.sort_values(sort_cols)
-        return merged
+            sort_keys = []
+            if "date" in names:
+                sort_keys.append(("date", "ascending"))
+            sort_keys.append((time_col, "ascending"))
+            merged = merged.sort_by(sort_keys)
+        return self._to_df(merged)
+
+
+def _concat_tables(tables: List[pa.Table]) -> pa.Table:
+    """拼接各天结果，允许 schema 有差异（缺失列补空）"""
+    try:
+        return pa.concat_tables(tables, promote_options="default")
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
 
 
 def get_tick_data_from_minio(
@@ -3,15 +3,284 @@
 """
 import os
 import io
+import base64
+import hashlib
+import http.client
 import logging
-from typing import Optional
+import select
+import socket
+import threading
+from datetime import timedelta
+from urllib.parse import urlsplit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import certifi
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import urllib3
 from minio import Minio
+from minio.datatypes import Part
 from minio.error import S3Error
 
 from .config import get_config, MinIOConfig
 
 logger = logging.getLogger(__name__)
 
+# S3 分片上传限制：单片最小 5MiB（最后一片除外），最多 10000 片
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+# 单次上传时本地文件的读缓冲区大小
+READ_BUFFER_SIZE = 8 * 1024 * 1024
+
+# 股票数据Parquet写入参数：zstd-3 压缩率优于默认 snappy 而速度相当；
+# 6.4万行一个行组，按标的过滤时只需读取少量行组
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_ROW_GROUP_SIZE = 64_000
+PARQUET_DATA_PAGE_SIZE = 1 << 20
+# 低基数的字符串列使用字典编码
+PARQUET_DICTIONARY_COLUMNS = ("ts_code", "fq_type")
+# 收窄数值列宽度：价格类列在误差不超过半个最小变动单位(1e-4)时转为 float32，
+# 成交量类整数列在取值范围允许时转为 int32
+DOWNCAST_FLOAT_COLUMNS = ("open", "high", "low", "close", "pre_close", "change", "amount")
+DOWNCAST_INT_COLUMNS = ("vol", "volume")
+DOWNCAST_TOLERANCE = 5e-5
+_INT32_MIN, _INT32_MAX = -(2 ** 31), 2 ** 31 - 1
+# 分片并发上传/预签名快速路径依赖的 minio 内部接口（随 minio 7.1-7.2 验证）；
+# 任一缺失时整体回退到公开的 put_object
+_MINIO_PRIVATE_APIS = (
+    "_create_multipart_upload",
+    "_complete_multipart_upload",
+    "_abort_multipart_upload",
+    "_http",
+)
+
+
+def _effective_part_size(total_size: int, part_size: int) -> int:
+    """分片数不能超过 S3 上限，必要时放大分片"""
+    return max(part_size, -(-total_size // MAX_PARTS))
+
+
+def _content_md5(data: Union[bytes, memoryview]) -> str:
+    """Content-MD5 请求头的值（Base64 编码的 MD5 摘要）"""
+    return base64.b64encode(hashlib.md5(data).digest()).decode()
+
+
+def _read_range(fd: int, offset: int, length: int) -> bytes:
+    """按偏移读取文件片段；os.pread 不共享文件指针，可在多个线程中并发调用"""
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    # Windows 没有 pread：每次复制一个文件描述符独立 seek
+    with os.fdopen(os.dup(fd), "rb", buffering=0) as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+def _sendfile_put(url: str, fd: int, offset: int, length: int, timeout: float = 300) -> str:
+    """
+    以预签名 URL PUT 文件片段，请求体由 os.sendfile 在内核中直接从页缓存写入 socket，
+    不经过 Python 缓冲区。仅用于明文 HTTP（TLS 需要在用户态加密）。返回 ETag
+    """
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+    try:
+        conn.putrequest("PUT", target, skip_accept_encoding=True)
+        conn.putheader("Content-Length", str(length))
+        conn.endheaders()
+        sock_fd = conn.sock.fileno()
+        # 带超时的 socket 处于非阻塞模式：发送缓冲区满时 sendfile 抛出 BlockingIOError，需等待可写后继续
+        poller = select.poll()
+        poller.register(sock_fd, select.POLLOUT)
+        sent = 0
+        while sent < length:
+            try:
+                n = os.sendfile(sock_fd, fd, offset + sent, length - sent)
+            except BlockingIOError:
+                if not poller.poll(timeout * 1000):
+                    raise socket.timeout(f"sendfile 等待可写超时: 已发送 {sent}/{length} 字节")
+                continue
+            if n == 0:
+                raise OSError(f"sendfile 提前结束: 已发送 {sent}/{length} 字节")
+            sent += n
+        response = conn.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise OSError(f"PUT 失败: HTTP {response.status} {body[:200]!r}")
+        return (response.getheader("ETag") or "").strip('"')
+    finally:
+        conn.close()
+
+
+class _ChunkReader(io.RawIOBase):
+    """把数据块迭代器包装为可读流，供 put_object 以未知长度上传"""
+
+    def __init__(self, first: bytes, chunks: Iterable[Union[bytes, bytearray, memoryview]]):
+        self._buf = memoryview(first)
+        self._chunks = iter(chunks)
+        self.total = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buf:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buf = memoryview(chunk).cast("B")
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        self.total += n
+        return n
+
+
+def _downcast_column(name: str, col: pa.ChunkedArray) -> pa.ChunkedArray:
+    """单列收窄：无法无损（或在容差内）表示时原样返回"""
+    if name in DOWNCAST_FLOAT_COLUMNS and pa.types.is_float64(col.type):
+        narrow = pc.cast(col, pa.float32(), safe=False)
+        err = pc.max(pc.abs(pc.subtract(pc.cast(narrow, pa.float64()), col))).as_py()
+        return narrow if err is None or err <= DOWNCAST_TOLERANCE else col
+    if name in DOWNCAST_INT_COLUMNS and (pa.types.is_integer(col.type) or pa.types.is_floating(col.type)):
+        if pa.types.is_floating(col.type):
+            # 浮点存储的成交量：全部为整数时才转换
+            if pc.all(pc.equal(pc.floor(col), col)).as_py() is False:
+                return col
+        bounds = pc.min_max(col).as_py()
+        lo, hi = bounds["min"], bounds["max"]
+        fits = lo is None or (lo >= _INT32_MIN and hi <= _INT32_MAX)
+        return pc.cast(col, pa.int32() if fits else pa.int64(), safe=False)
+    return col
+
+
+def _downcast_table(table: pa.Table) -> pa.Table:
+    """收窄价格、成交量列的数值宽度，减少上传与存储的字节数"""
+    for idx, name in enumerate(table.schema.names):
+        col = _downcast_column(name, table.column(idx))
+        if col is not table.column(idx):
+            table = table.set_column(idx, name, col)
+    return table
+
+
+def write_parquet_bytes(data: Union[pd.DataFrame, pa.Table],
+                        dictionary_columns: Optional[Sequence[str]] = None,
+                        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+                        downcast: bool = False) -> memoryview:
+    """
+    将股票数据序列化为Parquet（zstd 压缩 + 字典编码 + 小行组）
+    
+    Args:
+        data: DataFrame 或 Arrow 表
+        dictionary_columns: 使用字典编码的列，None 使用 PARQUET_DICTIONARY_COLUMNS（不存在的列忽略）
+        row_group_size: 每个行组的行数
+        downcast: 是否收窄价格/成交量列（float64→float32、int64→int32），读取方拿到的列类型会随之变化
+        
+    Returns:
+        memoryview: Parquet文件内容，可直接传给 upload_data
+    """
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    if downcast:
+        table = _downcast_table(table)
+    if dictionary_columns is None:
+        dictionary_columns = PARQUET_DICTIONARY_COLUMNS
+    names = set(table.schema.names)
+    sink = pa.BufferOutputStream()
+    pq.write_table(
+        table,
+        sink,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        use_dictionary=[c for c in dictionary_columns if c in names],
+        row_group_size=row_group_size,
+        data_page_size=PARQUET_DATA_PAGE_SIZE,
+    )
+    return memoryview(sink.getvalue())
+
+
+class _PresignedPartUrls:
+    """
+    后台线程按分片顺序预先生成分片上传的预签名 URL：签名计算与进行中的分片 PUT 重叠，
+    上传线程取用时 URL 通常已就绪。最多领先已取用分片 window 个，避免提前生成的 URL 过期。
+    所有分片上传路径（文件、内存数据、数据流）共用；数据流总片数未知时以 MAX_PARTS 为上限
+    """
+    
+    def __init__(self, client: Minio, bucket_name: str, object_path: str,
+                 upload_id: str, n_parts: int, window: int):
+        self._client = client
+        self._bucket_name = bucket_name
+        self._object_path = object_path
+        self._upload_id = upload_id
+        self._n_parts = n_parts
+        self._window = window
+        self._urls: Dict[int, str] = {}
+        self._taken = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def _run(self):
+        for part_number in range(1, self._n_parts + 1):
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or part_number <= self._taken + self._window)
+                if self._closed:
+                    return
+            try:
+                url = self._client.get_presigned_url(
+                    "PUT",
+                    self._bucket_name,
+                    self._object_path,
+                    expires=timedelta(hours=1),
+                    extra_query_params={"uploadId": self._upload_id, "partNumber": str(part_number)},
+                )
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._urls[part_number] = url
+                self._cond.notify_all()
+    
+    def get(self, part_number: int) -> str:
+        with self._cond:
+            self._taken = max(self._taken, part_number)
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: part_number in self._urls or self._error is not None)
+            if part_number in self._urls:
+                return self._urls.pop(part_number)
+            raise OSError(f"生成预签名URL失败: {self._error}")
+    
+    def close(self):
+        """结束预签名线程（上传完成或中止时调用）"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+def _http_client(maxsize: int) -> urllib3.PoolManager:
+    """与 minio 默认设置一致的连接池，仅放大 maxsize，使并发分片上传不必等待空闲连接"""
+    timeout = 300
+    return urllib3.PoolManager(
+        timeout=urllib3.util.Timeout(connect=timeout, read=timeout),
+        maxsize=maxsize,
+        block=False,
+        cert_reqs='CERT_REQUIRED',
+        ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504]
+        )
+    )
+
+
 class MinIOFileUploader:
     """通用MinIO文件上传器"""
     
@@ -26,27 +295,39 @@ class MinIOFileUploader:
         # 获取配置
         self.config = config or get_config()
         
-        # 应用kwargs覆盖
-        endpoint = kwargs.get('endpoint', self.config.endpoint)
-        access_key = kwargs.get('access_key', self.config.access_key)
-        secret_key = kwargs.get('secret_key', self.config.secret_key)
-        secure = kwargs.get('secure', self.config.secure)
+        # 应用kwargs覆盖（连接参数由配置缓存，不再逐项读取环境变量）
+        conn = self.config.connection_params().with_overrides(kwargs)
+        secure = conn.secure
+        
+        # 分片上传参数：超过 part_size 的文件拆分为多个分片并发上传
+        self.part_size = max(int(kwargs.get('part_size', DEFAULT_PART_SIZE)), MIN_PART_SIZE)
+        self.max_concurrency = max(int(kwargs.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)), 1)
+        # 明文 HTTP 且平台支持时，分片经预签名 URL + os.sendfile 零拷贝上传
+        self.use_sendfile = bool(kwargs.get('use_sendfile', True)) and not secure and hasattr(os, "sendfile")
+        # 是否由客户端计算请求体的 Content-MD5 交由服务端校验；请求均经预签名 URL（UNSIGNED-PAYLOAD）发送，
+        # 关闭时不再对请求体做一遍哈希，完整性由 TLS/TCP 保证
+        self.verify_checksum = bool(kwargs.get('verify_checksum', False))
         
         # 初始化MinIO客户端
         self.client = Minio(
-            endpoint=endpoint,
-            access_key=access_key,
-            secret_key=secret_key,
-            secure=secure
+            **conn.minio_kwargs(),
+            http_client=_http_client(max(self.max_concurrency, 10))
         )
+        # minio 内部接口不可用时（版本不兼容），所有上传都改走公开的 put_object
+        self.native_multipart = all(hasattr(self.client, name) for name in _MINIO_PRIVATE_APIS)
+        if not self.native_multipart:
+            logger.warning("当前 minio 版本缺少分片上传内部接口，改用 put_object 上传")
         
-        logger.info(f"初始化MinIO上传器: {endpoint} (secure={secure})")
+        logger.info("初始化MinIO上传器: %s (secure=%s)", conn.endpoint, secure)
     
     def upload_file(self,
                    bucket_name: str,
                    object_path: str,
                    file_path: str,
-                   content_type: str = "application/octet-stream") -> bool:
+                   content_type: str = "application/octet-stream",
+                   part_size: Optional[int] = None,
+                   max_concurrency: Optional[int] = None,
+                   verify_checksum: Optional[bool] = None) -> bool:
         """
         上传本地文件到MinIO
         
@@ -55,82 +336,483 @@ class MinIOFileUploader:
             object_path: MinIO中的对象路径 (如: 'data/files/example.txt')
             file_path: 本地文件路径
             content_type: 文件内容类型
+            part_size: 分片大小（字节），None 使用初始化时的设置；不超过该大小的文件单次上传
+            max_concurrency: 并发上传的分片数，None 使用初始化时的设置
+            verify_checksum: 分片是否计算请求体摘要，None 使用初始化时的设置（跨公网上传建议开启）
             
         Returns:
             bool: 上传是否成功
         """
+        if verify_checksum is None:
+            verify_checksum = self.verify_checksum
         try:
-            if not os.path.exists(file_path):
-                logger.error(f"本地文件不存在: {file_path}")
+            # 一次 stat 同时完成存在性检查与取大小（网络文件系统上每次 stat 都是一次往返）
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                logger.error("本地文件不存在: %s", file_path)
                 return False
             
-            # 确保桶存在
-            if not self.client.bucket_exists(bucket_name):
-                self.client.make_bucket(bucket_name)
-                logger.info(f"创建桶: {bucket_name}")
-            
-            # 上传文件
-            self.client.fput_object(
-                bucket_name,
-                object_path,
-                file_path,
-                content_type=content_type
-            )
+            part_size = max(part_size or self.part_size, MIN_PART_SIZE)
+            
+            def upload():
+                if file_size > part_size and self.native_multipart:
+                    # 大文件：显式分片，多个分片并发上传
+                    self._multipart_upload_file(
+                        bucket_name,
+                        object_path,
+                        file_path,
+                        file_size,
+                        content_type,
+                        part_size,
+                        max_concurrency or self.max_concurrency,
+                        verify_checksum,
+                    )
+                else:
+                    # 上传文件：大读缓冲区，整个对象只需少量 read 系统调用
+                    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                        self.client.put_object(
+                            bucket_name,
+                            object_path,
+                            f,
+                            file_size,
+                            content_type=content_type,
+                            part_size=part_size
+                        )
             
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-            logger.info(f"上传成功: {bucket_name}/{object_path}, 大小: {file_size:.2f}MB")
+            self._upload_creating_bucket(bucket_name, upload)
+            
+            logger.info("上传成功: %s/%s, 大小: %.2fMB", bucket_name, object_path, file_size / (1024 * 1024))
             return True
             
         except S3Error as e:
-            logger.error(f"上传文件失败: {e}")
+            logger.error("上传文件失败: %s", e)
             return False
     
+    def _upload_creating_bucket(self, bucket_name: str, upload: Callable[[], None]) -> None:
+        """
+        直接执行上传，不预先检查桶；仅当服务端返回 NoSuchBucket 时创建桶并重试一次，
+        桶已存在的常规路径只有上传本身的请求
+        """
+        try:
+            upload()
+        except S3Error as e:
+            if e.code != "NoSuchBucket":
+                raise
+            try:
+                self.client.make_bucket(bucket_name)
+                logger.info("创建桶: %s", bucket_name)
+            except S3Error as make_err:
+                # 并发上传时可能已被其他调用方创建
+                if make_err.code not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                    raise
+            upload()
+    
+    def _presigned_put(self,
+                       bucket_name: str,
+                       object_path: str,
+                       body: Union[bytes, memoryview],
+                       extra_query_params: Optional[Dict[str, str]] = None,
+                       content_type: Optional[str] = None,
+                       content_md5: Optional[str] = None) -> str:
+        """
+        经预签名 URL（UNSIGNED-PAYLOAD）PUT 请求体，客户端不计算 SHA256 签名摘要。返回 ETag
+        
+        body 可为 bytes 或按字节展开的 memoryview（urllib3 直接交给 socket 发送，不复制）；
+        给出 content_md5 时附带 Content-MD5 请求头，由服务端校验请求体完整性
+        """
+        url = self.client.get_presigned_url(
+            "PUT",
+            bucket_name,
+            object_path,
+            expires=timedelta(hours=1),
+            extra_query_params=extra_query_params,
+        )
+        return self._put_url(url, body, content_type, content_md5)
+    
+    def _put_url(self,
+                 url: str,
+                 body: Union[bytes, memoryview],
+                 content_type: Optional[str] = None,
+                 content_md5: Optional[str] = None) -> str:
+        """向已签名的 URL PUT 请求体，返回 ETag"""
+        headers = {"Content-Length": str(len(body))}
+        if content_type:
+            headers["Content-Type"] = content_type
+        if content_md5:
+            headers["Content-MD5"] = content_md5
+        response = self.client._http.urlopen("PUT", url, body=body, headers=headers, preload_content=True)
+        try:
+            if response.status != 200:
+                raise S3Error.fromxml(response)
+            return (response.headers.get("ETag") or "").strip('"')
+        finally:
+            response.release_conn()
+    
+    def _put_part(self, url: str, data: Union[bytes, memoryview], verify_checksum: bool) -> str:
+        """上传单个分片到其预签名 URL；需要校验时附带 Content-MD5，由服务端校验分片内容"""
+        return self._put_url(url, data, content_md5=_content_md5(data) if verify_checksum else None)
+    
+    def _multipart_upload_file(self,
+                               bucket_name: str,
+                               object_path: str,
+                               file_path: str,
+                               file_size: int,
+                               content_type: str,
+                               part_size: int,
+                               max_concurrency: int,
+                               verify_checksum: bool = True) -> None:
+        """
+        文件分片并发上传：每个线程按偏移上传自己的分片
+        （明文 HTTP 下 sendfile 零拷贝，否则 pread 读取后 PUT）
+        """
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            def upload_part(url: str, part_number: int, offset: int, length: int) -> str:
+                # sendfile 直接由内核发送请求体，无法附带摘要；要求校验时改走常规上传
+                if self.use_sendfile and not verify_checksum:
+                    try:
+                        return _sendfile_put(url, fd, offset, length)
+                    except (OSError, http.client.HTTPException) as e:
+                        logger.debug("sendfile上传分片失败，改用常规上传: part=%d, %s", part_number, e)
+                return self._put_part(url, _read_range(fd, offset, length), verify_checksum)
+            
+            self._multipart_upload(
+                bucket_name, object_path, file_size, content_type,
+                part_size, max_concurrency, upload_part,
+            )
+        finally:
+            os.close(fd)
+    
+    def _multipart_upload(self,
+                          bucket_name: str,
+                          object_path: str,
+                          total_size: int,
+                          content_type: str,
+                          part_size: int,
+                          max_concurrency: int,
+                          upload_part: Callable[[str, int, int, int], str]) -> None:
+        """
+        分片并发上传（仿 s3transfer）：各分片提交到线程池，按完成顺序收集 (part_number, etag)，
+        排序后合并；任一分片失败立即取消其余分片并中止分片上传，服务端不残留未完成的分片
+        
+        upload_part(url, part_number, offset, length) 负责把单个分片 PUT 到其预签名 URL 并返回 ETag；
+        URL 由 _PresignedPartUrls 在后台预先生成
+        """
+        part_size = _effective_part_size(total_size, part_size)
+        offsets = range(0, total_size, part_size)
+        
+        upload_id = self.client._create_multipart_upload(
+            bucket_name, object_path, {"Content-Type": content_type}
+        )
+        urls = _PresignedPartUrls(
+            self.client, bucket_name, object_path, upload_id, len(offsets), 2 * max_concurrency
+        )
+        
+        def run_part(part_number: int, offset: int, length: int) -> str:
+            return upload_part(urls.get(part_number), part_number, offset, length)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(offsets))) as executor:
+                futures = {
+                    executor.submit(
+                        run_part, i + 1, offset, min(part_size, total_size - offset)
+                    ): i + 1
+                    for i, offset in enumerate(offsets)
+                }
+                parts = []
+                try:
+                    for future in as_completed(futures):
+                        parts.append(Part(futures[future], future.result()))
+                except BaseException:
+                    # 失败即停止：取消尚未开始的分片
+                    for f in futures:
+                        f.cancel()
+                    raise
+            
+            parts.sort(key=lambda part: part.part_number)
+            self.client._complete_multipart_upload(bucket_name, object_path, upload_id, parts)
+        except BaseException:
+            try:
+                self.client._abort_multipart_upload(bucket_name, object_path, upload_id)
+            except Exception as e:
+                logger.warning("中止分片上传失败: %s/%s, %s", bucket_name, object_path, e)
+            raise
+        finally:
+            urls.close()
+    
+    def _multipart_upload_stream(self,
+                                 bucket_name: str,
+                                 object_path: str,
+                                 first: bytes,
+                                 read_part: Callable[[], bytes],
+                                 content_type: str,
+                                 max_concurrency: int,
+                                 verify_checksum: bool) -> int:
+        """
+        流式分片上传：边读取边提交分片，在途分片达到 max_concurrency 时等待其中之一完成再读下一片；
+        任一分片失败即取消其余分片并中止分片上传。返回上传的总字节数
+        """
+        upload_id = self.client._create_multipart_upload(
+            bucket_name, object_path, {"Content-Type": content_type}
+        )
+        urls = _PresignedPartUrls(
+            self.client, bucket_name, object_path, upload_id, MAX_PARTS, 2 * max_concurrency
+        )
+        
+        def put(part_number: int, data: bytes) -> str:
+            return self._put_part(urls.get(part_number), data, verify_checksum)
+        
+        try:
+            parts = []
+            total = 0
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                in_flight = {}
+                try:
+                    data = first
+                    part_number = 0
+                    while data:
+                        if len(in_flight) >= max_concurrency:
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                parts.append(Part(in_flight.pop(future), future.result()))
+                        part_number += 1
+                        if part_number > MAX_PARTS:
+                            raise ValueError(f"数据流超过 {MAX_PARTS} 个分片，请增大 part_size")
+                        future = executor.submit(put, part_number, data)
+                        in_flight[future] = part_number
+                        total += len(data)
+                        data = read_part()
+                    for future in as_completed(in_flight):
+                        parts.append(Part(in_flight[future], future.result()))
+                except BaseException:
+                    # 失败即停止：取消尚未开始的分片
+                    for f in in_flight:
+                        f.cancel()
+                    raise
+            
+            parts.sort(key=lambda part: part.part_number)
+            self.client._complete_multipart_upload(bucket_name, object_path, upload_id, parts)
+            return total
+        except BaseException:
+            try:
+                self.client._abort_multipart_upload(bucket_name, object_path, upload_id)
+            except Exception as e:
+                logger.warning("中止分片上传失败: %s/%s, %s", bucket_name, object_path, e)
+            raise
+        finally:
+            urls.close()
+    
+    def _upload_small_data(self,
+                           bucket_name: str,
+                           object_path: str,
+                           data: Union[bytes, bytearray, memoryview],
+                           content_type: str,
+                           verify_checksum: bool) -> bool:
+        """
+        单次上传路径（数据不超过一个分片）：一次预签名 PUT 完成上传，不包装流、不走分片逻辑；
+        需要校验时附带 Content-MD5，由服务端校验请求体
+        """
+        body = data if isinstance(data, bytes) else memoryview(data).cast("B")
+        content_md5 = _content_md5(body) if verify_checksum else None
+        
+        def upload():
+            self._presigned_put(bucket_name, object_path, body, content_type=content_type, content_md5=content_md5)
+        
+        self._upload_creating_bucket(bucket_name, upload)
+        logger.info("上传成功: %s/%s, 大小: %.2fMB", bucket_name, object_path, len(body) / (1024 * 1024))
+        return True
+    
     def upload_data(self,
                    bucket_name: str,
                    object_path: str,
-                   data: bytes,
-                   content_type: str = "application/octet-stream") -> bool:
+                   data: Union[bytes, bytearray, memoryview],
+                   content_type: str = "application/octet-stream",
+                   part_size: Optional[int] = None,
+                   max_concurrency: Optional[int] = None,
+                   verify_checksum: Optional[bool] = None) -> bool:
         """
         上传二进制数据到MinIO
         
         Args:
             bucket_name: 目标桶名称
             object_path: MinIO中的对象路径
-            data: 要上传的二进制数据
+            data: 要上传的二进制数据（bytes/bytearray/C连续的memoryview；请求体与各分片为其视图，不复制，
+                  仅 minio 内部接口不可用而回退 put_object 时复制一次）
             content_type: 数据内容类型
+            part_size: 分片大小（字节），None 使用初始化时的设置；不超过该大小的数据单次上传
+            max_concurrency: 并发上传的分片数，None 使用初始化时的设置
+            verify_checksum: 是否计算请求体摘要，None 使用初始化时的设置（跨公网上传建议开启）
             
         Returns:
             bool: 上传是否成功
         """
+        if verify_checksum is None:
+            verify_checksum = self.verify_checksum
         try:
-            # 确保桶存在
-            if not self.client.bucket_exists(bucket_name):
-                self.client.make_bucket(bucket_name)
-                logger.info(f"创建桶: {bucket_name}")
-            
-            # 将bytes数据包装成file-like对象
-            data_stream = io.BytesIO(data)
-            
-            # 上传数据
-            self.client.put_object(
-                bucket_name,
-                object_path,
-                data_stream,
-                len(data),
-                content_type=content_type
-            )
+            length = memoryview(data).nbytes
+            part_size = max(part_size or self.part_size, MIN_PART_SIZE)
+            if length <= part_size and self.native_multipart:
+                return self._upload_small_data(bucket_name, object_path, data, content_type, verify_checksum)
+            
+            def upload_part(url: str, part_number: int, offset: int, size: int) -> str:
+                return self._put_part(url, memoryview(data).cast("B")[offset:offset + size], verify_checksum)
+            
+            def upload():
+                if not self.native_multipart:
+                    self.client.put_object(
+                        bucket_name, object_path, io.BytesIO(data), length,
+                        content_type=content_type, part_size=part_size
+                    )
+                    return
+                # 大数据：显式分片，多个分片并发上传
+                self._multipart_upload(
+                    bucket_name, object_path, length, content_type,
+                    part_size, max_concurrency or self.max_concurrency, upload_part,
+                )
+            
+            self._upload_creating_bucket(bucket_name, upload)
             
-            data_size = len(data) / (1024 * 1024)  # MB
-            logger.info(f"上传成功: {bucket_name}/{object_path}, 大小: {data_size:.2f}MB")
+            logger.info("上传成功: %s/%s, 大小: %.2fMB", bucket_name, object_path, length / (1024 * 1024))
             return True
             
         except S3Error as e:
-            logger.error(f"上传数据失败: {e}")
+            logger.error("上传数据失败: %s", e)
             return False
         except Exception as e:
-            logger.error(f"上传数据时发生未知错误: {e}")
+            logger.error("上传数据时发生未知错误: %s", e)
             return False
 
+    def upload_stream(self,
+                      bucket_name: str,
+                      object_path: str,
+                      chunks: Iterable[Union[bytes, bytearray, memoryview]],
+                      content_type: str = "application/octet-stream",
+                      part_size: Optional[int] = None,
+                      max_concurrency: Optional[int] = None,
+                      verify_checksum: Optional[bool] = None) -> bool:
+        """
+        上传长度未知的数据流到MinIO（如边序列化边上传）
+        
+        数据块累积到 part_size 即作为一个分片提交上传，无需事先知道总长度；
+        同时在途的分片不超过 max_concurrency 个，内存占用约为 part_size × (max_concurrency + 1)。
+        数据不足一个分片时改为单次上传
+        
+        Args:
+            bucket_name: 目标桶名称
+            object_path: MinIO中的对象路径
+            chunks: 产生二进制数据块的可迭代对象
+            content_type: 数据内容类型
+            part_size: 分片大小（字节），None 使用初始化时的设置
+            max_concurrency: 并发上传的分片数，None 使用初始化时的设置
+            verify_checksum: 是否计算请求体摘要，None 使用初始化时的设置
+            
+        Returns:
+            bool: 上传是否成功
+        """
+        if verify_checksum is None:
+            verify_checksum = self.verify_checksum
+        part_size = max(part_size or self.part_size, MIN_PART_SIZE)
+        max_concurrency = max_concurrency or self.max_concurrency
+        chunk_iter = iter(chunks)
+        total = 0
+        
+        def read_part() -> bytes:
+            buf = bytearray()
+            for chunk in chunk_iter:
+                buf += chunk
+                if len(buf) >= part_size:
+                    break
+            return bytes(buf)
+        
+        try:
+            # 先读出第一个分片再决定上传方式；桶不存在而重试时第一个分片仍可复用
+            first = read_part()
+            
+            def upload():
+                nonlocal total
+                if not self.native_multipart:
+                    # 回退：由 put_object 以未知长度分片上传
+                    raw = _ChunkReader(first, chunk_iter)
+                    self.client.put_object(
+                        bucket_name, object_path, io.BufferedReader(raw, buffer_size=READ_BUFFER_SIZE), -1,
+                        content_type=content_type, part_size=part_size
+                    )
+                    total = raw.total
+                    return
+                if len(first) < part_size:
+                    # 数据流不足一个分片：单次上传
+                    total = len(first)
+                    if verify_checksum:
+                        self.client.put_object(bucket_name, object_path, io.BytesIO(first), total,
+                                               content_type=content_type)
+                    else:
+                        self._presigned_put(bucket_name, object_path, first, content_type=content_type)
+                    return
+                total = self._multipart_upload_stream(
+                    bucket_name, object_path, first, read_part,
+                    content_type, max_concurrency, verify_checksum,
+                )
+            
+            self._upload_creating_bucket(bucket_name, upload)
+            
+            logger.info("上传成功: %s/%s, 大小: %.2fMB", bucket_name, object_path, total / (1024 * 1024))
+            return True
+            
+        except S3Error as e:
+            logger.error("上传数据流失败: %s", e)
+            return False
+        except Exception as e:
+            logger.error("上传数据流时发生未知错误: %s", e)
+            return False
+    
+    def upload_dataframe(self,
+                         bucket_name: str,
+                         object_path: str,
+                         data: Union[pd.DataFrame, pa.Table],
+                         dictionary_columns: Optional[Sequence[str]] = None,
+                         row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+                         downcast: bool = False) -> bool:
+        """
+        将DataFrame/Arrow表写为Parquet并上传（写入参数见 write_parquet_bytes）
+        
+        Args:
+            bucket_name: 目标桶名称
+            object_path: MinIO中的对象路径 (如: 'data/cnstock/2024.parquet')
+            data: 要上传的数据
+            dictionary_columns: 使用字典编码的列
+            row_group_size: 每个行组的行数
+            downcast: 是否收窄价格/成交量列的数值宽度
+            
+        Returns:
+            bool: 上传是否成功
+        """
+        try:
+            body = write_parquet_bytes(data, dictionary_columns, row_group_size, downcast)
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            logger.error("序列化Parquet失败: %s", e)
+            return False
+        return self.upload_data(bucket_name, object_path, body)
+
+# 便捷函数共享的上传器缓存（按连接参数），避免每次调用都新建连接池
+_uploader_cache: Dict[Tuple[str, str, str, bool], MinIOFileUploader] = {}
+_uploader_cache_lock = threading.Lock()
+
+def _get_uploader(config: Optional[MinIOConfig] = None) -> MinIOFileUploader:
+    cfg = config or get_config()
+    key = cfg.connection_key()
+    with _uploader_cache_lock:
+        uploader = _uploader_cache.get(key)
+        if uploader is None:
+            uploader = MinIOFileUploader(config=cfg)
+            _uploader_cache[key] = uploader
+    return uploader
+
+def clear_uploader_cache():
+    """清除缓存的上传器（凭证轮换后调用）"""
+    with _uploader_cache_lock:
+        _uploader_cache.clear()
+
 # 便捷函数
 def upload_file_to_minio(bucket_name: str,
                         object_path: str,
@@ -148,12 +830,12 @@ def upload_file_to_minio(bucket_name: str,
     Returns:
         bool: 上传是否成功
     """
-    uploader = MinIOFileUploader(config=config)
+    uploader = _get_uploader(config)
     return uploader.upload_file(bucket_name, object_path, file_path)
 
 def upload_data_to_minio(bucket_name: str,
                         object_path: str,
-                        data: bytes,
+                        data: Union[bytes, bytearray, memoryview],
                         content_type: str = "application/octet-stream",
                         config: Optional[MinIOConfig] = None) -> bool:
     """
@@ -169,5 +851,26 @@ def upload_data_to_minio(bucket_name: str,
     Returns:
         bool: 上传是否成功
     """
-    uploader = MinIOFileUploader(config=config)
-    return uploader.upload_data(bucket_name, object_path, data, content_type)
\ No newline at end of file
+    uploader = _get_uploader(config)
+    return uploader.upload_data(bucket_name, object_path, data, content_type)
+
+def upload_dataframe_to_minio(bucket_name: str,
+                             object_path: str,
+                             data: Union[pd.DataFrame, pa.Table],
+                             downcast: bool = False,
+                             config: Optional[MinIOConfig] = None) -> bool:
+    """
+    将DataFrame/Arrow表以Parquet格式上传到MinIO的便捷函数
+    
+    Args:
+        bucket_name: 目标桶名称
+        object_path: MinIO中的对象路径
+        data: 要上传的数据
+        downcast: 是否收窄价格/成交量列的数值宽度
+        config: MinIO配置
+        
+    Returns:
+        bool: 上传是否成功
+    """
+    uploader = _get_uploader(config)
+    return uploader.upload_dataframe(bucket_name, object_path, data, downcast=downcast)
@@ -2,8 +2,10 @@
 便捷函数 - 多数据类型支持
 """
 import pandas as pd
-from typing import Union, List, Optional
-from .client import MinIOStockDataClient, get_data_from_minio
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Union, List, Optional, Sequence
+from .client import get_data_from_minio, _convert_table, _get_client
 from .config import MinIOConfig
 from .schemas import get_supported_data_types, is_data_type_supported, schema_manager
 
@@ -25,7 +27,7 @@ def get_stock_data_from_minio(start_date: str = "20200101",
     Returns:
         pd.DataFrame: 股票数据
     """
-    client = MinIOStockDataClient(config=config)
+    client = _get_client(config)
     return client.get_stock_data_fast(
         start_date=start_date,
         end_date=end_date,
@@ -37,38 +39,102 @@ def get_cnstock_data(start_date: str = "20200101",
                     end_date: str = "20250101", 
                     symbols: Union[str, List[str]] = "all",
                     fq_type: str = "qfq",
-                    config: Optional[MinIOConfig] = None) -> pd.DataFrame:
-    """获取中国股票基础数据"""
-    return get_data_from_minio("CNSTOCK", start_date, end_date, symbols, fq_type, config)
+                    config: Optional[MinIOConfig] = None,
+                    framework: str = "pandas"):
+    """
+    获取中国股票基础数据（framework: pandas/arrow/polars）
+    
+    需要获取多个标的时请使用 get_cnstock_data_many（一次查询后按标的拆分），而不是循环调用本函数
+    """
+    return get_data_from_minio("CNSTOCK", start_date, end_date, symbols, fq_type, config, framework=framework)
+
+def get_cnstock_data_many(symbols_list: Sequence[str],
+                          start_date: str = "20200101",
+                          end_date: str = "20250101",
+                          fq_type: str = "qfq",
+                          config: Optional[MinIOConfig] = None,
+                          framework: str = "pandas",
+                          by_symbol: bool = False):
+    """
+    一次获取多个标的的中国股票数据
+    
+    所有标的合并为一次 get_data(symbols=列表) 查询：每个数据文件只读取一遍并按标的集合过滤，
+    而不是每个标的各扫描一遍全部文件
+    
+    Args:
+        symbols_list: 股票代码列表
+        start_date: 开始日期 YYYYMMDD
+        end_date: 结束日期 YYYYMMDD
+        fq_type: 复权类型
+        config: MinIO配置，None则从环境变量读取
+        framework: 返回类型 pandas/arrow/polars
+        by_symbol: 为True时按标的拆分，返回 {标的: 数据}
+        
+    Returns:
+        合并后的数据（类型由 framework 决定），by_symbol=True 时为按标的拆分的字典
+    """
+    symbols_list = list(dict.fromkeys(symbols_list))
+    if not symbols_list:
+        if by_symbol:
+            return {}
+        return pd.DataFrame() if framework == "pandas" else _convert_table(pa.table({}), framework)
+    
+    client = _get_client(config)
+    result = client.get_data("CNSTOCK", start_date, end_date, symbols_list, fq_type, framework=framework)
+    if not by_symbol:
+        return result
+    return _split_by_symbol(result, symbols_list, framework)
+
+def _split_by_symbol(result, symbols_list: List[str], framework: str) -> dict:
+    """将多标的查询结果按标的代码拆分（结果中没有的标的不出现在字典中）"""
+    symbol_column = schema_manager.get_symbol_column("CNSTOCK")
+    if framework == "arrow":
+        if symbol_column not in result.column_names:
+            return {}
+        codes = result[symbol_column]
+        parts = {s: result.filter(pc.equal(codes, s)) for s in symbols_list}
+        return {s: t for s, t in parts.items() if t.num_rows}
+    if framework == "polars":
+        if symbol_column not in result.columns:
+            return {}
+        return {key[0] if isinstance(key, tuple) else key: df
+                for key, df in result.partition_by(symbol_column, as_dict=True).items()}
+    if symbol_column not in result.columns:
+        return {}
+    return {s: df.reset_index(drop=True) for s, df in result.groupby(symbol_column, sort=False)}
 
 def get_cnstock_adj_factor_data(start_date: str = "20200101",
                         end_date: str = "20250101", 
                         symbols: Union[str, List[str]] = "all",
                         fq_type: str = "qfq",
-                        config: Optional[MinIOConfig] = None) -> pd.DataFrame:
+                        config: Optional[MinIOConfig] = None,
+                        framework: str = "pandas"):
     """获取中国股票adj_factor数据"""
-    return get_data_from_minio("CNSTOCK_ADJ", start_date, end_date, symbols, fq_type, config)
+    return get_data_from_minio("CNSTOCK_ADJ", start_date, end_date, symbols, fq_type, config, framework=framework)
 
 def get_cnstock_basic_data(start_date: str = "20200101",
                           end_date: str = "20250101", 
                           symbols: Union[str, List[str]] = "all",
-                          config: Optional[MinIOConfig] = None) -> pd.DataFrame:
+                          config: Optional[MinIOConfig] = None,
+                          framework: str = "pandas"):
     """获取中国股票基础信息数据"""
-    return get_data_from_minio("CNSTOCK_BASIC", start_date, end_date, symbols, config=config)
+    return get_data_from_minio("CNSTOCK_BASIC", start_date, end_date, symbols, config=config, framework=framework)
 
 def get_cnindex_data(start_date: str = "20200101",
                     end_date: str = "20250101", 
                     symbols: Union[str, List[str]] = "all",
-                    config: Optional[MinIOConfig] = None) -> pd.DataFrame:
+                    config: Optional[MinIOConfig] = None,
+                    framework: str = "pandas"):
     """获取中国指数数据"""
-    return get_data_from_minio("CNINDEX", start_date, end_date, symbols, config=config)
+    return get_data_from_minio("CNINDEX", start_date, end_date, symbols, config=config, framework=framework)
 
 def get_cnstock_moneyflow_data(start_date: str = "20200101",
                               end_date: str = "20250101", 
                               symbols: Union[str, List[str]] = "all",
-                              config: Optional[MinIOConfig] = None) -> pd.DataFrame:
+                              config: Optional[MinIOConfig] = None,
+                              framework: str = "pandas"):
     """获取中国股票资金流向数据"""
-    return get_data_from_minio("CNSTOCK_MONEYFLOW", start_date, end_date, symbols, config=config)
+    return get_data_from_minio("CNSTOCK_MONEYFLOW", start_date, end_date, symbols, config=config, framework=framework)
 
 def list_supported_data_types() -> List[str]:
     """列出所有支持的数据类型"""
@@ -100,7 +166,7 @@ def test_minio_connection(config: Optional[MinIOConfig] = None) -> bool:
         bool: 连接是否成功
     """
     try:
-        client = MinIOStockDataClient(config=config)
+        client = _get_client(config)
         return client.test_connection()
     except Exception:
         return False
@@ -116,7 +182,7 @@ def get_available_data_summary(config: Optional[MinIOConfig] = None) -> dict:
         dict: 数据概览信息
     """
     try:
-        client = MinIOStockDataClient(config=config)
+        client = _get_client(config)
         return client.list_available_data()
     except Exception as e:
         return {"error": str(e)}
\ No newline at end of file
@@ -25,6 +25,7 @@ def main():
     # 1) Amazing 实时流：订阅 + 回调里写 Redis
     data_stream = AmazingDataStream(username=USERNAME, password=PASSWORD, host=HOST, port=PORT)
     data_stream.subscribe(symbols)
+    data_stream.start_streaming()
 
 
     # 2) Redis Reader：从 Redis 拉取并消费
@@ -50,7 +51,6 @@ def main():
     # 停止
     reader.stop()
     data_stream.stop()
-    wt.join(timeout=1.0)
     rt.join(timeout=1.0)
 
 
@@ -10,6 +10,7 @@ WebSocket数据流示例
 import logging
 import time
 from newstreamer.streams.websocket_stream import WebSocketDataStream
+from newstreamer.utils.fast_json import loads
 
 # 配置日志
 logging.basicConfig(
@@ -74,9 +75,9 @@ def example_websocket_custom_parser():
         假设WebSocket返回的消息格式为:
         {"type": "quote", "data": {"symbol": "000001", "price": 100.5, ...}}
         """
-        import json
         try:
-            msg = json.loads(message)
+            # 安装 orjson 时使用 SIMD 解析，bytes 消息无需先解码为 str
+            msg = loads(message)
             
             # 过滤非数据消息
             if msg.get('type') == 'quote':
@@ -84,7 +85,7 @@ def example_websocket_custom_parser():
             
             return None
             
-        except json.JSONDecodeError:
+        except ValueError:
             logger.error(f"JSON解析失败: {message}")
             return None
     
@@ -101,7 +102,9 @@ def example_websocket_custom_parser():
     stream = WebSocketDataStream(
         url='wss://stream.example.com/market',
         api_key='your_api_key_here',
-        message_parser=custom_parser  # 使用自定义解析器
+        message_parser=custom_parser,  # 使用自定义解析器
+        # 解析器直接用 fast_json 解析，跳过 websocket-client 的逐帧 UTF-8 校验
+        websocket_options={'skip_utf8_validation': True}
     )
     
     stream.subscribe(['000001', '600000'])
@@ -5,12 +5,13 @@
 确保外包人员可以独立使用而不依赖其他包。
 """
 
-from newstreamer.models.orderbook import OrderBook, OrderBookLevel
+from newstreamer.models.orderbook import OrderBook, OrderBookLevel, LazyOrderBook
 from newstreamer.models.market_data import MarketData, BookSnapshotData
 
 __all__ = [
     "OrderBook",
     "OrderBookLevel", 
+    "LazyOrderBook",
     "MarketData",
     "BookSnapshotData",
 ]
@@ -8,10 +8,20 @@
 from typing import Optional
 from dataclasses import dataclass
 import pandas as pd
-from newstreamer.models.orderbook import OrderBook
+from newstreamer.models.orderbook import OrderBook, OrderBookLevel, _DATACLASS_KWARGS
 
 
-@dataclass
+# to_dict 输出的五档字段名，预先生成避免每个快照重复格式化
+_LEVEL_KEYS = tuple(
+    (f'bid_price{i}', f'ask_price{i}', f'bid_vol{i}', f'ask_vol{i}') for i in range(1, 6)
+)
+# get_timestamp 各单位对应的除数(timestamp 以纳秒存储)
+_UNIT_DIV = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
+# 缺档时的占位价位(价格、数量均为0，与 OrderBook.get_bid 等越界返回值一致)
+_ZERO_LEVEL = OrderBookLevel(price=0.0, volume=0.0)
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class MarketData:
     """
     基础市场数据结构
@@ -80,6 +90,17 @@ class MarketData:
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
+        # 派生字段一次算出(与 get_change_pct/get_change_amount/get_amplitude 结果一致)，不重复判断昨收价
+        pre_close = self.pre_close
+        chg_pct = self.chg_pct
+        amplitude = None
+        if pre_close > 0:
+            if not chg_pct:
+                chg_pct = ((self.price - pre_close) / pre_close) * 100
+            if self.high > 0 and self.low > 0:
+                amplitude = ((self.high - self.low) / pre_close) * 100
+        elif not chg_pct:
+            chg_pct = None
         return {
             'symbol': self.symbol,
             'trade_date': self.trade_date,
@@ -93,14 +114,14 @@ class MarketData:
             'close': self.close,
             'pre_close': self.pre_close,
             'name': self.name,
-            'chg_pct': self.chg_pct or self.get_change_pct(),
-            'chg_amount': self.chg_amount or self.get_change_amount(),
+            'chg_pct': chg_pct,
+            'chg_amount': self.chg_amount or (self.price - pre_close),
             'turnover_rate': self.turnover_rate,
-            'amplitude': self.get_amplitude()
+            'amplitude': amplitude
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class BookSnapshotData:
     """
     订单簿快照数据
@@ -129,10 +150,7 @@ class BookSnapshotData:
     def __post_init__(self):
         """初始化后从book提取一档数据"""
         if self.book is not None:
-            self.bid1 = self.book.get_bid(0)
-            self.bid_vol1 = self.book.get_bid_vol(0)
-            self.ask1 = self.book.get_ask(0)
-            self.ask_vol1 = self.book.get_ask_vol(0)
+            self.bid1, self.bid_vol1, self.ask1, self.ask_vol1 = self.book.top_of_book()
     
     def get_mid(self) -> float:
         """获取中间价"""
@@ -166,16 +184,14 @@ class BookSnapshotData:
         Returns:
             指定单位的时间戳
         """
-        if unit == 's':
-            return self.timestamp // 1_000_000_000
-        elif unit == 'ms':
-            return self.timestamp // 1_000_000
-        elif unit == 'us':
-            return self.timestamp // 1_000
-        elif unit == 'ns':
-            return self.timestamp
-        else:
-            raise ValueError(f"不支持的时间单位: {unit}")
+        try:
+            return self.timestamp // _UNIT_DIV[unit]
+        except KeyError:
+            raise ValueError(f"不支持的时间单位: {unit}") from None
+    
+    def get_timestamp_ms(self) -> int:
+        """获取毫秒时间戳(单位固定，省去单位查找)"""
+        return self.timestamp // 1_000_000
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
@@ -191,15 +207,20 @@ class BookSnapshotData:
             'low': self.low
         }
         
-        # 添加五档数据
+        # 添加五档数据：两侧价位列表只取一次，按下标直接读取
         if self.book:
-            for i in range(1, 6):
-                result[f'bid_price{i}'] = self.book.get_bid(i-1)
-                result[f'ask_price{i}'] = self.book.get_ask(i-1)
-                result[f'bid_vol{i}'] = self.book.get_bid_vol(i-1)
-                result[f'ask_vol{i}'] = self.book.get_ask_vol(i-1)
+            bids = self.book.bids
+            asks = self.book.asks
+            nb, na = len(bids), len(asks)
+            for i, (bid_price, ask_price, bid_vol, ask_vol) in enumerate(_LEVEL_KEYS):
+                b = bids[i] if i < nb else _ZERO_LEVEL
+                a = asks[i] if i < na else _ZERO_LEVEL
+                result[bid_price] = b.price
+                result[ask_price] = a.price
+                result[bid_vol] = b.volume
+                result[ask_vol] = a.volume
             
-            result['mid'] = self.get_mid()
+            result['mid'] = (bids[0].price + asks[0].price) / 2 if nb and na else 0.0
         
         return result
     
@@ -5,12 +5,18 @@
 原始路径: /home/ubuntu/TradeNew/infra/common/src/trader_common/data/models/order_book.py
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
+import numpy as np
 
-@dataclass
+# Python 3.10+ 使用 __slots__：实例不再携带 __dict__，省去每个对象的字典分配且属性访问更快
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class OrderBookLevel:
     """订单簿单个价位"""
     price: float
@@ -18,7 +24,7 @@ class OrderBookLevel:
     count: Optional[int] = None  # 订单数量(可选)
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class OrderBook:
     """订单簿结构"""
     symbol: str
@@ -50,6 +56,20 @@ class OrderBook:
             return self.asks[index].volume
         return 0.0
     
+    def top_of_book(self) -> Tuple[float, float, float, float]:
+        """一次取出一档数据 (买一价, 买一量, 卖一价, 卖一量)，缺档为0"""
+        if self.bids:
+            bid = self.bids[0]
+            bid_px, bid_vol = bid.price, bid.volume
+        else:
+            bid_px = bid_vol = 0.0
+        if self.asks:
+            ask = self.asks[0]
+            ask_px, ask_vol = ask.price, ask.volume
+        else:
+            ask_px = ask_vol = 0.0
+        return bid_px, bid_vol, ask_px, ask_vol
+    
     def get_mid_price(self) -> float:
         """获取中间价格"""
         if self.bids and self.asks:
@@ -76,12 +96,194 @@ class OrderBook:
         
         return (bid_price * ask_vol + ask_price * bid_vol) / total_vol
     
-    def to_dict(self) -> dict:
-        """将OrderBook对象转换为字典"""
+    def to_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        转换为按列存放的 float64 数组(SoA)，便于批量计算与向量化处理
+        
+        Args:
+            depth: 档位数，None 取两侧中较深一侧的档数；不足的档位以0补齐
+            
+        Returns:
+            (bid_px, bid_vol, ask_px, ask_vol)
+        """
+        if depth is None:
+            depth = max(len(self.bids), len(self.asks))
+        out = np.zeros((4, depth), dtype=np.float64)
+        for row, levels in ((0, self.bids), (2, self.asks)):
+            n = min(len(levels), depth)
+            if n:
+                out[row:row + 2, :n] = np.array(
+                    [(level.price, level.volume) for level in levels[:n]], dtype=np.float64
+                ).T
+        return out[0], out[1], out[2], out[3]
+    
+    @classmethod
+    def from_arrays(cls, symbol: str, bid_px, bid_vol, ask_px, ask_vol, timestamp: datetime) -> "OrderBook":
+        """
+        由按列存放的价格/数量数组构建订单簿(to_arrays 的逆操作)，价格为0的档位视为空档丢弃
+        
+        Args:
+            symbol: 股票代码
+            bid_px, bid_vol: 买单价格、数量(降序)
+            ask_px, ask_vol: 卖单价格、数量(升序)
+            timestamp: 订单簿时间戳
+        """
+        bids = [OrderBookLevel(price=p, volume=v)
+                for p, v in zip(np.asarray(bid_px).tolist(), np.asarray(bid_vol).tolist()) if p]
+        asks = [OrderBookLevel(price=p, volume=v)
+                for p, v in zip(np.asarray(ask_px).tolist(), np.asarray(ask_vol).tolist()) if p]
+        return cls(symbol=symbol, asks=asks, bids=bids, timestamp=timestamp)
+    
+    def timestamp_ns(self) -> int:
+        """时间戳转为纳秒整数(与 BookSnapshotData.timestamp 单位一致)"""
+        ts = self.timestamp
+        if isinstance(ts, datetime):
+            return int(ts.timestamp()) * 1_000_000_000 + ts.microsecond * 1_000
+        return int(ts)
+    
+    def timestamp_iso(self) -> str:
+        """时间戳转为 ISO 格式字符串"""
+        ts = self.timestamp
+        if isinstance(ts, datetime):
+            return ts.isoformat()
+        return datetime.fromtimestamp(ts / 1e9).isoformat()
+    
+    def to_dict(self, epoch: bool = False) -> dict:
+        """
+        将OrderBook对象转换为字典
+        
+        Args:
+            epoch: True 时时间戳输出为纳秒整数，省去 ISO 字符串格式化(流式写入场景)；
+                默认输出 ISO 字符串，与原有接口一致
+        """
         return {
             "symbol": self.symbol,
             "bids": [{"price": bid.price, "volume": bid.volume} for bid in self.bids],
             "asks": [{"price": ask.price, "volume": ask.volume} for ask in self.asks],
             # 转为 ISO 格式字符串，避免 JSON 序列化错误
-            "timestamp": self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else self.timestamp,
+            "timestamp": self.timestamp_ns() if epoch else (
+                self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else self.timestamp
+            ),
         }
+
+
+class LazyOrderBook(OrderBook):
+    """
+    延迟构建的订单簿：引用按列存放的价格/数量二维数组(行=时刻，列=档位)中的一行
+    
+    bids/asks 档位列表与 datetime 时间戳在首次访问时才构建并缓存；
+    只读取一档价格、中间价的调用方直接从数组取值，省去逐档创建 OrderBookLevel 的开销。
+    一档相关方法的结果与普通 OrderBook 一致。
+    """
+    
+    __slots__ = ('_levels', '_row', '_ts_ns', '_bids', '_asks', '_timestamp')
+    
+    def __init__(self, symbol: str, levels: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+                 row: int, timestamp_ns: int, timestamp: Optional[datetime] = None):
+        """
+        Args:
+            symbol: 股票代码
+            levels: (bid_px, bid_vol, ask_px, ask_vol) 二维数组，同一数据块的各行共享
+            row: 本订单簿所在行
+            timestamp_ns: 纳秒时间戳
+            timestamp: 已换算好的本地时间(批量换算时传入)，None 则在访问时由 timestamp_ns 换算
+        """
+        self.symbol = symbol
+        self._levels = levels
+        self._row = row
+        self._ts_ns = timestamp_ns
+        self._bids = None
+        self._asks = None
+        self._timestamp = timestamp
+    
+    def _build(self, px: np.ndarray, vol: np.ndarray) -> List[OrderBookLevel]:
+        row = self._row
+        return [OrderBookLevel(price=p, volume=v) for p, v in zip(px[row].tolist(), vol[row].tolist())]
+    
+    @property
+    def bids(self) -> List[OrderBookLevel]:
+        if self._bids is None:
+            self._bids = self._build(self._levels[0], self._levels[1])
+        return self._bids
+    
+    @bids.setter
+    def bids(self, value: List[OrderBookLevel]):
+        self._bids = value
+    
+    @property
+    def asks(self) -> List[OrderBookLevel]:
+        if self._asks is None:
+            self._asks = self._build(self._levels[2], self._levels[3])
+        return self._asks
+    
+    @asks.setter
+    def asks(self, value: List[OrderBookLevel]):
+        self._asks = value
+    
+    @property
+    def timestamp(self) -> datetime:
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._ts_ns / 1e9)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        self._timestamp = value
+        self._ts_ns = None
+    
+    def _value(self, column: int, index: int) -> float:
+        """从数组取第 index 档的值，缺档为0"""
+        values = self._levels[column]
+        if 0 <= index < values.shape[1]:
+            return values[self._row, index].item()
+        return 0.0
+    
+    def get_bid(self, index: int) -> float:
+        if self._bids is not None:
+            return super().get_bid(index)
+        return self._value(0, index)
+    
+    def get_ask(self, index: int) -> float:
+        if self._asks is not None:
+            return super().get_ask(index)
+        return self._value(2, index)
+    
+    def get_bid_vol(self, index: int) -> float:
+        if self._bids is not None:
+            return super().get_bid_vol(index)
+        return self._value(1, index)
+    
+    def get_ask_vol(self, index: int) -> float:
+        if self._asks is not None:
+            return super().get_ask_vol(index)
+        return self._value(3, index)
+    
+    def top_of_book(self) -> Tuple[float, float, float, float]:
+        if self._bids is not None or self._asks is not None:
+            return super().top_of_book()
+        return self._value(0, 0), self._value(1, 0), self._value(2, 0), self._value(3, 0)
+    
+    def _has_both_sides(self) -> bool:
+        if self._bids is not None or self._asks is not None:
+            return bool(self.bids) and bool(self.asks)
+        return self._levels[0].shape[1] > 0 and self._levels[2].shape[1] > 0
+    
+    def get_mid_price(self) -> float:
+        if not self._has_both_sides():
+            return 0.0
+        bid_px, _, ask_px, _ = self.top_of_book()
+        return (bid_px + ask_px) / 2
+    
+    def get_weighted_top_price(self) -> float:
+        if not self._has_both_sides():
+            return 0.0
+        bid_price, bid_vol, ask_price, ask_vol = self.top_of_book()
+        total_vol = bid_vol + ask_vol
+        if total_vol <= 0:
+            return (bid_price + ask_price) / 2
+        return (bid_price * ask_vol + ask_price * bid_vol) / total_vol
+    
+    def timestamp_ns(self) -> int:
+        if self._ts_ns is not None:
+            return self._ts_ns
+        return super().timestamp_ns()
@@ -1,5 +1,10 @@
 import AmazingData as ad
+import functools
 import logging
+import multiprocessing
+import operator
+import queue
+import sys
 import threading
 import time
 from typing import List, Callable, Dict, Any, Union
@@ -9,10 +14,12 @@ import logging
 import requests
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Callable
 from newstreamer.streams.base import LiveDataStreamBase
 from newstreamer.streams.to_redis import RedisClient
-from flask import Flask, jsonify, request
+from newstreamer.utils.fast_json import dumps, loads
+from flask import Flask, Response, jsonify, request
 import redis
 import json
 from flask import jsonify
@@ -53,12 +60,89 @@ REDIS_WRITE_PASSWORD = os.getenv("REDIS_WRITE_PASSWORD", REDIS_PASSWORD)
 REDIS_READ_USERNAME = os.getenv("REDIS_READ_USERNAME", REDIS_USERNAME)
 REDIS_READ_PASSWORD = os.getenv("REDIS_READ_PASSWORD", REDIS_PASSWORD)
 
+# 快照字段(含 code)，模块加载时构造一次 attrgetter：一次 C 层调用取出全部字段
+_SNAPSHOT_FIELDS = (
+    "code", "trade_time", "pre_close", "last", "open", "high", "low", "close",
+    "volume", "amount", "num_trades", "high_limited", "low_limited",
+    "iopv", "trading_phase_code",
+) + tuple(
+    f
+    for i in range(1, 6)
+    for f in (f"ask_price{i}", f"ask_volume{i}", f"bid_price{i}", f"bid_volume{i}")
+)
+_SNAPSHOT_GETTER = operator.attrgetter(*_SNAPSHOT_FIELDS)
+
+
+def _intern(value: Any) -> Any:
+    """驻留取值集合有限的字符串字段(代码、交易阶段)，各笔行情共用同一对象"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@functools.lru_cache(maxsize=32)
+def _public_attrs(cls: type) -> tuple:
+    """类上的公开、非可调用属性名，每个快照类型只反射一次"""
+    return tuple(
+        k for k in dir(cls)
+        if not k.startswith("_") and not callable(getattr(cls, k, None))
+    )
+
+
+def _generic_fields(snap: Any) -> Dict[str, Any]:
+    """通用提取：类级属性(按类型缓存) + 实例 __dict__ 中的公开非可调用属性"""
+    d = {k: getattr(snap, k, None) for k in _public_attrs(type(snap))}
+    for k, v in getattr(snap, "__dict__", {}).items():
+        if not k.startswith("_") and not callable(v):
+            d[k] = v
+    return d
+
+
+def _ingest_worker(q, flush_size: int, flush_interval: float) -> None:
+    """
+    快照写入子进程：从队列批量取出快照，按 code 去重后编码并以 pipeline 写入 Redis
+
+    队列元素为 (code, 字段值元组) 或 (code, 字典)；收到 None 时写出剩余数据并退出
+    """
+    redis_client = RedisClient(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        username=REDIS_WRITE_USERNAME,
+        password=REDIS_WRITE_PASSWORD,
+        prefix=REDIS_PREFIX,
+    )
+    buf: Dict[str, Any] = {}
+    deadline = None
+    running = True
+    while running:
+        try:
+            item = q.get(timeout=flush_interval)
+        except queue.Empty:
+            item = ()
+        if item is None:
+            running = False
+        elif item:
+            code, values = item
+            buf[code] = values
+            # 攒够 flush_size 条，或距本批第一条超过 flush_interval 秒时写出
+            if deadline is None:
+                deadline = time.monotonic() + flush_interval
+            if len(buf) < flush_size and time.monotonic() < deadline:
+                continue
+        deadline = None
+        if buf:
+            redis_client.write_many({
+                code: dumps(values if isinstance(values, dict) else dict(zip(_SNAPSHOT_FIELDS, values)))
+                for code, values in buf.items()
+            })
+            buf.clear()
+
+
 class AmazingDataStream(LiveDataStreamBase):
     """
     AmazingData 实时数据流实现
     """
 
-    def __init__(self, username: str, password: str, host: str, port: int):
+    def __init__(self, username: str, password: str, host: str, port: int, ingest_workers: int = 0):
         """
         初始化AmazingData流
         
@@ -67,6 +151,8 @@ class AmazingDataStream(LiveDataStreamBase):
             password: 密码
             host: API主机地址
             port: API端口
+            ingest_workers: 快照写入子进程数；0(默认)时在本进程的刷新线程中写入，
+                订阅全市场时可设为 os.cpu_count() // 2 等，回调线程只做字段提取和入队
         """
         super().__init__()
         self.subscribed_data = []
@@ -78,6 +164,30 @@ class AmazingDataStream(LiveDataStreamBase):
         self.subscribe_symbols = []
         self._is_running = False
         self._stream_thread: Optional[threading.Thread] = None
+        self._code_list_cache: Optional[List[str]] = None
+
+        # HTTP 轮询：复用同一个 Session(连接保活)，各标的请求由线程池并发发出
+        self.max_workers = 32
+        self._session = requests.Session()
+        self._session.auth = (self.username, self.password)
+        self._session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 快照写入缓冲：攒够 flush_size 条或每隔 flush_interval 秒以 pipeline 批量写入 Redis；
+        # 以 code 为键，同一批内同一标的只保留最新一条。缓冲中存放未序列化的字典，
+        # JSON 编码在刷新时进行，不占用行情回调线程，被覆盖的快照也不会被编码
+        self._pipe_buf: Dict[str, Dict[str, Any]] = {}
+        self._pipe_lock = threading.Lock()
+        self.flush_size = 128
+        self.flush_interval = 0.005
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        # 多进程写入：回调线程把字段值元组放入队列，由 ingest_workers 个子进程编码并写入 Redis。
+        # 每个子进程一个队列，同一 code 固定路由到同一子进程，保证同一标的按到达顺序写入
+        self.ingest_workers = max(int(ingest_workers), 0)
+        self._ingest_queues: List[Any] = []
+        self._ingest_procs: List[multiprocessing.Process] = []
         
         
         self.redis_client = RedisClient(
@@ -103,32 +213,64 @@ class AmazingDataStream(LiveDataStreamBase):
 
     
     def subscribe(self, subscribe_symbols: List[str]):
+        """
+        记录要订阅的标的，不启动订阅；随后调用 start_streaming 在后台线程中开始接收推送
+        
+        订阅线程已在运行时，新的标的列表要到下次启动订阅时才生效
+        """
         self.subscribe_symbols = subscribe_symbols
         logger.info(f"已订阅股票: {', '.join(subscribe_symbols)}")
 
-        base_data_object = ad.BaseData()
-        code_list = base_data_object.get_code_list(security_type='EXTRA_STOCK_A')
-
-        sub_data = ad.SubscribeData()
-
-        @sub_data.register(code_list=code_list, period=ad.constant.Period.snapshot.value)
-        def onSnapshot(data: Union[ad.constant.Snapshot, ad.constant.SnapshotIndex], period):
-            self._store_snapshot_by_code_json(data)
-            # 将单条快照写入 Redis，key=code，value=完整快照字典
-            # self._store_snapshot_by_code_json(data)
-
-        sub_data.run()
-
         def amz2redis(self, data: Any):
             
             try:
                 for code in data:
                     self.redis_client.write_data(code, data[code])
-                    logger.info(f"数据已写入 Redis：{code} -> {data[code]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("数据已写入 Redis：%s -> %r", code, data[code])
             except Exception as e:
                 logger.error(f"写入 Redis 时发生错误: {e}")
                 raise
     
+    def _get_code_list(self) -> List[str]:
+        """全部A股代码列表，首次调用时从 AmazingData 拉取后缓存在实例上"""
+        if self._code_list_cache is None:
+            self._code_list_cache = ad.BaseData().get_code_list(security_type='EXTRA_STOCK_A')
+        return self._code_list_cache
+
+    def _run_subscribe(self):
+        """
+        注册快照推送回调并阻塞运行 AmazingData 订阅
+
+        每条快照写入 Redis(key=code，value=完整快照字典)，并同步触发已注册的回调
+        """
+        # 只订阅调用方指定的标的；未指定时订阅全部A股
+        code_list = self.subscribe_symbols or self._get_code_list()
+        self.redis_client.prime_keys(code_list)
+
+        sub_data = ad.SubscribeData()
+
+        @sub_data.register(code_list=code_list, period=ad.constant.Period.snapshot.value)
+        def onSnapshot(data: Union[ad.constant.Snapshot, ad.constant.SnapshotIndex], period):
+            # sub_data.run() 无法中断：stop() 之后订阅线程仍会收到推送，此时丢弃，不再写入和回调
+            if not self._is_running:
+                return
+            self._store_snapshot_by_code_json(data)
+            self.on_market_data(data)
+
+        if self.ingest_workers:
+            self._start_ingest_workers()
+        else:
+            self._start_flush_thread()
+        try:
+            sub_data.run()
+        finally:
+            if self.ingest_workers:
+                self._stop_ingest_workers()
+            else:
+                self._stop_flush_thread()
+            self._is_running = False
+
     def unsubscribe(self):
         """取消所有订阅"""
         self.subscribe_symbols = []
@@ -144,22 +286,34 @@ class AmazingDataStream(LiveDataStreamBase):
         if not self.subscribe_symbols:
             return None
         
-        # 从API获取最新数据
+        # 从API并发获取最新数据，总耗时约为最慢的单次请求而非各请求之和
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="amz-http")
+        symbols = list(self.subscribe_symbols)
         data = {}
-        for symbol in self.subscribe_symbols:
-            url = f"{self._url}/live/cn/{symbol}"
-            try:
-                response = requests.get(url, auth=(self.username, self.password))
-                if response.status_code == 200:
-                    data[symbol] = response.json()
-                else:
-                    logger.error(f"获取数据失败: {symbol}, 错误码: {response.status_code}")
-            except requests.RequestException as e:
-                logger.error(f"请求数据失败: {symbol}, 错误: {e}")
+        for symbol, item in zip(symbols, self._executor.map(self._fetch_symbol, symbols)):
+            if item is not None:
+                data[symbol] = item
         
-        logger.info(f"获取最新市场数据: {data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("获取最新市场数据: %r", data)
         return data if data else None
 
+    def _fetch_symbol(self, symbol: str) -> Optional[Any]:
+        """请求单个标的的最新数据，失败返回 None"""
+        url = f"{self._url}/live/cn/{symbol}"
+        try:
+            response = self._session.get(url)
+            if response.status_code == 200:
+                # 直接解析响应字节，省去 requests 的编码探测与解码
+                return loads(response.content)
+            logger.error(f"获取数据失败: {symbol}, 错误码: {response.status_code}")
+        except requests.RequestException as e:
+            logger.error(f"请求数据失败: {symbol}, 错误: {e}")
+        except ValueError as e:
+            logger.error(f"解析数据失败: {symbol}, 错误: {e}")
+        return None
+
     def _store_snapshot_by_code(self, snap: Any) -> None:
         """将单只股票快照写入 Redis，key=code，value=快照字典"""
         code = getattr(snap, 'code', None) or getattr(snap, 'symbol', None)
@@ -170,7 +324,7 @@ class AmazingDataStream(LiveDataStreamBase):
         payload = self._snapshot_to_dict(snap)
         # RedisClient.write_data 会处理 datetime 等不可序列化对象
         self.redis_client.write_data(code, payload)
-        logger.info(f"已写入 Redis：{code}")
+        logger.debug("已写入 Redis：%s", code)
 
     # newstreamer/streams/Amazing_data_stream.py
     # 保留 code 字段：key=code，value=包含 code 在内的完整快照 JSON
@@ -178,17 +332,104 @@ class AmazingDataStream(LiveDataStreamBase):
     def _store_snapshot_by_code_json(self, snap: Any) -> None:
         # print("_store_snapshot_by_code_json")
         """将单只股票快照存入 Redis：key=code，value=完整快照(包含 code)。"""
-        code = getattr(snap, "code", None) or getattr(snap, "symbol", None)
+        code = _intern(getattr(snap, "code", None) or getattr(snap, "symbol", None))
         if not code:
             logger.warning("快照缺少 code/symbol 字段，已跳过")
             return
-        payload = self._snapshot_to_payload(snap)  # 保留 code
-        self.redis_client.write_data(code, payload)  # RedisClient 会处理 datetime 等序列化
-        logger.info(f"写入 Redis 成功：key={code}")
+        if self._ingest_queues:
+            self._enqueue_snapshot(code, snap)
+            return
+        payload = self._snapshot_to_payload(snap)  # 保留 code；序列化在 _flush_snapshots 中进行
+        with self._pipe_lock:
+            self._pipe_buf[code] = payload
+            full = len(self._pipe_buf) >= self.flush_size
+        # 刷新线程运行时由其负责写出(缓冲按 code 去重，大小不超过订阅标的数)，回调线程只做字段提取
+        if full and (self._flush_thread is None or not self._flush_thread.is_alive()):
+            self._flush_snapshots()
+
+    def _flush_snapshots(self) -> None:
+        """取出缓冲区中的快照，以一次 pipeline 写入 Redis"""
+        with self._pipe_lock:
+            if not self._pipe_buf:
+                return
+            batch, self._pipe_buf = self._pipe_buf, {}
+        # 写入失败(如连接断开)时丢弃本批：快照只保留最新值，下一笔行情会覆盖，redis-py 会在下次请求时重连
+        self.redis_client.write_many({code: dumps(payload) for code, payload in batch.items()})
+
+    def _start_flush_thread(self) -> None:
+        """启动定时刷新线程，保证行情稀疏时缓冲区也能及时写出"""
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        self._flush_stop.clear()
+
+        def flush_loop():
+            while not self._flush_stop.wait(self.flush_interval):
+                self._flush_snapshots()
+
+        self._flush_thread = threading.Thread(target=flush_loop, daemon=True)
+        self._flush_thread.start()
+
+    def _stop_flush_thread(self) -> None:
+        """停止定时刷新线程并写出剩余快照"""
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self._flush_snapshots()
+
+    def _enqueue_snapshot(self, code: str, snap: Any) -> None:
+        """将快照字段值放入写入队列；标准快照只传元组，组装字典与编码在子进程中完成"""
+        try:
+            item = (code, _SNAPSHOT_GETTER(snap))
+        except AttributeError:
+            item = (code, self._snapshot_to_payload(snap))
+        queues = self._ingest_queues
+        try:
+            queues[hash(code) % len(queues)].put_nowait(item)
+        except queue.Full:
+            # 写入跟不上时丢弃：快照只保留最新值，下一笔行情会覆盖
+            logger.warning(f"快照写入队列已满，丢弃: {code}")
+
+    def _start_ingest_workers(self) -> None:
+        """启动快照写入子进程"""
+        if self._ingest_procs:
+            return
+        queues = [multiprocessing.Queue(maxsize=10_000) for _ in range(self.ingest_workers)]
+        for q in queues:
+            proc = multiprocessing.Process(
+                target=_ingest_worker,
+                args=(q, self.flush_size, self.flush_interval),
+                daemon=True,
+            )
+            proc.start()
+            self._ingest_procs.append(proc)
+        self._ingest_queues = queues
+        logger.info(f"已启动 {self.ingest_workers} 个快照写入进程")
+
+    def _stop_ingest_workers(self) -> None:
+        """通知写入子进程写出剩余快照并退出"""
+        queues, self._ingest_queues = self._ingest_queues, []
+        if not queues:
+            return
+        for q in queues:
+            q.put(None)
+        for proc in self._ingest_procs:
+            proc.join()
+        self._ingest_procs = []
 
     def _snapshot_to_payload(self, snap: Any) -> Dict[str, Any]:
         # print("_snapshot_to_payload")
         """提取快照为字典，保留 code 字段。"""
+        # 快路径：字段齐全的标准快照(Snapshot/SnapshotIndex)
+        try:
+            d = dict(zip(_SNAPSHOT_FIELDS, _SNAPSHOT_GETTER(snap)))
+        except AttributeError:
+            pass
+        else:
+            d["code"] = _intern(d["code"])
+            d["trading_phase_code"] = _intern(d["trading_phase_code"])
+            return d
+
         fields = [
             "trade_time", "pre_close", "last", "open", "high", "low", "close",
             "volume", "amount", "num_trades", "high_limited", "low_limited",
@@ -213,12 +454,7 @@ class AmazingDataStream(LiveDataStreamBase):
         # 若内容过少，追加通用提取（非私有、不可调用）
         if len(d) < 4:
             try:
-                for k in dir(snap):
-                    if k.startswith("_"):
-                        continue
-                    v = getattr(snap, k, None)
-                    if callable(v):
-                        continue
+                for k, v in _generic_fields(snap).items():
                     d.setdefault(k, v)
             except Exception:
                 pass
@@ -227,6 +463,11 @@ class AmazingDataStream(LiveDataStreamBase):
 
     def _snapshot_to_dict(self, snap: Any) -> Dict[str, Any]:
         """将 Amazing 快照对象转为字典，优先提取常用字段，缺失再回退通用提取。"""
+        try:
+            return dict(zip(_SNAPSHOT_FIELDS, _SNAPSHOT_GETTER(snap)))
+        except AttributeError:
+            pass
+
         # 明确列出常用/关键字段（你贴出的字段名）
         fields = [
             'code', 'trade_time', 'pre_close', 'last', 'open', 'high', 'low', 'close',
@@ -247,13 +488,7 @@ class AmazingDataStream(LiveDataStreamBase):
         # 若上面字段不全，补充一次通用提取（非私有且非可调用）
         if len(d) <= 2:
             try:
-                for k in dir(snap):
-                    if k.startswith('_'):
-                        continue
-                    v = getattr(snap, k, None)
-                    if callable(v):
-                        continue
-                    d[k] = v
+                d.update(_generic_fields(snap))
             except Exception:
                 pass
 
@@ -263,38 +498,40 @@ class AmazingDataStream(LiveDataStreamBase):
         """
         启动数据流
         
-        每隔 `interval` 秒获取一次最新的市场数据并触发回调
+        在后台线程中运行 AmazingData 订阅，每收到一条快照推送即触发回调
         
         Args:
-            interval: 数据刷新间隔（秒）
+            interval: 保留以兼容旧接口，推送模式下不再使用
         """
         if self._is_running:
             logger.warning("数据流已经在运行中。")
             return
         
         self._is_running = True
-        self._stream_thread = threading.Thread(target=self._stream_data, args=(interval,))
+        if self._stream_thread is not None and self._stream_thread.is_alive():
+            # 上次 stop() 后订阅线程仍在运行(无法中断)：直接恢复投递，避免重复订阅导致每条快照推送两次
+            logger.info("数据流已恢复(复用仍在运行的订阅线程)")
+            return
+        self._stream_thread = threading.Thread(target=self._run_subscribe, daemon=True)
         self._stream_thread.start()
-        logger.info(f"数据流已启动，间隔：{interval}秒")
+        logger.info("数据流已启动(快照推送)")
 
     def stop(self):
         """停止数据流"""
         self._is_running = False
+        # sub_data.run() 没有退出接口，订阅线程为守护线程，这里只做有限等待；
+        # 仍在运行的线程保留引用，推送在 _is_running 为 False 时被丢弃，再次 start_streaming 时复用
         if self._stream_thread:
-            self._stream_thread.join()
+            self._stream_thread.join(timeout=1.0)
+            if not self._stream_thread.is_alive():
+                self._stream_thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("数据流已停止")
 
-    def _stream_data(self, interval: int):
-        """获取并处理实时数据"""
-        while self._is_running:
-            data = self.get_latest_data()
-            if data:
-                self.on_market_data(data)
-            time.sleep(interval)
-
     def _extract_ts_from_snapshot(self, snap: Any) -> str:
         # 优先用 trade_time（datetime），其次 timestamp/ts/time...
-        print("_extract_ts_from_snapshot")
         if hasattr(snap, "trade_time") and getattr(snap, "trade_time"):
             dt = getattr(snap, "trade_time")
             try:
@@ -322,11 +559,7 @@ class AmazingDataStream(LiveDataStreamBase):
         Args:
             data: 最新的市场数据
         """
-        for callback in self.callbacks:
-            try:
-                callback(data)
-            except Exception as e:
-                logger.error(f"回调函数执行失败: {callback.__name__}, 错误: {str(e)}")
+        super().on_market_data(data)
     
     def is_running(self) -> bool:
         """
@@ -344,8 +577,10 @@ class AmazingDataStream(LiveDataStreamBase):
     def _api_get_all_stock_data(self):
         rc = self.redis_client
         keys = list(rc.client.scan_iter("*"))  # 或 rc.keys("*") 若你已封装
-        data = {k: rc.get_data(k) for k in keys}
-        return jsonify({"status": "success", "data": data, "count": len(data)}), 200
+        data = rc.get_many(keys)
+        # 全市场快照体量大，直接用 fast_json 序列化，绕过 jsonify 的标准库 json
+        body = dumps({"status": "success", "data": data, "count": len(data)})
+        return Response(body, mimetype="application/json"), 200
 
     def _api_get_stock_data(self, code: str):
         rc = self.redis_client
@@ -374,6 +609,9 @@ if __name__ == '__main__':
     # market_snapshot = data_stream.redis_client.read_hash_all(ts_key)  # -> { "300535.SZ": {...}, "300410.SZ": {...}, ... }
     # print(market_snapshot)
     data_stream.subscribe(['920299'])
+    data_stream.start_streaming()
+    while data_stream.is_running():
+        time.sleep(1)
     # print(data_stream.redis_client.get_data('688678.SH'))
 
     # # # 启动数据流，每30秒获取一次数据
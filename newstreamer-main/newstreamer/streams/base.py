@@ -1,12 +1,17 @@
 """数据流基类定义"""
 
 from abc import ABC, abstractmethod
-from typing import Generator, List, Optional, Callable, Union, Dict, Any
+from typing import Generator, List, Optional, Callable, Union, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _callback_name(callback: Callable) -> str:
+    """回调的日志名称；partial 等可调用对象没有 __name__ 时使用 repr"""
+    return getattr(callback, '__name__', None) or repr(callback)
+
+
 class DataStreamBase(ABC):
     """
     数据流基类 - 简单生成器模式
@@ -82,7 +87,12 @@ class LiveDataStreamBase(ABC):
     
     def __init__(self):
         """初始化实时数据流"""
-        self.callbacks: List[Callable] = []
+        # 以 dict 作有序集合：O(1) 去重/移除，迭代保持注册顺序；值为注册时解析好的日志名称
+        self.callbacks: Dict[Callable, str] = {}
+        # 分发用的回调快照，仅在增删回调时重建，每个 tick 无需复制
+        self._callback_snapshot: Tuple[Callable, ...] = ()
+        # 为 True 时分发不再逐个捕获异常，回调异常直接抛给数据线程；仅用于确认不会抛异常的回调
+        self.trusted_callbacks = False
         self._is_running = False
         self.subscribe_symbols: List[str] = []
     
@@ -109,8 +119,9 @@ class LiveDataStreamBase(ABC):
             callback: 回调函数，接收数据列表作为参数
         """
         if callback not in self.callbacks:
-            self.callbacks.append(callback)
-            logger.info(f"已添加回调函数: {callback.__name__}")
+            name = self.callbacks[callback] = _callback_name(callback)
+            self._callback_snapshot = tuple(self.callbacks)
+            logger.info(f"已添加回调函数: {name}")
     
     def remove_callback(self, callback: Callable):
         """
@@ -119,9 +130,10 @@ class LiveDataStreamBase(ABC):
         Args:
             callback: 要移除的回调函数
         """
-        if callback in self.callbacks:
-            self.callbacks.remove(callback)
-            logger.info(f"已移除回调函数: {callback.__name__}")
+        name = self.callbacks.pop(callback, None)
+        if name is not None:
+            self._callback_snapshot = tuple(self.callbacks)
+            logger.info(f"已移除回调函数: {name}")
     
     @abstractmethod
     def get_latest_data(self) -> Optional[Union[Dict, Any]]:
@@ -155,11 +167,19 @@ class LiveDataStreamBase(ABC):
         Args:
             data: 市场数据
         """
-        for callback in self.callbacks:
+        # 迭代快照：回调执行期间其他线程增删回调不会导致 dict 迭代出错
+        callbacks = self._callback_snapshot
+        if self.trusted_callbacks:
+            for callback in callbacks:
+                callback(data)
+            return
+        for callback in callbacks:
             try:
                 callback(data)
             except Exception as e:
-                logger.error(f"回调函数执行失败: {callback.__name__}, 错误: {str(e)}")
+                # 回调可能已被其他线程移除，此时现场解析名称
+                name = self.callbacks.get(callback) or _callback_name(callback)
+                logger.error(f"回调函数执行失败: {name}, 错误: {str(e)}")
     
     def is_running(self) -> bool:
         """
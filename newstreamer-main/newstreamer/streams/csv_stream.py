@@ -1,19 +1,92 @@
 """CSV数据流实现
 
 从CSV文件读取历史数据，支持回测和数据分析。
+默认在 connect 时整表解析一次并按股票代码建立索引，之后的查询都不再读取文件；
+文件超出内存时可开启 streaming，数据按块流式读取：安装 pyarrow 时使用其多线程解析器
+(数值列保持类型化缓冲)，否则回退到 pandas 的 chunksize 分块读取，每次查询扫描一遍文件。
 """
 
-from typing import Generator, Optional, Dict, Any
+from typing import Generator, Optional, Dict, Any, Iterator
+import time
+import numpy as np
 import pandas as pd
 import logging
 from pathlib import Path
-from datetime import datetime
 from newstreamer.streams.base import DataStreamBase
-from newstreamer.models.orderbook import OrderBook, OrderBookLevel
+from newstreamer.models.orderbook import OrderBook, LazyOrderBook
 from newstreamer.models.market_data import MarketData, BookSnapshotData
+from newstreamer.utils.pacing import Pacer
+from newstreamer.utils.book_analytics import mid_prices, spreads
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # 可选依赖: pip install pyarrow
+    pa = None
+
+HAS_PYARROW = pa is not None
 
 logger = logging.getLogger(__name__)
 
+# 流式读取的块大小(pyarrow 按字节，pandas 按行)
+_BLOCK_SIZE = 64 << 20
+_CHUNK_ROWS = 500_000
+
+_NS_PER_SECOND = 1_000_000_000
+# 按 15 分钟查询 UTC 偏移：各时区的夏令时切换都发生在整刻钟
+_OFFSET_BUCKET_SECONDS = 900
+
+
+def _local_datetimes(ts_ns: np.ndarray) -> list:
+    """
+    纳秒时间戳数组批量转为本地时间的 datetime 列表，结果与逐个 datetime.fromtimestamp 一致
+    
+    UTC 偏移每 15 分钟查询一次，换算在 numpy 中整体完成，
+    最后由 datetime64[us].tolist() 一次性生成 datetime 对象
+    """
+    if not len(ts_ns):
+        return []
+    buckets, inverse = np.unique(ts_ns // (_NS_PER_SECOND * _OFFSET_BUCKET_SECONDS), return_inverse=True)
+    offsets = np.array(
+        [time.localtime(b * _OFFSET_BUCKET_SECONDS).tm_gmtoff for b in buckets.tolist()], dtype=np.int64
+    ) * _NS_PER_SECOND
+    local_us = (ts_ns + offsets[inverse.reshape(-1)] + 500) // 1000
+    return local_us.astype('datetime64[us]').tolist()
+
+
+def _column_dtypes(symbol_column: str, timestamp_column: str) -> Dict[str, Any]:
+    """
+    已知列的类型，解析时直接写入对应类型的缓冲区，省去类型推断与逐行转换
+    
+    股票代码按字符串读取，保留前导零；文件中不存在的列会被忽略。
+    档位数量列按 float64 读取：含缺失值的整数列经 pandas 写出后为 '100.0' 形式，
+    按 int64 严格解析会失败；构建档位时再转为整数
+    """
+    dtypes: Dict[str, Any] = {
+        symbol_column: str,
+        timestamp_column: np.int64,
+        'trade_date': str,
+        'name': str,
+    }
+    for i in range(1, 6):
+        dtypes[f'bid{i}'] = np.float64
+        dtypes[f'ask{i}'] = np.float64
+        dtypes[f'bid_vol{i}'] = np.float64
+        dtypes[f'ask_vol{i}'] = np.float64
+    for name in ('price', 'amount', 'open', 'high', 'low', 'close', 'pre_close',
+                 'chg_pct', 'chg_amount', 'turnover_rate'):
+        dtypes[name] = np.float64
+    return dtypes
+
+
+def _arrow_column_types(symbol_column: str, timestamp_column: str) -> Dict[str, Any]:
+    """已知列的 Arrow 类型，与 _column_dtypes 一致"""
+    return {
+        name: pa.string() if dtype is str else pa.from_numpy_dtype(dtype)
+        for name, dtype in _column_dtypes(symbol_column, timestamp_column).items()
+    }
+
 
 class CSVMarketDataStream(DataStreamBase):
     """
@@ -42,7 +115,8 @@ class CSVMarketDataStream(DataStreamBase):
         data_type: str = 'orderbook',
         symbol_column: str = 'symbol',
         timestamp_column: str = 'timestamp',
-        encoding: str = 'utf-8'
+        encoding: str = 'utf-8',
+        streaming: bool = False
     ):
         """
         初始化CSV数据流
@@ -53,6 +127,8 @@ class CSVMarketDataStream(DataStreamBase):
             symbol_column: 股票代码列名
             timestamp_column: 时间戳列名
             encoding: 文件编码
+            streaming: 是否流式读取。默认 False，connect 时整表载入并建立索引；
+                       True 时不载入数据，每次查询按块扫描文件，适用于超出内存的大文件
         """
         super().__init__(market_type='stock')
         self.csv_path = Path(csv_path)
@@ -60,29 +136,121 @@ class CSVMarketDataStream(DataStreamBase):
         self.symbol_column = symbol_column
         self.timestamp_column = timestamp_column
         self.encoding = encoding
-        self.data_df: Optional[pd.DataFrame] = None
+        self._dtype_map = _column_dtypes(symbol_column, timestamp_column)
+        self.streaming = streaming
+        self._streaming = False
+        # 整表模式：按股票代码稳定排序后的列数组，各股票对应连续的行区间(切片即视图，无需复制)
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._sym_slices: Dict[Any, slice] = {}
+        self._row_order: Optional[np.ndarray] = None
+    
+    @property
+    def data_df(self) -> Optional[pd.DataFrame]:
+        """
+        全表 DataFrame(按原始行序)
+        
+        数据以列数组形式保存，访问时才重新组装；流式读取模式下首次访问时整表载入。
+        get_orderbook 等方法不依赖此属性
+        """
+        if self._columns is None and self._streaming and self._connected:
+            self._load_columns(self._read_full())
+        if self._columns is None:
+            return None
+        df = pd.DataFrame(self._columns, index=self._row_order)
+        return df.sort_index()
+    
+    @data_df.setter
+    def data_df(self, value: Optional[pd.DataFrame]):
+        if value is None:
+            self._columns = None
+            self._sym_slices = {}
+            self._row_order = None
+        else:
+            self._load_columns(value)
+    
+    def _load_columns(self, df: pd.DataFrame):
+        """
+        将 DataFrame 转为按股票代码分段的列数组，随后不再持有 DataFrame
+        
+        稳定排序保证同一股票内的行保持原有(时间)顺序
+        """
+        codes, uniques = pd.factorize(df[self.symbol_column], sort=False)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        ids = np.arange(len(uniques))
+        starts = np.searchsorted(sorted_codes, ids, side='left')
+        ends = np.searchsorted(sorted_codes, ids, side='right')
+        
+        self._columns = {name: df[name].to_numpy()[order] for name in df.columns}
+        self._sym_slices = {
+            sym: slice(lo, hi) for sym, lo, hi in zip(uniques.tolist(), starts.tolist(), ends.tolist())
+        }
+        self._row_order = order
+    
+    def _read_full(self) -> pd.DataFrame:
+        """整表解析CSV(pyarrow 多线程解析一次，否则 pandas)"""
+        if HAS_PYARROW:
+            return pacsv.read_csv(
+                self.csv_path,
+                read_options=self._read_options(),
+                convert_options=self._convert_options(),
+            ).to_pandas()
+        return pd.read_csv(self.csv_path, encoding=self.encoding, dtype=self._dtype_map)
+    
+    def _read_options(self):
+        return pacsv.ReadOptions(block_size=_BLOCK_SIZE, use_threads=True, encoding=self.encoding)
+    
+    def _convert_options(self):
+        return pacsv.ConvertOptions(
+            column_types=_arrow_column_types(self.symbol_column, self.timestamp_column)
+        )
+    
+    def _open_reader(self):
+        """打开 CSV 流式读取器(每次扫描重新打开，读取器只能单向遍历一次)"""
+        return pacsv.open_csv(
+            self.csv_path,
+            read_options=self._read_options(),
+            convert_options=self._convert_options(),
+        )
+    
+    def _iter_chunks(self, usecols=None) -> Iterator[pd.DataFrame]:
+        """未安装 pyarrow 时按行数分块读取 CSV，内存占用以单块为上限"""
+        with pd.read_csv(self.csv_path, encoding=self.encoding, dtype=self._dtype_map,
+                         usecols=usecols, chunksize=_CHUNK_ROWS) as reader:
+            yield from reader
+    
+    def _check_columns(self, columns):
+        """验证必要列"""
+        required_columns = [self.symbol_column, self.timestamp_column]
+        missing_columns = [col for col in required_columns 
+                         if col not in columns]
+        
+        if missing_columns:
+            raise ValueError(f"CSV文件缺少必要列: {missing_columns}")
     
     def connect(self):
-        """加载CSV文件"""
+        """打开CSV文件：默认整表解析一次并建立索引；streaming 模式仅读取表头，数据按需分块读取"""
         try:
             if not self.csv_path.exists():
                 raise FileNotFoundError(f"CSV文件不存在: {self.csv_path}")
             
-            self.data_df = pd.read_csv(
-                self.csv_path,
-                encoding=self.encoding
-            )
-            
-            # 验证必要列
-            required_columns = [self.symbol_column, self.timestamp_column]
-            missing_columns = [col for col in required_columns 
-                             if col not in self.data_df.columns]
-            
-            if missing_columns:
-                raise ValueError(f"CSV文件缺少必要列: {missing_columns}")
-            
+            if self.streaming:
+                # 流式模式只读取表头；读取器用完即关闭
+                if HAS_PYARROW:
+                    with self._open_reader() as reader:
+                        columns = reader.schema.names
+                else:
+                    columns = pd.read_csv(self.csv_path, encoding=self.encoding, nrows=0).columns
+                self._check_columns(columns)
+                self._streaming = True
+                logger.info(f"CSV数据流已打开(流式读取): {self.csv_path}")
+            else:
+                # 整表模式：只解析一次，必要列在解析结果上检查
+                df = self._read_full()
+                self._check_columns(df.columns)
+                self._load_columns(df)
+                logger.info(f"CSV数据流已载入: {self.csv_path}, {len(self._row_order)}行")
             self._connected = True
-            logger.info(f"CSV数据流已加载: {self.csv_path}, 共 {len(self.data_df)} 条记录")
             
         except Exception as e:
             self._handle_error(e)
@@ -91,9 +259,54 @@ class CSVMarketDataStream(DataStreamBase):
     def disconnect(self):
         """断开连接(释放数据)"""
         self.data_df = None
+        self._streaming = False
         self._connected = False
         logger.info("CSV数据流已断开")
     
+    def _check_connected(self):
+        if not self._connected or (not self._streaming and self._columns is None):
+            raise ConnectionError("数据流未连接，请先调用connect()")
+    
+    def _iter_symbol_columns(self, symbol: str) -> Iterator[Dict[str, np.ndarray]]:
+        """按块产出指定股票的数据，每块为 列名 -> numpy 数组"""
+        if self._columns is None:
+            if HAS_PYARROW:
+                for batch in self._open_reader():
+                    filtered = batch.filter(pc.equal(batch.column(self.symbol_column), symbol))
+                    if filtered.num_rows:
+                        yield {
+                            name: filtered.column(name).to_numpy(zero_copy_only=False)
+                            for name in filtered.schema.names
+                        }
+            else:
+                for chunk in self._iter_chunks():
+                    sub = chunk[chunk[self.symbol_column] == symbol]
+                    if len(sub):
+                        yield {name: sub[name].to_numpy() for name in sub.columns}
+            return
+        
+        rows = self._sym_slices.get(symbol)
+        if rows is not None:
+            yield {name: values[rows] for name, values in self._columns.items()}
+    
+    @staticmethod
+    def _level_arrays(columns: Dict[str, np.ndarray], side: str):
+        """
+        取出一侧的价格、数量二维数组(行=时刻，列=档位)
+        
+        只包含价格列与数量列同时存在的档位，与逐行读取时的规则一致；
+        数量列按浮点读取，此处转为整数(缺失值记为0)
+        """
+        levels = [i for i in range(1, 6)
+                  if f'{side}{i}' in columns and f'{side}_vol{i}' in columns]
+        n = len(columns[next(iter(columns))])
+        if not levels:
+            return np.empty((n, 0), dtype=np.float64), np.empty((n, 0), dtype=np.int64)
+        px = np.column_stack([np.asarray(columns[f'{side}{i}'], dtype=np.float64) for i in levels])
+        vol = np.column_stack([np.asarray(columns[f'{side}_vol{i}'], dtype=np.float64) for i in levels])
+        vol = np.nan_to_num(vol, copy=False).astype(np.int64)
+        return px, vol
+    
     def get_orderbook(self, symbol: str) -> Generator[OrderBook, None, None]:
         """
         获取订单簿数据流
@@ -102,70 +315,80 @@ class CSVMarketDataStream(DataStreamBase):
             symbol: 股票代码
             
         Yields:
-            OrderBook对象
+            OrderBook对象(LazyOrderBook，档位列表按需构建)
             
         Raises:
             ConnectionError: 如果未连接
             ValueError: 如果数据类型不是orderbook
         """
-        if not self._connected or self.data_df is None:
-            raise ConnectionError("数据流未连接，请先调用connect()")
+        self._check_connected()
         
         if self.data_type != 'orderbook':
             raise ValueError(f"数据类型错误: {self.data_type}，期望: orderbook")
         
-        # 筛选指定股票的数据
-        symbol_data = self.data_df[
-            self.data_df[self.symbol_column] == symbol
-        ]
-        
-        if symbol_data.empty:
-            logger.warning(f"未找到股票 {symbol} 的数据")
-            return
-        
-        logger.info(f"开始读取 {symbol} 的订单簿数据，共 {len(symbol_data)} 条")
+        logger.info(f"开始读取 {symbol} 的订单簿数据")
         
+        count = 0
         try:
-            for _, row in symbol_data.iterrows():
-                # 提取五档数据
-                bids = []
-                bid_vols = []
-                asks = []
-                ask_vols = []
+            for columns in self._iter_symbol_columns(symbol):
+                # 五档价格/数量列一次性取为二维数组(行=时刻，列=档位)，
+                # 订单簿对象只引用其中一行，档位列表与时间戳在访问时才构建
+                ts = np.asarray(columns[self.timestamp_column], dtype=np.int64)
+                bid_px, bid_vol = self._level_arrays(columns, 'bid')
+                ask_px, ask_vol = self._level_arrays(columns, 'ask')
+                levels = (bid_px, bid_vol, ask_px, ask_vol)
+                # 时间戳按块整体换算，免去逐行 fromtimestamp 的时区查询
+                stamps = _local_datetimes(ts)
                 
-                for i in range(1, 6):  # 5档
-                    # 买价买量
-                    bid_key = f'bid{i}'
-                    bid_vol_key = f'bid_vol{i}'
-                    if bid_key in row and bid_vol_key in row:
-                        bids.append(float(row[bid_key]))
-                        bid_vols.append(int(row[bid_vol_key]))
-                    
-                    # 卖价卖量
-                    ask_key = f'ask{i}'
-                    ask_vol_key = f'ask_vol{i}'
-                    if ask_key in row and ask_vol_key in row:
-                        asks.append(float(row[ask_key]))
-                        ask_vols.append(int(row[ask_vol_key]))
-                
-                # 创建订单簿对象
-                bid_levels = [OrderBookLevel(price=p, volume=v) 
-                             for p, v in zip(bids, bid_vols)]
-                ask_levels = [OrderBookLevel(price=p, volume=v) 
-                             for p, v in zip(asks, ask_vols)]
-                
-                orderbook = OrderBook(
-                    symbol=symbol,
-                    timestamp=datetime.fromtimestamp(int(row[self.timestamp_column]) / 1e9),
-                    bids=bid_levels,
-                    asks=ask_levels
-                )
-                
-                yield orderbook
+                for k, (t, stamp) in enumerate(zip(ts.tolist(), stamps)):
+                    count += 1
+                    yield LazyOrderBook(symbol, levels, k, t, stamp)
                 
         except Exception as e:
             self._handle_error(e)
             raise
+        
+        if not count:
+            logger.warning(f"未找到股票 {symbol} 的数据")
+    
+    def get_orderbook_batches(self, symbol: str) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        按块获取订单簿数据的列数组，不构造逐行的 OrderBook 对象
+        
+        适合批量计算的下游(回测信号、统计)，中间价与价差已按块预先算好。
+        
+        Args:
+            symbol: 股票代码
+            
+        Yields:
+            字典: timestamp(纳秒, int64)、bid_px/bid_vol/ask_px/ask_vol(二维，行=时刻，列=档位)、
+            mid_price、spread(一维，任一侧无报价时为0)
+            
+        Raises:
+            ConnectionError: 如果未连接
+            ValueError: 如果数据类型不是orderbook
+        """
+        self._check_connected()
+        
+        if self.data_type != 'orderbook':
+            raise ValueError(f"数据类型错误: {self.data_type}，期望: orderbook")
+        
+        for columns in self._iter_symbol_columns(symbol):
+            ts = np.asarray(columns[self.timestamp_column], dtype=np.int64)
+            bid_px, bid_vol = self._level_arrays(columns, 'bid')
+            ask_px, ask_vol = self._level_arrays(columns, 'ask')
+            zeros = np.zeros(len(ts), dtype=np.float64)
+            top_bid = bid_px[:, 0] if bid_px.shape[1] else zeros
+            top_ask = ask_px[:, 0] if ask_px.shape[1] else zeros
+            yield {
+                'timestamp': ts,
+                'bid_px': bid_px,
+                'bid_vol': bid_vol,
+                'ask_px': ask_px,
+                'ask_vol': ask_vol,
+                'mid_price': mid_prices(top_bid, top_ask),
+                'spread': spreads(top_bid, top_ask),
+            }
     
     def get_market_data(self, symbol: str) -> Generator[MarketData, None, None]:
         """
@@ -181,49 +404,72 @@ class CSVMarketDataStream(DataStreamBase):
             ConnectionError: 如果未连接
             ValueError: 如果数据类型不是market
         """
-        if not self._connected or self.data_df is None:
-            raise ConnectionError("数据流未连接，请先调用connect()")
+        self._check_connected()
         
         if self.data_type != 'market':
             raise ValueError(f"数据类型错误: {self.data_type}，期望: market")
         
-        # 筛选指定股票的数据
-        symbol_data = self.data_df[
-            self.data_df[self.symbol_column] == symbol
-        ]
-        
-        if symbol_data.empty:
-            logger.warning(f"未找到股票 {symbol} 的数据")
-            return
-        
-        logger.info(f"开始读取 {symbol} 的市场数据，共 {len(symbol_data)} 条")
+        logger.info(f"开始读取 {symbol} 的市场数据")
         
+        count = 0
         try:
-            for _, row in symbol_data.iterrows():
-                # 构建市场数据
-                market_data = MarketData(
-                    symbol=symbol,
-                    trade_date=row.get('trade_date', ''),
-                    timestamp=int(row[self.timestamp_column]),
-                    price=float(row.get('price', 0)),
-                    volume=int(row.get('volume', 0)),
-                    amount=float(row.get('amount', 0)),
-                    open=float(row.get('open', 0)),
-                    high=float(row.get('high', 0)),
-                    low=float(row.get('low', 0)),
-                    close=float(row.get('close', 0)),
-                    pre_close=float(row.get('pre_close', 0)),
-                    name=row.get('name'),
-                    chg_pct=float(row['chg_pct']) if 'chg_pct' in row else None,
-                    chg_amount=float(row['chg_amount']) if 'chg_amount' in row else None,
-                    turnover_rate=float(row['turnover_rate']) if 'turnover_rate' in row else None
-                )
+            for columns in self._iter_symbol_columns(symbol):
+                # 列是否存在在循环外判断一次；各列整体转换类型后取为 Python 列表
+                n = len(columns[self.timestamp_column])
+                
+                def column(name, dtype=None, default=None):
+                    values = columns.get(name)
+                    if values is None:
+                        return [default] * n
+                    # 已按 _dtype_map 解析的列类型一致，asarray 不会复制
+                    return (np.asarray(values, dtype=dtype) if dtype else values).tolist()
                 
-                yield market_data
+                rows = zip(
+                    column('trade_date', default=''),
+                    column(self.timestamp_column, np.int64),
+                    column('price', np.float64, 0.0),
+                    column('volume', np.int64, 0),
+                    column('amount', np.float64, 0.0),
+                    column('open', np.float64, 0.0),
+                    column('high', np.float64, 0.0),
+                    column('low', np.float64, 0.0),
+                    column('close', np.float64, 0.0),
+                    column('pre_close', np.float64, 0.0),
+                    column('name'),
+                    column('chg_pct', np.float64),
+                    column('chg_amount', np.float64),
+                    column('turnover_rate', np.float64),
+                )
+                for (trade_date, ts, price, volume, amount, open_, high, low, close,
+                     pre_close, name, chg_pct, chg_amount, turnover_rate) in rows:
+                    # 构建市场数据
+                    market_data = MarketData(
+                        symbol=symbol,
+                        trade_date=trade_date,
+                        timestamp=ts,
+                        price=price,
+                        volume=volume,
+                        amount=amount,
+                        open=open_,
+                        high=high,
+                        low=low,
+                        close=close,
+                        pre_close=pre_close,
+                        name=name,
+                        chg_pct=chg_pct,
+                        chg_amount=chg_amount,
+                        turnover_rate=turnover_rate
+                    )
+                    
+                    count += 1
+                    yield market_data
                 
         except Exception as e:
             self._handle_error(e)
             raise
+        
+        if not count:
+            logger.warning(f"未找到股票 {symbol} 的数据")
     
     def get_symbols(self) -> list:
         """
@@ -232,10 +478,33 @@ class CSVMarketDataStream(DataStreamBase):
         Returns:
             股票代码列表
         """
-        if not self._connected or self.data_df is None:
-            raise ConnectionError("数据流未连接，请先调用connect()")
+        self._check_connected()
+        
+        if self._columns is None:
+            # 按块去重，保持首次出现的顺序
+            symbols: Dict[str, None] = {}
+            if HAS_PYARROW:
+                for batch in self._open_reader():
+                    symbols.update(dict.fromkeys(pc.unique(batch.column(self.symbol_column)).to_pylist()))
+            else:
+                for chunk in self._iter_chunks(usecols=[self.symbol_column]):
+                    symbols.update(dict.fromkeys(chunk[self.symbol_column].unique().tolist()))
+            return list(symbols)
         
-        return self.data_df[self.symbol_column].unique().tolist()
+        return list(self._sym_slices)
+    
+    def _iter_min_max(self, column: str) -> Iterator[tuple]:
+        """按块产出指定列的 (最小值, 最大值)，跳过空块"""
+        if HAS_PYARROW:
+            for batch in self._open_reader():
+                mm = pc.min_max(batch.column(column)).as_py()
+                if mm['min'] is not None:
+                    yield mm['min'], mm['max']
+        else:
+            for chunk in self._iter_chunks(usecols=[column]):
+                values = chunk[column]
+                if len(values):
+                    yield values.min(), values.max()
     
     def get_date_range(self) -> tuple:
         """
@@ -244,12 +513,17 @@ class CSVMarketDataStream(DataStreamBase):
         Returns:
             (最早时间戳, 最晚时间戳)
         """
-        if not self._connected or self.data_df is None:
-            raise ConnectionError("数据流未连接，请先调用connect()")
+        self._check_connected()
+        
+        if self._columns is None:
+            min_ts = max_ts = None
+            for lo, hi in self._iter_min_max(self.timestamp_column):
+                min_ts = lo if min_ts is None else min(min_ts, lo)
+                max_ts = hi if max_ts is None else max(max_ts, hi)
+            return (min_ts, max_ts)
         
-        min_ts = self.data_df[self.timestamp_column].min()
-        max_ts = self.data_df[self.timestamp_column].max()
-        return (min_ts, max_ts)
+        timestamps = self._columns[self.timestamp_column]
+        return (timestamps.min(), timestamps.max())
 
 
 class CSVLiveDataStream(CSVMarketDataStream):
@@ -278,11 +552,11 @@ class CSVLiveDataStream(CSVMarketDataStream):
         """
         super().__init__(csv_path, data_type, **kwargs)
         self.playback_speed = playback_speed
-        self.callbacks = []
+        self.callbacks: Dict[Any, None] = {}
     
     def add_callback(self, callback):
-        """添加回调函数"""
-        self.callbacks.append(callback)
+        """添加回调函数(重复添加同一函数只保留一次)"""
+        self.callbacks[callback] = None
     
     def replay(self, symbol: str):
         """
@@ -291,7 +565,8 @@ class CSVLiveDataStream(CSVMarketDataStream):
         Args:
             symbol: 股票代码
         """
-        import time
+        # 模拟时间延迟：按目标时刻等待，回调耗时计入间隔
+        pacer = Pacer(1.0 / self.playback_speed if self.playback_speed > 0 else 0.0)
         
         if self.data_type == 'orderbook':
             for orderbook in self.get_orderbook(symbol):
@@ -299,9 +574,7 @@ class CSVLiveDataStream(CSVMarketDataStream):
                 for callback in self.callbacks:
                     callback(orderbook)
                 
-                # 模拟时间延迟
-                if self.playback_speed > 0:
-                    time.sleep(1.0 / self.playback_speed)
+                pacer.wait()
         
         elif self.data_type == 'market':
             for market_data in self.get_market_data(symbol):
@@ -309,7 +582,5 @@ class CSVLiveDataStream(CSVMarketDataStream):
                 for callback in self.callbacks:
                     callback(market_data)
                 
-                # 模拟时间延迟
-                if self.playback_speed > 0:
-                    time.sleep(1.0 / self.playback_speed)
+                pacer.wait()
 
@@ -8,13 +8,16 @@ import time
 import logging
 from datetime import datetime
 from newstreamer.streams.base import DataStreamBase, LiveDataStreamBase
-from newstreamer.models.orderbook import OrderBook, OrderBookLevel
+from newstreamer.models.orderbook import OrderBook
 from newstreamer.models.market_data import MarketData, BookSnapshotData
 from newstreamer.utils.generators import (
     RandomOrderBookGenerator,
     RandomMarketDataGenerator,
-    RandomWalkPriceGenerator
+    RandomWalkPriceGenerator,
+    VectorRandomWalkGenerator,
+    VectorMarketDataGenerator
 )
+from newstreamer.utils.pacing import Pacer
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +106,7 @@ class FakeMarketDataStream(DataStreamBase):
         
         generator = self.generators[symbol]
         tick_count = 0
+        pacer = Pacer(self.tick_interval)
         
         try:
             while True:
@@ -111,18 +115,12 @@ class FakeMarketDataStream(DataStreamBase):
                     logger.info(f"{symbol} 数据流已完成，共 {tick_count} 个tick")
                     break
                 
-                # 生成订单簿数据
-                data = generator.generate(symbol)
-                
-                # 创建OrderBook对象(使用OrderBookLevel)
-                bids = [OrderBookLevel(price=p, volume=v) 
-                       for p, v in zip(data['bids'], data['bid_vols'])]
-                asks = [OrderBookLevel(price=p, volume=v) 
-                       for p, v in zip(data['asks'], data['ask_vols'])]
+                # 生成订单簿档位(生成器直接构造 OrderBookLevel)
+                bids, asks, timestamp = generator.generate_levels(symbol)
                 
                 orderbook = OrderBook(
-                    symbol=data['symbol'],
-                    timestamp=data['timestamp'],
+                    symbol=symbol,
+                    timestamp=timestamp,
                     bids=bids,
                     asks=asks
                 )
@@ -132,8 +130,7 @@ class FakeMarketDataStream(DataStreamBase):
                 tick_count += 1
                 
                 # 等待下一个tick
-                if self.tick_interval > 0:
-                    time.sleep(self.tick_interval)
+                pacer.wait()
                     
         except Exception as e:
             self._handle_error(e)
@@ -180,6 +177,8 @@ class FakeLiveDataStream(LiveDataStreamBase):
         self.seed = seed
         self.generators = {}
         self.latest_data = {}
+        # start_streaming 使用的批量生成器：每轮对全部订阅股票一次性向量化生成
+        self._batch_gen: Optional[VectorMarketDataGenerator] = None
     
     def subscribe(self, subscribe_symbols: List[str]):
         """
@@ -199,12 +198,23 @@ class FakeLiveDataStream(LiveDataStreamBase):
             )
             self.generators[symbol] = RandomMarketDataGenerator(price_gen)
         
+        self._batch_gen = VectorMarketDataGenerator(
+            subscribe_symbols,
+            VectorRandomWalkGenerator(
+                len(subscribe_symbols),
+                initial_price=self.initial_price,
+                volatility=self.volatility,
+                seed=self.seed
+            )
+        )
+        
         logger.info(f"已订阅 {len(subscribe_symbols)} 只股票: {subscribe_symbols}")
     
     def unsubscribe(self):
         """取消所有订阅"""
         self.subscribe_symbols = []
         self.generators = {}
+        self._batch_gen = None
         self.latest_data = {}
         logger.info("已取消所有订阅")
     
@@ -231,25 +241,23 @@ class FakeLiveDataStream(LiveDataStreamBase):
         self._is_running = True
         logger.info(f"开始模拟数据流，刷新间隔: {interval}秒")
         
+        as_object = self.return_type == 'object'
+        
         try:
             while self._is_running:
-                # 生成所有订阅股票的数据
-                data_list = []
-                for symbol in self.subscribe_symbols:
-                    generator = self.generators[symbol]
-                    data = generator.generate(symbol)
-                    
-                    # 更新最新数据
-                    self.latest_data[symbol] = data
-                    
-                    # 根据返回类型转换
-                    if self.return_type == 'object':
-                        data_obj = MarketData(**data)
-                        data_list.append(data_obj)
-                    else:
-                        data_list.append(data)
+                # 一次生成所有订阅股票的数据(订阅可能在两轮之间变化，每轮重新读取生成器)
+                batch_gen = self._batch_gen
+                batch = batch_gen.generate() if batch_gen is not None else []
+                
+                # 更新最新数据
+                latest = self.latest_data
+                for data in batch:
+                    latest[data['symbol']] = data
+                
+                # 根据返回类型转换
+                data_list = [MarketData(**data) for data in batch] if as_object else batch
                 
-                # 触发回调
+                # 触发回调(每轮一次，传入整批数据)
                 self.on_market_data(data_list)
                 logger.debug(f"已生成 {len(data_list)} 条市场数据")
                 
@@ -1,16 +1,102 @@
 import time
+import heapq
+import itertools
 import threading
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor, Future
 from typing import Callable, List, Dict, Any, Optional
 from abc import ABC, abstractmethod
 from newstreamer.streams.base import LiveDataStreamBase
+from newstreamer.utils.fast_json import loads
 
+try:
+    import httpx
+except ImportError:  # 可选依赖: pip install httpx[http2]
+    httpx = None
+
+# requests 与 httpx 的请求异常
+_HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
 
 # 设置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class _LiveStreamScheduler:
+    """
+    进程内所有 LiveDataStream 共用的轮询调度器
+    
+    一个调度线程按各数据流的下次刷新时刻(最小堆)等待，到期的刷新交给共享线程池执行，
+    慢请求不会推迟其他数据流；数据流再多也不会各占一个常驻线程。
+    每个数据流的下一次刷新在本次刷新完成后才排期，同一数据流的刷新不会重叠。
+    """
+    
+    def __init__(self, max_workers: int = 16):
+        self._heap: list = []  # (到期时刻, 序号, 注册令牌, 数据流)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._tokens: Dict[Any, int] = {}  # 数据流 -> 当前注册令牌；重新注册后旧的堆条目自动作废
+        self._inflight: Dict[Any, Future] = {}
+        self._local = threading.local()
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def register(self, stream: "LiveDataStream"):
+        """注册数据流，立即进行第一次刷新，之后每次刷新完成后间隔 stream._interval 秒再刷新"""
+        with self._cond:
+            if self._thread is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="live-poll")
+                self._thread = threading.Thread(target=self._run, name="live-scheduler", daemon=True)
+                self._thread.start()
+            token = next(self._seq)
+            self._tokens[stream] = token
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), token, stream))
+            self._cond.notify()
+    
+    def unregister(self, stream: "LiveDataStream"):
+        """注销数据流，并等待其进行中的刷新结束(在该数据流自己的回调中调用时不等待)"""
+        with self._cond:
+            self._tokens.pop(stream, None)
+            future = self._inflight.get(stream)
+        if future is not None and getattr(self._local, "stream", None) is not stream:
+            future.result()
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                _, _, token, stream = heapq.heappop(self._heap)
+                if self._tokens.get(stream) != token:
+                    continue
+                self._inflight[stream] = self._pool.submit(self._tick, stream, token)
+    
+    def _tick(self, stream: "LiveDataStream", token: int):
+        self._local.stream = stream
+        try:
+            stream._poll_once()
+        except Exception:
+            logger.exception(f"数据流刷新失败: {stream.base_url}")
+        finally:
+            self._local.stream = None
+            with self._cond:
+                self._inflight.pop(stream, None)
+                if self._tokens.get(stream) == token:
+                    heapq.heappush(self._heap, (time.monotonic() + stream._interval, next(self._seq), token, stream))
+                    self._cond.notify()
+
+
+_scheduler = _LiveStreamScheduler()
+
+
 class LiveDataStream(LiveDataStreamBase):
     """
     实时数据流 - 从URL获取市场数据
@@ -27,9 +113,40 @@ class LiveDataStream(LiveDataStreamBase):
         """
         super().__init__()
         self.base_url = base_url
-        self._stream_thread: Optional[threading.Thread] = None
         self._interval = 30  # 默认30秒刷新一次数据
 
+        # 复用同一个客户端(连接保活)，各标的请求由线程池并发发出
+        self.max_workers = 32
+        self._session = self._make_http2_client() or self._make_session()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 单支股票行情的短期缓存: symbol -> (过期时刻, 数据)，有效期为刷新间隔的一半，
+        # 同一轮内重复的代码或回调中的重复查询不再重复请求
+        self._quote_cache: Dict[str, Any] = {}
+        self._quote_cache_lock = threading.Lock()
+
+    def _make_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _make_http2_client(self):
+        """
+        HTTPS 数据源且安装了 httpx[http2] 时使用 HTTP/2 客户端：
+        线程池中的并发请求复用同一条 TLS 连接多路传输，省去每条连接的握手
+        """
+        if httpx is None or not self.base_url.startswith("https://"):
+            return None
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=self.max_workers, max_keepalive_connections=self.max_workers),
+            )
+        except ImportError:  # 未安装 h2
+            return None
+
     def subscribe(self, subscribe_symbols: List[str]):
         """
         订阅市场数据
@@ -43,6 +160,7 @@ class LiveDataStream(LiveDataStreamBase):
     def unsubscribe(self):
         """取消所有订阅"""
         self.subscribe_symbols = []
+        self._clear_quote_cache()
         logger.info("已取消所有订阅")
 
     def get_latest_data(self) -> Optional[Dict[str, Any]]:
@@ -61,34 +179,50 @@ class LiveDataStream(LiveDataStreamBase):
         if self.subscribe_symbols == ["all"]:
             return self._get_all_data()
         
-        # 否则为每个股票调用单支股票数据接口
-        data = {}
-        for symbol in self.subscribe_symbols:
-            data[symbol] = self._get_single_stock_data(symbol)
-        
-        return data
+        # 否则为每个股票调用单支股票数据接口，并发请求，总耗时约为最慢的单次请求而非各请求之和
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="live-http")
+        symbols = list(dict.fromkeys(self.subscribe_symbols))  # 去重，保持顺序
+        return dict(zip(symbols, self._executor.map(self._get_single_stock_data, symbols)))
 
     def _get_all_data(self) -> Optional[Dict[str, Any]]:
         """从API获取所有股票数据"""
         try:
-            response = requests.get(f"{self.base_url}all")
+            response = self._session.get(f"{self.base_url}all")
             response.raise_for_status()  # 检查响应状态
-            data = response.json()  # 假设返回JSON数据
+            data = loads(response.content)  # 假设返回JSON数据，直接解析响应字节
             logger.info(f"获取所有股票数据: {data}")
             return data
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS + (ValueError,) as e:
             logger.error(f"获取所有数据时发生错误: {str(e)}")
             return None
 
+    def _clear_quote_cache(self):
+        with self._quote_cache_lock:
+            self._quote_cache.clear()
+
     def _get_single_stock_data(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """获取单支股票数据"""
+        """获取单支股票数据(刷新间隔的一半内命中缓存则直接返回)"""
+        now = time.monotonic()
+        with self._quote_cache_lock:
+            cached = self._quote_cache.get(symbol)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        data = self._fetch_single_stock_data(symbol)
+        if data is not None:
+            with self._quote_cache_lock:
+                self._quote_cache[symbol] = (now + self._interval / 2, data)
+        return data
+
+    def _fetch_single_stock_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """请求单支股票数据"""
         try:
-            response = requests.get(f"{self.base_url}{symbol}")
+            response = self._session.get(f"{self.base_url}{symbol}")
             response.raise_for_status()  # 检查响应状态
-            data = response.json()  # 假设返回JSON数据
+            data = loads(response.content)  # 假设返回JSON数据，直接解析响应字节
             logger.info(f"获取股票 {symbol} 数据: {data}")
             return data
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS + (ValueError,) as e:
             logger.error(f"获取股票 {symbol} 数据时发生错误: {str(e)}")
             return None
 
@@ -104,29 +238,29 @@ class LiveDataStream(LiveDataStreamBase):
             logger.warning("数据流已经在运行中。")
             return
         
-        # 启动流式传输的后台线程
+        # 由进程内共享的调度器定时刷新，不再为每个数据流单独启动线程
         self._is_running = True
-        self._stream_thread = threading.Thread(target=self._stream_data)
-        self._stream_thread.start()
+        _scheduler.register(self)
         logger.info(f"数据流已启动，间隔：{interval}秒")
 
     def stop(self):
         """停止数据流"""
         if self._is_running:
             self._is_running = False
-            if self._stream_thread:
-                self._stream_thread.join()
+            _scheduler.unregister(self)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self._clear_quote_cache()
             logger.info("数据流已停止")
         else:
             logger.warning("数据流未在运行中")
 
-    def _stream_data(self):
-        """模拟实时数据流"""
-        while self._is_running:
-            data = self.get_latest_data()
-            if data:
-                self.on_market_data(data)
-            time.sleep(self._interval)
+    def _poll_once(self):
+        """刷新一次数据并通知回调(由调度器调用)"""
+        data = self.get_latest_data()
+        if data and self._is_running:
+            self.on_market_data(data)
         
     def on_market_data(self, data: Any):
         """
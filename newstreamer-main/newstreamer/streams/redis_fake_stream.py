@@ -1,7 +1,9 @@
 import redis
 import time
-from typing import List, Dict, Any, Optional, Generator
-from newstreamer.models.orderbook import OrderBook, OrderBookLevel
+import queue
+import threading
+from typing import Callable, List, Dict, Any, Optional, Generator
+from newstreamer.models.orderbook import OrderBook
 from newstreamer.models.market_data import MarketData
 from newstreamer.utils.generators import (
     RandomOrderBookGenerator,
@@ -10,11 +12,91 @@ from newstreamer.utils.generators import (
 )
 from newstreamer.streams.base import DataStreamBase, LiveDataStreamBase
 from newstreamer.streams.to_redis import RedisClient
+from newstreamer.utils.pacing import Pacer
+from newstreamer.utils.fast_json import dumps
 
 # 设置日志
 import logging
 logger = logging.getLogger(__name__)
 
+
+class _BackgroundWriter:
+    """
+    后台 Redis 写入线程
+    
+    生产方把 key -> 数据 的批次放入有界队列后立即返回；写入线程一次取出队列中已积压的批次
+    (最多 max_merge 批)合并，同一 key 只保留最新值，序列化后以一次 pipeline 写入。
+    Redis 往返不再阻塞行情生成；队列满时生产方阻塞等待，内存占用有上限。
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, redis_client: RedisClient, encode: Optional[Callable[[Any], Any]] = None,
+                 maxsize: int = 10_000, max_merge: int = 256):
+        """
+        Args:
+            redis_client: Redis 客户端
+            encode: 数据 -> 写入 Redis 的 JSON，None 表示提交的已是序列化后的数据
+            maxsize: 队列容量(批次数)
+            max_merge: 每次写入最多合并的批次数
+        """
+        self.redis_client = redis_client
+        self.encode = encode
+        self.max_merge = max_merge
+        self._queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="redis-writer", daemon=True)
+            self._thread.start()
+    
+    def close(self):
+        """写完队列中剩余的数据后停止写入线程"""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+    
+    def submit(self, batch: Dict[str, Any]):
+        """提交一批数据；写入线程未运行时直接同步写入"""
+        if not batch:
+            return
+        if self._thread is None:
+            self._write(batch)
+            return
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self._queue.put(batch)
+    
+    def _write(self, merged: Dict[str, Any]):
+        if self.encode is not None:
+            merged = {key: self.encode(value) for key, value in merged.items()}
+        self.redis_client.write_many(merged)
+        logger.debug("已批量写入 Redis: %d 条", len(merged))
+    
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            stop = batch is self._STOP
+            merged = {} if stop else dict(batch)
+            # 取出已积压的批次一并写入，队列空时立即写出当前数据
+            for _ in range(self.max_merge - 1):
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is self._STOP:
+                    stop = True
+                    break
+                merged.update(batch)
+            if merged:
+                self._write(merged)
+            if stop:
+                return
+
+
 class FakeMarketDataStream(DataStreamBase):
     """
     模拟市场数据流 - 生成器模式
@@ -60,16 +142,20 @@ class FakeMarketDataStream(DataStreamBase):
         except redis.ConnectionError as e:
             logger.error(f"无法连接到 Redis: {e}")
             raise
+        # 订单簿由后台线程序列化并写入 Redis，生成器提交后立即 yield
+        self._writer = _BackgroundWriter(self.redis_client, lambda book: dumps(book.to_dict()))
 
     
     def connect(self):
         """建立连接(模拟)"""
         self._connected = True
+        self._writer.start()
         logger.info(f"FakeMarketDataStream 已连接，共 {len(self.symbols)} 个股票")
     
     def disconnect(self):
-        """断开连接(模拟)"""
+        """断开连接(模拟)，返回前写完已提交的数据"""
         self._connected = False
+        self._writer.close()
         logger.info("FakeMarketDataStream 已断开")
     
     def get_orderbook(self, symbol: str) -> Generator[OrderBook, None, None]:
@@ -82,6 +168,7 @@ class FakeMarketDataStream(DataStreamBase):
         
         generator = self.generators[symbol]
         tick_count = 0
+        pacer = Pacer(self.tick_interval)
         
         try:
             while True:
@@ -90,37 +177,25 @@ class FakeMarketDataStream(DataStreamBase):
                     logger.info(f"{symbol} 数据流已完成，共 {tick_count} 个tick")
                     break
                 
-                # 生成订单簿数据
-                data = generator.generate(symbol)
-                
-                # 创建OrderBook对象(使用OrderBookLevel)
-                bids = [OrderBookLevel(price=p, volume=v) 
-                       for p, v in zip(data['bids'], data['bid_vols'])]
-                asks = [OrderBookLevel(price=p, volume=v) 
-                       for p, v in zip(data['asks'], data['ask_vols'])]
+                # 生成订单簿档位(生成器直接构造 OrderBookLevel)
+                bids, asks, timestamp = generator.generate_levels(symbol)
                 
                 orderbook = OrderBook(
-                    symbol=data['symbol'],
-                    timestamp=data['timestamp'],
+                    symbol=symbol,
+                    timestamp=timestamp,
                     bids=bids,
                     asks=asks
                 )
 
-                # 将订单簿数据写入 Redis
-                try:
-                    payload = orderbook.to_dict()
-                    self.redis_client.write_data(symbol, payload)
-                    logger.info(f"数据已写入 Redis：{symbol} -> {payload}")
-                except Exception as e:
-                    logger.error(f"写入 Redis 失败: {str(e)}")
-                    raise
+                # 每个tick都提交给后台线程：提交只是入队，积压的批次由写入线程合并为一次 pipeline，
+                # Redis 中的订单簿不会落后于已产出的tick
+                self._writer.submit({symbol: orderbook})
 
                 # 将 OrderBook 数据 yield 给调用方
                 yield orderbook
                 
                 tick_count += 1
-                if self.tick_interval > 0:
-                    time.sleep(self.tick_interval)
+                pacer.wait()
         except Exception as e:
             self._handle_error(e)
             raise
@@ -159,6 +234,8 @@ class FakeLiveDataStream(LiveDataStreamBase):
         except redis.ConnectionError as e:
             logger.error(f"无法连接到 Redis: {e}")
             raise
+        # 每轮数据在生成线程中序列化(回调可能修改数据字典)，由后台线程写入 Redis
+        self._writer = _BackgroundWriter(self.redis_client)
 
 
     def subscribe(self, subscribe_symbols: List[str]):
@@ -193,12 +270,14 @@ class FakeLiveDataStream(LiveDataStreamBase):
             return
 
         self._is_running = True
+        self._writer.start()
         logger.info(f"开始模拟数据流，刷新间隔: {interval}秒")
         
         try:
             while self._is_running:
                 # 生成所有订阅股票的数据
                 data_list = []
+                payloads = {}
                 for symbol in self.subscribe_symbols:
                     generator = self.generators[symbol]
                     data = generator.generate(symbol)
@@ -213,13 +292,10 @@ class FakeLiveDataStream(LiveDataStreamBase):
                     else:
                         data_list.append(data)
 
-                    # 写入 Redis (以股票代码为 key)
-                    try:
-                        self.redis_client.write_data(symbol, data)  # 保存市场数据到 Redis
-                        logger.info(f"数据已写入 Redis：{symbol} -> {data}")
-                    except Exception as e:
-                        logger.error(f"写入 Redis 失败: {str(e)}")
-                        raise
+                    payloads[symbol] = dumps(data)
+
+                # 所有订阅股票的数据交给后台线程以一次 pipeline 写入 Redis (以股票代码为 key)
+                self._writer.submit(payloads)
 
                 # 触发回调
                 self.on_market_data(data_list)
@@ -234,6 +310,8 @@ class FakeLiveDataStream(LiveDataStreamBase):
             logger.error(f"数据流出错: {str(e)}")
             self.stop()
             raise
+        finally:
+            self._writer.close()
 
     def stop(self):
         """停止数据流"""
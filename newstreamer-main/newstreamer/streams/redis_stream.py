@@ -35,6 +35,7 @@ class RedisMarketDataStreamReader(LiveDataStreamBase):
 
     def subscribe(self, subscribe_symbols: List[str]):
         self.subscribe_symbols = subscribe_symbols
+        self.redis_client.prime_keys(subscribe_symbols)
         logger.info("RedisReader 已订阅: %s", subscribe_symbols)
 
     def unsubscribe(self):
@@ -56,8 +57,10 @@ class RedisMarketDataStreamReader(LiveDataStreamBase):
         try:
             while self._is_running:
                 data_list: List[Any] = []
+                # 所有订阅股票以一次 MGET 读取，每轮只需一次往返
+                items = self.redis_client.get_many(self.subscribe_symbols)
                 for symbol in self.subscribe_symbols:
-                    item = self.redis_client.get_data(symbol)
+                    item = items.get(symbol)
                     if not item:
                         continue
 
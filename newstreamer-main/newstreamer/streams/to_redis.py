@@ -1,14 +1,39 @@
 import os
-import json
 import logging
-from typing import Any, Optional, Dict, Iterable
-from datetime import datetime, date
+import threading
+from typing import Any, Optional, Dict, Iterable, Union
 
 import redis
 from dotenv import load_dotenv
 
+from newstreamer.utils.fast_json import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# 进程内共享的 redis 客户端：连接参数相同的 RedisClient 复用同一个客户端及其连接池，
+# 多个数据流实例不再各自建立 TCP 连接，连接数也有上限
+_MAX_CONNECTIONS = 100
+_shared_clients: Dict[tuple, redis.StrictRedis] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client(host: str, port: int, db: int, username: Optional[str], password: Optional[str]):
+    cls = redis.StrictRedis
+    key = (cls, host, port, db, username, password)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = cls(
+                host=host,
+                port=port,
+                db=db,
+                username=username,
+                password=password,
+                decode_responses=True,
+                max_connections=_MAX_CONNECTIONS,
+            )
+    return client
+
 
 class RedisClient:
     def __init__(
@@ -19,6 +44,7 @@ class RedisClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         prefix: str = "",
+        shared_pool: bool = True,
     ):
         """
         Args:
@@ -28,20 +54,26 @@ class RedisClient:
             username: ACL 用户名（Redis 6+）
             password: 密码/令牌
             prefix:   键前缀（如 'teamPublic:'）
+            shared_pool: 是否与进程内其他连接参数相同的 RedisClient 共用连接池
         """
         self.username = username
-        self.client = redis.StrictRedis(
-            host=host,
-            port=port,
-            db=db,
-            username=username,
-            password=password,
-            decode_responses=True,
-        )
+        if shared_pool:
+            self.client = _shared_client(host, port, db, username, password)
+        else:
+            self.client = redis.StrictRedis(
+                host=host,
+                port=port,
+                db=db,
+                username=username,
+                password=password,
+                decode_responses=True,
+            )
         # 规范化前缀：自动补冒号，避免 'teamPublichc' 这种不匹配 ACL 的键
         self.prefix = prefix or ""
         if self.prefix and not self.prefix.endswith(":"):
             self.prefix += ":"
+        # 带前缀并已编码的键缓存(标的集合固定，热路径写入时免去拼接与编码)
+        self._key_bytes: Dict[str, bytes] = {}
         self._check_connection(host, port, db, username)
 
     def _check_connection(self, host: str, port: int, db: int, username: Optional[str]):
@@ -53,14 +85,21 @@ class RedisClient:
             logger.error("无法连接到 Redis")
             raise
 
-    def _json_default(self, obj: Any):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        return str(obj)
-
     def _k(self, key: str) -> str:
         return f"{self.prefix}{key}" if self.prefix and not key.startswith(self.prefix) else key
 
+    def _kb(self, key: str) -> bytes:
+        """带前缀的 UTF-8 编码键，每个 key 只拼接/编码一次"""
+        kb = self._key_bytes.get(key)
+        if kb is None:
+            kb = self._key_bytes[key] = self._k(key).encode("utf-8")
+        return kb
+
+    def prime_keys(self, keys: Iterable[str]) -> None:
+        """预先编码一批键(如订阅时传入全部标的)，首笔写入也无需拼接"""
+        for key in keys:
+            self._kb(key)
+
     def whoami(self) -> str:
         # 不使用 ACL WHOAMI（很多受限用户无权限）；直接返回连接使用的用户名
         return self.username or "default"
@@ -68,26 +107,69 @@ class RedisClient:
     # String: SET/GET
     def write_data(self, key: str, data: Any):
         try:
-            payload = json.dumps(data, ensure_ascii=False, default=self._json_default)
-            self.client.set(self._k(key), payload)
-            logger.info(f"数据成功写入 Redis，key: {self._k(key)}")
+            payload = dumps(data)
+            k = self._k(key)
+            self.client.set(k, payload)
+            logger.debug("数据成功写入 Redis，key: %s", k)
         except Exception as e:
             logger.error(f"写入数据到 Redis 失败: {str(e)}")
 
+    def write_many(self, items: Dict[str, Union[bytes, str]]) -> bool:
+        """
+        以非事务 pipeline 批量 SET 已序列化的数据，整批只需一次往返
+
+        Args:
+            items: key -> 已序列化的 JSON(如 fast_json.dumps 的结果)
+
+        Returns:
+            是否写入成功
+        """
+        if not items:
+            return True
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, payload in items.items():
+                pipe.set(self._kb(key), payload)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"批量写入 Redis 失败({len(items)} 条): {str(e)}")
+            return False
+
     def get_data(self, key: str) -> Any:
         try:
             data = self.client.get(self._k(key))
             if data:
-                return json.loads(data)
+                return loads(data)
             return None
         except Exception as e:
             logger.error(f"从 Redis 获取数据失败: {str(e)}")
             return None
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        以一次 MGET 批量读取并解析多个 key
+
+        Args:
+            keys: 键列表(带或不带前缀均可)
+
+        Returns:
+            key -> 解析后的数据，不存在的 key 值为 None
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raw = self.client.mget([self._kb(k) for k in keys])
+            return {k: loads(v) if v else None for k, v in zip(keys, raw)}
+        except Exception as e:
+            logger.error(f"从 Redis 批量获取数据失败({len(keys)} 条): {str(e)}")
+            return {}
+
     # Hash: HSET/HGETALL
     def write_hash_field(self, key: str, field: str, data: Any) -> None:
         try:
-            payload = json.dumps(data, ensure_ascii=False, default=self._json_default)
+            payload = dumps(data)
             self.client.hset(self._k(key), field, payload)
         except Exception as e:
             logger.error(f"HSET 失败: {str(e)}")
@@ -96,7 +178,7 @@ class RedisClient:
     def read_hash_all(self, key: str) -> Dict[str, Any]:
         try:
             raw = self.client.hgetall(self._k(key))
-            return {k: json.loads(v) for k, v in raw.items()}
+            return {k: loads(v) for k, v in raw.items()}
         except Exception as e:
             logger.error(f"HGETALL 失败: {str(e)}")
             return {}
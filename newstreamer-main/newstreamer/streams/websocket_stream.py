@@ -9,6 +9,7 @@ import logging
 import threading
 import time
 from newstreamer.streams.base import LiveDataStreamBase
+from newstreamer.utils.fast_json import loads
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,8 @@ class WebSocketDataStream(LiveDataStreamBase):
         reconnect: bool = True,
         reconnect_interval: int = 5,
         ping_interval: int = 30,
-        message_parser: Optional[Callable] = None
+        message_parser: Optional[Callable] = None,
+        websocket_options: Optional[Dict[str, Any]] = None
     ):
         """
         初始化WebSocket数据流
@@ -56,6 +58,8 @@ class WebSocketDataStream(LiveDataStreamBase):
             reconnect_interval: 重连间隔(秒)
             ping_interval: 心跳间隔(秒)
             message_parser: 自定义消息解析器
+            websocket_options: 透传给 WebSocketApp.run_forever 的参数，
+                如 {'skip_utf8_validation': True} 跳过逐帧 UTF-8 校验(消息由解析器自行解码时可用)
         """
         super().__init__()
         self.url = url
@@ -64,6 +68,7 @@ class WebSocketDataStream(LiveDataStreamBase):
         self.reconnect_interval = reconnect_interval
         self.ping_interval = ping_interval
         self.message_parser = message_parser or self._default_parser
+        self.websocket_options = dict(websocket_options or {})
         
         self.ws = None
         self._ws_thread = None
@@ -110,6 +115,7 @@ class WebSocketDataStream(LiveDataStreamBase):
             # 在单独的线程中运行
             self._ws_thread = threading.Thread(
                 target=self.ws.run_forever,
+                kwargs=self.websocket_options,
                 daemon=True
             )
             self._ws_thread.start()
@@ -241,7 +247,7 @@ class WebSocketDataStream(LiveDataStreamBase):
             解析后的数据字典，如果是系统消息则返回None
         """
         try:
-            data = json.loads(message)
+            data = loads(message)
             
             # 过滤系统消息
             if 'action' in data:
@@ -253,7 +259,7 @@ class WebSocketDataStream(LiveDataStreamBase):
             # 返回市场数据
             return data
             
-        except json.JSONDecodeError:
+        except ValueError:
             logger.error(f"JSON解析失败: {message}")
             return None
     
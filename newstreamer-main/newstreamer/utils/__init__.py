@@ -3,12 +3,22 @@
 from newstreamer.utils.generators import (
     RandomOrderBookGenerator,
     RandomMarketDataGenerator,
-    RandomWalkPriceGenerator
+    RandomWalkPriceGenerator,
+    VectorRandomWalkGenerator,
+    VectorMarketDataGenerator
 )
+from newstreamer.utils.book_analytics import mid_prices, spreads, weighted_top_prices
+from newstreamer.utils.pacing import Pacer
 
 __all__ = [
     "RandomOrderBookGenerator",
     "RandomMarketDataGenerator",
     "RandomWalkPriceGenerator",
+    "VectorRandomWalkGenerator",
+    "VectorMarketDataGenerator",
+    "mid_prices",
+    "spreads",
+    "weighted_top_prices",
+    "Pacer",
 ]
 
@@ -0,0 +1,53 @@
+"""JSON 编解码
+
+优先使用 orjson(SIMD 加速，直接输出/接受 bytes)，未安装时回退到标准库 json。
+安装: pip install newstreamer[fast]
+"""
+
+import json
+from datetime import datetime, date
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 可选依赖
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+if HAS_ORJSON:
+    # numpy 标量/数组与非字符串键直接序列化，无需先转换为 Python 对象
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any):
+    """orjson/json 都不支持的类型：日期转 ISO 字符串，其余转 str"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any) -> Union[bytes, str]:
+    """
+    序列化为 JSON
+
+    Returns:
+        orjson 可用时为 UTF-8 bytes(可直接写入 Redis/socket)，否则为 str
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, default=_default)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    解析 JSON，bytes 输入无需先解码为 str
+
+    Raises:
+        ValueError: JSON 格式错误(json.JSONDecodeError / orjson.JSONDecodeError 均为其子类)
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -5,9 +5,10 @@
 
 import numpy as np
 import pandas as pd
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import time
 from datetime import datetime
+from newstreamer.models.orderbook import OrderBookLevel
 
 
 class RandomWalkPriceGenerator:
@@ -144,6 +145,37 @@ class RandomOrderBookGenerator:
             'asks': asks,
             'ask_vols': ask_vols
         }
+    
+    def generate_levels(
+        self,
+        symbol: str,
+        timestamp: Optional[int] = None
+    ) -> Tuple[List[OrderBookLevel], List[OrderBookLevel], datetime]:
+        """
+        生成订单簿档位，直接构造 OrderBookLevel(省去中间字典与价格/数量列表)
+        
+        随机数的抽取顺序与 generate 相同，相同种子下两者结果一致
+        
+        Args:
+            symbol: 股票代码
+            timestamp: 时间戳，如果为None则使用当前时间
+            
+        Returns:
+            (买单档位(降序), 卖单档位(升序), 时间戳)
+        """
+        mid_price = self.price_gen.next_price()
+        spread = mid_price * (self.spread_bps / 10000)
+        half_spread = spread / 2
+        randint = np.random.randint
+        low, high = self.volume_range
+        
+        bids = []
+        asks = []
+        for i in range(self.depth_levels):
+            bids.append(OrderBookLevel(round(mid_price - half_spread - i * spread * 0.5, 2), randint(low, high)))
+            asks.append(OrderBookLevel(round(mid_price + half_spread + i * spread * 0.5, 2), randint(low, high)))
+        
+        return bids, asks, timestamp or datetime.now()
 
 
 class RandomMarketDataGenerator:
@@ -245,3 +277,172 @@ class RandomMarketDataGenerator:
         """重置生成器状态"""
         self.price_gen.reset()
         self._last_close = None
+
+
+class VectorRandomWalkGenerator:
+    """
+    批量随机游走价格生成器
+    
+    与 RandomWalkPriceGenerator 相同的模型，但一次为 n 只股票各生成一个价格点：
+    每步只调用一次向量化的随机数生成，而不是每只股票一次标量调用
+    """
+    
+    def __init__(
+        self,
+        n: int,
+        initial_price: float = 100.0,
+        drift: float = 0.0001,
+        volatility: float = 0.02,
+        seed: Optional[int] = None
+    ):
+        """
+        初始化批量价格生成器
+        
+        Args:
+            n: 股票数量
+            initial_price: 初始价格
+            drift: 漂移率(均值收益率)
+            volatility: 波动率(标准差)
+            seed: 随机种子，用于可重复的结果
+        """
+        self.n = n
+        self.initial_price = initial_price
+        self.drift = drift
+        self.volatility = volatility
+        self.rng = np.random.default_rng(seed)
+        self.current_prices = np.full(n, initial_price, dtype=np.float64)
+    
+    def step(self) -> np.ndarray:
+        """
+        为每只股票生成下一个价格点
+        
+        Returns:
+            新的价格数组(保留两位小数)
+        """
+        # 几何布朗运动: dS = μS*dt + σS*dW
+        shocks = self.rng.standard_normal(self.n)
+        self.current_prices *= 1.0 + self.drift + self.volatility * shocks
+        
+        # 确保价格为正
+        np.maximum(self.current_prices, 0.01, out=self.current_prices)
+        
+        return np.round(self.current_prices, 2)
+    
+    def reset(self):
+        """重置价格到初始值"""
+        self.current_prices.fill(self.initial_price)
+
+
+class VectorMarketDataGenerator:
+    """
+    批量市场数据生成器
+    
+    字段与 RandomMarketDataGenerator.generate 相同，各字段对所有股票一次性向量化生成
+    """
+    
+    def __init__(
+        self,
+        symbols: List[str],
+        price_generator: Optional[VectorRandomWalkGenerator] = None,
+        volume_range: tuple = (1000000, 50000000),
+        amplitude_range: tuple = (0.01, 0.05)
+    ):
+        """
+        初始化批量市场数据生成器
+        
+        Args:
+            symbols: 股票代码列表
+            price_generator: 批量价格生成器，数量需与 symbols 一致
+            volume_range: 成交量范围
+            amplitude_range: 振幅范围(比例)
+        """
+        self.symbols = list(symbols)
+        self.price_gen = price_generator or VectorRandomWalkGenerator(len(self.symbols))
+        if self.price_gen.n != len(self.symbols):
+            raise ValueError(f"价格生成器数量({self.price_gen.n})与股票数量({len(self.symbols)})不一致")
+        self.rng = self.price_gen.rng
+        self.volume_range = volume_range
+        self.amplitude_range = amplitude_range
+        self.names = [f'股票{symbol}' for symbol in self.symbols]
+        self._last_close: Optional[np.ndarray] = None
+    
+    def generate(self, timestamp: Optional[int] = None) -> List[dict]:
+        """
+        为所有股票生成一条市场数据
+        
+        Args:
+            timestamp: 时间戳，None则使用当前时间(同一批共用)
+            
+        Returns:
+            市场数据字典列表，顺序与 symbols 一致
+        """
+        n = len(self.symbols)
+        rng = self.rng
+        current_price = self.price_gen.step()
+        
+        # 生成振幅与OHLC
+        amplitude = rng.uniform(*self.amplitude_range, size=n)
+        price_range = current_price * amplitude
+        high = current_price + rng.uniform(0.0, 1.0, size=n) * price_range
+        low = current_price - rng.uniform(0.0, 1.0, size=n) * price_range
+        open_price = low + rng.uniform(0.0, 1.0, size=n) * (high - low)
+        
+        # 生成成交量和成交额
+        volume = rng.integers(*self.volume_range, size=n)
+        amount = volume * (high + low) / 2
+        
+        # 计算昨收价
+        if self._last_close is None:
+            pre_close = current_price * (1 - rng.uniform(-0.02, 0.02, size=n))
+        else:
+            pre_close = self._last_close
+        self._last_close = current_price
+        
+        # 计算涨跌幅和涨跌额
+        chg_amount = current_price - pre_close
+        chg_pct = chg_amount / pre_close * 100
+        turnover_rate = rng.uniform(0.5, 10.0, size=n)
+        
+        timestamp = timestamp or int(time.time() * 1e9)
+        trade_date = pd.Timestamp.now().strftime('%Y%m%d')
+        columns = zip(
+            self.symbols, self.names,
+            current_price.tolist(),
+            np.round(open_price, 2).tolist(),
+            np.round(high, 2).tolist(),
+            np.round(low, 2).tolist(),
+            np.round(pre_close, 2).tolist(),
+            volume.tolist(),
+            np.round(amount, 2).tolist(),
+            np.round(chg_pct, 2).tolist(),
+            np.round(chg_amount, 2).tolist(),
+            np.round((high - low) / pre_close * 100, 2).tolist(),
+            np.round(turnover_rate, 2).tolist(),
+        )
+        return [
+            {
+                'symbol': symbol,
+                'name': name,
+                'timestamp': timestamp,
+                'price': price,
+                'open': open_,
+                'high': high_,
+                'low': low_,
+                'close': price,
+                'pre_close': pre,
+                'volume': vol,
+                'amount': amt,
+                'chg_pct': pct,
+                'chg_amount': chg,
+                'amplitude': amp,
+                'turnover_rate': turnover,
+                'trade_date': trade_date
+            }
+            for (symbol, name, price, open_, high_, low_, pre, vol, amt,
+                 pct, chg, amp, turnover) in columns
+        ]
+    
+    def reset(self):
+        """重置生成器状态"""
+        self.price_gen.reset()
+        self._last_close = None
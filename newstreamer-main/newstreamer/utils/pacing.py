@@ -0,0 +1,42 @@
+"""回放节奏控制
+
+按单调时钟上的目标时刻等待，而不是每个tick后固定 sleep：
+生成数据与回调处理所用的时间计入间隔内，不会逐tick累积漂移；落后于计划时不再等待，
+并从当前时刻重新计时，错过的节拍不会在之后连续补发。
+"""
+
+import time
+
+# 间隔低于此值时 sleep 本身的开销已超过间隔，直接不等待
+_MIN_SLEEP_INTERVAL = 1e-4
+
+
+class Pacer:
+    """
+    固定节奏等待器
+    
+    示例:
+        >>> pacer = Pacer(0.5)
+        >>> for tick in ticks:
+        ...     handle(tick)
+        ...     pacer.wait()
+    """
+    
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 相邻两次 wait 返回之间的目标间隔(秒)，<=0 表示不等待
+        """
+        self.interval = interval
+        self._next = time.perf_counter()
+    
+    def wait(self):
+        """等待到下一个目标时刻"""
+        if self.interval < _MIN_SLEEP_INTERVAL:
+            return
+        now = time.perf_counter()
+        # 已错过目标时刻则以当前时刻为新的基准，避免之后不等待地连续补发错过的节拍
+        self._next = max(self._next + self.interval, now)
+        remaining = self._next - now
+        if remaining > 0:
+            time.sleep(remaining)
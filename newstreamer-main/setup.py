@@ -37,6 +37,13 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+            "hiredis>=2.0.0",
+        ],
+        "arrow": [
+            "pyarrow>=8.0.0",
+        ],
     },
 )
 
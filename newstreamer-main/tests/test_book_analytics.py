@@ -0,0 +1,55 @@
+"""测试订单簿批量计算"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+from newstreamer.models.orderbook import OrderBook, OrderBookLevel
+from newstreamer.utils.book_analytics import mid_prices, spreads, weighted_top_prices
+
+
+def _book(bid, bid_vol, ask, ask_vol) -> OrderBook:
+    bids = [OrderBookLevel(price=bid, volume=bid_vol)] if bid else []
+    asks = [OrderBookLevel(price=ask, volume=ask_vol)] if ask else []
+    return OrderBook(symbol='000001', bids=bids, asks=asks, timestamp=datetime.now())
+
+
+class TestBookAnalytics:
+    """批量计算结果应与 OrderBook 的单个计算一致"""
+
+    CASES = [
+        (99.9, 300.0, 100.1, 100.0),
+        (10.0, 0.0, 10.2, 0.0),      # 两侧量为0: 退化为中间价
+        (0.0, 0.0, 10.2, 50.0),      # 无买单
+        (5.0, 20.0, 0.0, 0.0),       # 无卖单
+    ]
+
+    def _columns(self):
+        return [np.array(col, dtype=np.float64) for col in zip(*self.CASES)]
+
+    def test_mid_prices(self):
+        bid_px, _, ask_px, _ = self._columns()
+        expected = [_book(*case).get_mid_price() for case in self.CASES]
+        assert mid_prices(bid_px, ask_px) == pytest.approx(expected)
+
+    def test_spreads(self):
+        bid_px, _, ask_px, _ = self._columns()
+        assert spreads(bid_px, ask_px) == pytest.approx([0.2, 0.2, 0.0, 0.0])
+
+    def test_weighted_top_prices(self):
+        expected = [_book(*case).get_weighted_top_price() for case in self.CASES]
+        assert weighted_top_prices(*self._columns()) == pytest.approx(expected)
+
+    def test_orderbook_array_roundtrip(self):
+        book = OrderBook(
+            symbol='000001',
+            bids=[OrderBookLevel(price=99.9, volume=100), OrderBookLevel(price=99.8, volume=200)],
+            asks=[OrderBookLevel(price=100.1, volume=300)],
+            timestamp=datetime.now(),
+        )
+        bid_px, bid_vol, ask_px, ask_vol = book.to_arrays(depth=3)
+        assert bid_px.tolist() == [99.9, 99.8, 0.0]
+        assert ask_vol.tolist() == [300.0, 0.0, 0.0]
+
+        restored = OrderBook.from_arrays('000001', bid_px, bid_vol, ask_px, ask_vol, book.timestamp)
+        assert restored.to_dict() == book.to_dict()
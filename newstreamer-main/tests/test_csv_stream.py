@@ -1,10 +1,13 @@
 """测试CSV数据流"""
 
+from datetime import datetime
+
+import numpy as np
 import pytest
 import pandas as pd
 from pathlib import Path
 from newstreamer.streams.csv_stream import CSVMarketDataStream
-from newstreamer.models.orderbook import OrderBook
+from newstreamer.models.orderbook import OrderBook, OrderBookLevel
 from newstreamer.models.market_data import MarketData
 
 
@@ -103,6 +106,94 @@ class TestCSVMarketDataStream:
         
         stream.shutdown()
     
+    def test_lazy_orderbook_matches_eager(self, sample_orderbook_csv):
+        """测试延迟构建的订单簿与直接由CSV逐行构建的订单簿一致"""
+        rows = pd.read_csv(sample_orderbook_csv, dtype={'symbol': str})
+        expected = [
+            OrderBook(
+                symbol=row['symbol'],
+                bids=[OrderBookLevel(price=row[f'bid{i}'], volume=row[f'bid_vol{i}']) for i in (1, 2)],
+                asks=[OrderBookLevel(price=row[f'ask{i}'], volume=row[f'ask_vol{i}']) for i in (1, 2)],
+                timestamp=datetime.fromtimestamp(row['timestamp'] / 1e9),
+            )
+            for _, row in rows[rows['symbol'] == '000001'].iterrows()
+        ]
+        
+        stream = CSVMarketDataStream(
+            csv_path=str(sample_orderbook_csv),
+            data_type='orderbook'
+        )
+        
+        stream.connect()
+        
+        books = list(stream.get_orderbook('000001'))
+        assert len(books) == len(expected)
+        for book, eager in zip(books, expected):
+            assert book.timestamp == eager.timestamp
+            assert book.timestamp_ns() == eager.timestamp_ns()
+            for side in ('bids', 'asks'):
+                levels, expected_levels = getattr(book, side), getattr(eager, side)
+                assert [lv.price for lv in levels] == pytest.approx([lv.price for lv in expected_levels])
+                assert [lv.volume for lv in levels] == [lv.volume for lv in expected_levels]
+            assert book.get_mid_price() == pytest.approx(eager.get_mid_price())
+            assert book.top_of_book() == pytest.approx(eager.top_of_book())
+        
+        stream.shutdown()
+    
+    def test_get_orderbook_batches(self, sample_orderbook_csv):
+        """测试按块获取订单簿列数组"""
+        stream = CSVMarketDataStream(
+            csv_path=str(sample_orderbook_csv),
+            data_type='orderbook'
+        )
+        
+        stream.connect()
+        
+        books = list(stream.get_orderbook('000001'))
+        batches = list(stream.get_orderbook_batches('000001'))
+        
+        assert sum(len(b['timestamp']) for b in batches) == len(books)
+        mids = np.concatenate([b['mid_price'] for b in batches])
+        assert mids.tolist() == pytest.approx([book.get_mid_price() for book in books])
+        
+        stream.shutdown()
+    
+    def test_streaming_matches_loaded(self, sample_orderbook_csv):
+        """测试流式读取模式与整表载入模式结果一致"""
+        loaded = CSVMarketDataStream(csv_path=str(sample_orderbook_csv), data_type='orderbook')
+        streamed = CSVMarketDataStream(csv_path=str(sample_orderbook_csv), data_type='orderbook',
+                                       streaming=True)
+        loaded.connect()
+        streamed.connect()
+        
+        assert loaded._columns is not None
+        assert streamed._columns is None
+        assert streamed.get_symbols() == loaded.get_symbols()
+        assert streamed.get_date_range() == loaded.get_date_range()
+        assert ([b.to_dict() for b in streamed.get_orderbook('000001')]
+                == [b.to_dict() for b in loaded.get_orderbook('000001')])
+        
+        loaded.shutdown()
+        streamed.shutdown()
+    
+    def test_float_formatted_volumes(self, tmp_path):
+        """测试数量列写为 '100.0' 形式(含缺失值的整数列经 pandas 写出)时仍可读取"""
+        csv_path = tmp_path / "float_vol.csv"
+        csv_path.write_text(
+            "symbol,timestamp,bid1,bid_vol1,ask1,ask_vol1\n"
+            "000001,1000000000,10.0,100.0,10.1,200.0\n"
+            "000001,2000000000,10.0,,10.1,300.0\n"
+        )
+        stream = CSVMarketDataStream(csv_path=str(csv_path), data_type='orderbook')
+        stream.connect()
+        
+        books = list(stream.get_orderbook('000001'))
+        assert [b.get_bid_vol(0) for b in books] == [100, 0]
+        assert [b.get_ask_vol(0) for b in books] == [200, 300]
+        assert isinstance(books[0].bids[0].volume, int)
+        
+        stream.shutdown()
+    
     def test_get_market_data(self, sample_market_csv):
         """测试获取市场数据"""
         stream = CSVMarketDataStream(
@@ -137,6 +228,20 @@ class TestCSVMarketDataStream:
         
         stream.shutdown()
 
+    
+    def test_get_date_range(self, sample_orderbook_csv):
+        """测试获取时间范围"""
+        stream = CSVMarketDataStream(
+            csv_path=str(sample_orderbook_csv),
+            data_type='orderbook'
+        )
+        
+        stream.connect()
+        
+        assert stream.get_date_range() == (1000000000, 10000000000)
+        
+        stream.shutdown()
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
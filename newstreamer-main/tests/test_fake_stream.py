@@ -1,5 +1,6 @@
 """测试模拟数据流"""
 
+import functools
 import pytest
 import time
 from newstreamer.streams.fake_stream import FakeMarketDataStream, FakeLiveDataStream
@@ -113,7 +114,7 @@ class TestFakeLiveDataStream:
         )
         
         assert stream.return_type == 'dict'
-        assert stream.callbacks == []
+        assert len(stream.callbacks) == 0
         assert not stream._is_running
     
     def test_subscribe_unsubscribe(self):
@@ -141,6 +142,40 @@ class TestFakeLiveDataStream:
         stream.remove_callback(callback)
         assert callback not in stream.callbacks
     
+    def test_partial_callback(self):
+        """测试没有 __name__ 的回调(functools.partial)可以添加、执行失败与移除"""
+        stream = FakeLiveDataStream()
+        
+        def failing(tag, data):
+            raise RuntimeError(tag)
+        
+        callback = functools.partial(failing, 'boom')
+        stream.add_callback(callback)
+        assert callback in stream.callbacks
+        
+        stream.on_market_data({'symbol': '000001'})
+        
+        stream.remove_callback(callback)
+        assert callback not in stream.callbacks
+    
+    def test_trusted_callbacks(self):
+        """测试回调异常处理：默认记录并继续，trusted_callbacks 时直接抛出"""
+        stream = FakeLiveDataStream()
+        received = []
+        
+        def failing(data):
+            raise RuntimeError("boom")
+        
+        stream.add_callback(failing)
+        stream.add_callback(received.append)
+        
+        stream.on_market_data({'symbol': '000001'})
+        assert received == [{'symbol': '000001'}]
+        
+        stream.trusted_callbacks = True
+        with pytest.raises(RuntimeError):
+            stream.on_market_data({'symbol': '000001'})
+    
     def test_start_streaming_dict_mode(self):
         """测试流式传输(字典模式)"""
         stream = FakeLiveDataStream(
@@ -227,6 +262,18 @@ class TestFakeLiveDataStream:
         assert '000001' in latest
         assert '600000' in latest
     
+    def test_batch_generation(self):
+        """测试批量生成：每轮为每只订阅股票各生成一条"""
+        stream = FakeLiveDataStream(seed=42)
+        stream.subscribe(['000001', '600000', '300750'])
+        
+        batch = stream._batch_gen.generate()
+        
+        assert [data['symbol'] for data in batch] == ['000001', '600000', '300750']
+        for data in batch:
+            assert data['price'] > 0
+            assert data['low'] <= data['price'] <= data['high']
+    
     def test_stop(self):
         """测试停止数据流"""
         stream = FakeLiveDataStream()
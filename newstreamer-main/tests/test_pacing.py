@@ -0,0 +1,35 @@
+"""测试回放节奏控制"""
+
+import time
+
+from newstreamer.utils.pacing import Pacer
+
+
+class TestPacer:
+    """处理耗时应计入间隔内，而不是叠加在间隔之上"""
+
+    def test_work_time_absorbed(self):
+        pacer = Pacer(0.02)
+        start = time.perf_counter()
+        for _ in range(10):
+            time.sleep(0.01)  # 模拟生成/回调耗时
+            pacer.wait()
+        elapsed = time.perf_counter() - start
+        assert 0.19 <= elapsed < 0.28
+
+    def test_missed_ticks_not_burst(self):
+        pacer = Pacer(0.02)
+        time.sleep(0.1)  # 一次长停顿错过约5个节拍
+        pacer.wait()
+        start = time.perf_counter()
+        for _ in range(3):
+            pacer.wait()
+        elapsed = time.perf_counter() - start
+        assert elapsed >= 0.055
+
+    def test_zero_interval_does_not_sleep(self):
+        pacer = Pacer(0.0)
+        start = time.perf_counter()
+        for _ in range(1000):
+            pacer.wait()
+        assert time.perf_counter() - start < 0.05